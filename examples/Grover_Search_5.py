@@ -59,6 +59,5 @@ c = qvantum.Circuit([l0, l1, l2, l3, l4, l5, l6, l7, l8])
 c.run(r)
 
 print(r.show())
-r.measure_nth_qubit(3)
-r.delete_qubit(3)
+r.delete_qubit(3, value=0)
 print(r.show())
@@ -39,8 +39,8 @@ l5 = qvantum.Layer([qvantum.Gate(), qvantum.Gate(), ZM1])
 c2 = qvantum.Circuit([l4, l5])
 c2.run(r)
 
-r.delete_qubit(0)
-r.delete_qubit(0)
+r.delete_qubit(0, value=m0)
+r.delete_qubit(0, value=m1)
 
 print(q.show())
 print(r.show())
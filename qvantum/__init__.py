@@ -1,4 +1,4 @@
-__all__ = ['Qubit', 'Random_Qubit', 'Register', 'Gate', 'Hadamard', 'SquareNot', 'PauliX', 'PauliY', 'PauliZ', 'Phase', 'Pi8', 'Swap', 'SquareSwap', 'CNOT', 'ControlledZ', 'ControlledPhase', 'Ising', 'Toffoli', 'Fredkin', 'Layer', 'Circuit', 'bloch_coords', 'bloch_qubit', 'bloch_sphere_plot', 'phase_test']
+__all__ = ['Qubit', 'Random_Qubit', 'Register', 'Gate', 'Hadamard', 'SquareNot', 'PauliX', 'PauliY', 'PauliZ', 'Phase', 'Pi8', 'Swap', 'SquareSwap', 'CNOT', 'ControlledZ', 'ControlledPhase', 'Ising', 'Rotation', 'RotationX', 'RotationY', 'RotationZ', 'Toffoli', 'Fredkin', 'Dagger', 'Layer', 'Circuit', 'CircuitBuilder', 'Parameter', 'DensityRegister', 'StabilizerRegister', 'MPSRegister', 'SparseRegister', 'ResultCache', 'Channel', 'Depolarizing', 'AmplitudeDamping', 'Dephasing', 'ReadoutError', 'NoiseModel', 'bloch_coords', 'bloch_qubit', 'bloch_sphere_plot', 'phase_test', 'BlochRenderer']
 from .qubit import Qubit
 from .qubit import Random_Qubit
 from .register import Register
@@ -16,11 +16,30 @@ from .gate import CNOT
 from .gate import ControlledZ
 from .gate import ControlledPhase
 from .gate import Ising
+from .gate import Rotation
+from .gate import RotationX
+from .gate import RotationY
+from .gate import RotationZ
 from .gate import Toffoli
 from .gate import Fredkin
+from .gate import Dagger
 from .layer import Layer
 from .circuit import Circuit
+from .builder import CircuitBuilder
+from .parameter import Parameter
+from .density import DensityRegister
+from .stabilizer import StabilizerRegister
+from .mps import MPSRegister
+from .sparse import SparseRegister
+from .cache import ResultCache
+from .noise import Channel
+from .noise import Depolarizing
+from .noise import AmplitudeDamping
+from .noise import Dephasing
+from .noise import ReadoutError
+from .noise import NoiseModel
 from .bloch import bloch_coords
 from .bloch import bloch_qubit
 from .bloch import bloch_sphere_plot
-from .bloch import phase_test
\ No newline at end of file
+from .bloch import phase_test
+from .bloch import BlochRenderer
\ No newline at end of file
@@ -22,11 +22,16 @@ The following functions are the Bloch Sphere related functions in the package:
 - bloch_qubit()       - calculate qubit from bloch coordinates
 - bloch_sphere_plot() - plot bloch representation
 - phase_test()        - compute phase between two complex numbers
+
+The BlochRenderer class keeps one figure with the sphere drawn on it and only redraws the
+vectors, so it can be used to write many frames (or a whole animation) without a display.
 '''
 
 # pylint: disable=E1127, W1401
 
 from . import check_bloch
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from matplotlib.patches import Circle, PathPatch
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
@@ -34,6 +39,20 @@ import mpl_toolkits.mplot3d.art3d as art3d
 import numpy
 from . import qubit
 
+_sphere_mesh_cache = []
+
+def _sphere_mesh():
+    """Returns the x, y, z coordinates of the 50x50 sphere mesh. The mesh is computed only once
+    and reused by every plot.
+    """
+
+    if not _sphere_mesh_cache:
+        a, b = numpy.mgrid[0:2 * numpy.pi:50j, 0:numpy.pi:50j]
+        _sphere_mesh_cache.append((numpy.cos(a) * numpy.sin(b), numpy.sin(a) * numpy.sin(b), \
+            numpy.cos(b)))
+
+    return _sphere_mesh_cache[0]
+
 @check_bloch.bloch_coords_check
 def bloch_coords(q):
     """This function calculates the coordinates of the Bloch representation from the state vector 
@@ -167,10 +186,7 @@ def bloch_sphere_plot(u, v, w, xfigsize=15, yfigsize=7.5, frame_on=False, tight_
     ax.set_aspect('equal')
     ax.set_axis_off()
 
-    a, b = numpy.mgrid[0:2 * numpy.pi:50j, 0:numpy.pi:50j]
-    x = numpy.cos(a) * numpy.sin(b)
-    y = numpy.sin(a) * numpy.sin(b)
-    z = numpy.cos(b)
+    x, y, z = _sphere_mesh()
 
     if surface_on is True:
         ax.plot_surface(x, y, z, cmap=surface_cmap, alpha=surface_alpha)
@@ -233,3 +249,263 @@ def phase_test(c1, c2):
         (numpy.sqrt(c1.real ** 2 + c1.imag ** 2) * numpy.sqrt(c2.real ** 2 + c2.imag ** 2))
 
     return phase
+
+class BlochRenderer(object):
+    """Bloch sphere renderer class
+
+    An instance of the renderer class draws the sphere, its wireframe, the axes and the three
+    circles once on an off-screen figure. Afterwards only the vectors (quivers) are replaced, so
+    producing a new frame costs as much as drawing a few arrows. The figure is attached to the
+    non-interactive Agg canvas, therefore no display is needed and plt.show() is never called.
+
+    The instances of the renderer class have the following methods:
+
+    - __init__()        - initialize renderer and draw the sphere
+    - get_figure()      - getter of the matplotlib figure
+    - get_vector_number() - getter of number of vectors currently drawn
+    - update()          - replace the vectors on the sphere
+    - save_frame()      - write the current figure into a file
+    - render_frames()   - write one file for every frame of a trajectory
+    - save_animation()  - write a trajectory as a video or gif
+    - close()           - release the figure
+    """
+
+    @check_bloch.bloch_renderer_init_check
+    def __init__(self, xfigsize=15, yfigsize=7.5, frame_on=False, tight_layout_on=False, \
+            style='dark_background', surface_on=True, wireframe_on=True, surface_cmap='Blues_r', \
+            surface_alpha=0.3, wireframe_color='#d3d3d3', wireframe_linewidth=0.075, \
+            quiver_color='#ffffff', quiver_linewidth=1.5, quiver_ratio=0.1, line_color='#d3d3d3', \
+            line_linewidth=0.3, circle_edgecolor='#d3d3d3', circle_facecolor='none', \
+            circle_linewidth=0.3):
+        """Method to initialize an instance of the renderer class. The keyword arguments are the
+        same as the ones of bloch_sphere_plot(). The quiver color can also be a list of colors,
+        in this case the n-th vector of a frame is drawn with the n-th color (cyclically).
+
+        Keyword Arguments:
+            xfigsize {int, float} -- X size of figure (default: {15})
+            yfigsize {int, float} -- Y size of figure (default: {7.5})
+            frame_on {bool} -- Frame (default: {False})
+            tight_layout_on {bool} -- Tight layout (default: {False})
+            style {str} -- Style (default: {'dark_background'})
+            surface_on {bool} -- Surface (default: {True})
+            wireframe_on {bool} -- Wireframe (default: {True})
+            surface_cmap {str} -- Surface cmap (default: {'Blues_r'})
+            surface_alpha {int, float} -- Surface alpha (default: {0.3})
+            wireframe_color {str} -- Wireframe color (default: {'#d3d3d3'})
+            wireframe_linewidth {int, float} -- Width of wireframe line (default: {0.075})
+            quiver_color {str, list} -- Quiver color(s) (default: {'#ffffff'})
+            quiver_linewidth {int, float} -- Width of quiver line (default: {1.5})
+            quiver_ratio {int, float} -- Quiver ratio (default: {0.1})
+            line_color {str} -- Line color (default: {'#d3d3d3'})
+            line_linewidth {int, float} -- Width of line (default: {0.3})
+            circle_edgecolor {str} -- Edge color of circle (default: {'#d3d3d3'})
+            circle_facecolor {str} -- Face color of circle (default: {'none'})
+            circle_linewidth {int, float} -- Width of circle line (default: {0.3})
+
+        Raises:
+            TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> br = qvantum.BlochRenderer()
+            >>> br.update([qvantum.bloch_coords(qvantum.Random_Qubit())])
+            >>> br.save_frame('frame.png')
+        """
+
+        if isinstance(quiver_color, str):
+            quiver_color = [quiver_color]
+
+        self.__quiver_color = list(quiver_color)
+        self.__quiver_linewidth = quiver_linewidth
+        self.__quiver_ratio = quiver_ratio
+        self.__quivers = []
+
+        with plt.style.context(style):
+            self.__figure = Figure(figsize=(xfigsize, yfigsize), frameon=frame_on, \
+                tight_layout=tight_layout_on)
+            FigureCanvasAgg(self.__figure)
+
+            ax = self.__figure.add_subplot(111, projection='3d')
+            ax.set_aspect('equal')
+            ax.set_axis_off()
+
+            x, y, z = _sphere_mesh()
+
+            if surface_on is True:
+                ax.plot_surface(x, y, z, cmap=surface_cmap, alpha=surface_alpha)
+
+            if wireframe_on is True:
+                ax.plot_wireframe(x, y, z, color=wireframe_color, linewidth=wireframe_linewidth)
+
+            ax.plot([1, -1], [0, 0], [0, 0], color=line_color, linewidth=line_linewidth)
+            ax.plot([0, 0], [1, -1], [0, 0], color=line_color, linewidth=line_linewidth)
+            ax.plot([0, 0], [0, 0], [-1, 1], color=line_color, linewidth=line_linewidth)
+
+            for zdir in ['x', 'z', 'y']:
+
+                circle = Circle((0, 0), 1, edgecolor=circle_edgecolor, \
+                    facecolor=circle_facecolor, linewidth=circle_linewidth)
+                ax.add_patch(circle)
+                art3d.pathpatch_2d_to_3d(circle, z=0, zdir=zdir)
+
+        self.__ax = ax
+
+    def get_figure(self):
+        """Method to return the matplotlib figure of the renderer.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> br = qvantum.BlochRenderer()
+            >>> br.get_figure()
+            <Figure size 1500x750 with 1 Axes>
+        """
+
+        return self.__figure
+
+    def get_vector_number(self):
+        """Method to return the number of vectors which are currently drawn on the sphere.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> br = qvantum.BlochRenderer()
+            >>> br.update([(0, 0, 1), (1, 0, 0)])
+            >>> br.get_vector_number()
+            2
+        """
+
+        return int(len(self.__quivers))
+
+    @check_bloch.bloch_renderer_update_check
+    def update(self, coords_list):
+        """Method to replace the vectors on the sphere. The sphere itself is not redrawn. The
+        argument is a list of Bloch coordinates (u, v, w) or a single triple.
+
+        Arguments:
+            coords_list {list, tuple} -- List of Bloch coordinates or one (u, v, w) triple
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> br = qvantum.BlochRenderer()
+            >>> br.update([(0, 0, 1), qvantum.bloch_coords(qvantum.Random_Qubit())])
+        """
+
+        for quiver in self.__quivers:
+
+            quiver.remove()
+
+        self.__quivers = []
+        for i in range(len(coords_list)):
+
+            u, v, w = coords_list[i]
+            self.__quivers.append(self.__ax.quiver(0, 0, 0, u, v, w, \
+                color=self.__quiver_color[i % len(self.__quiver_color)], \
+                linewidth=self.__quiver_linewidth, arrow_length_ratio=self.__quiver_ratio))
+
+    @check_bloch.bloch_renderer_save_frame_check
+    def save_frame(self, path, dpi=None):
+        """Method to write the current figure into a file. The format is determined by the
+        extension of the path (png, jpg, svg, pdf, ...).
+
+        Arguments:
+            path {str} -- Path of the output file
+
+        Keyword Arguments:
+            dpi {int, float, None} -- Resolution of the image (default: {None})
+
+        Raises:
+            TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> br = qvantum.BlochRenderer()
+            >>> br.update([(0, 0, 1)])
+            >>> br.save_frame('frame.png', dpi=50)
+        """
+
+        self.__figure.savefig(path, dpi=dpi, facecolor=self.__figure.get_facecolor())
+
+    @check_bloch.bloch_renderer_render_frames_check
+    def render_frames(self, trajectory, path_pattern, dpi=None):
+        """Method to write one file for every frame of a trajectory. Every frame of the
+        trajectory is a list of Bloch coordinates (or one triple), the path pattern must contain
+        a format field for the number of the frame. The list of written paths is returned.
+
+        Arguments:
+            trajectory {list} -- List of frames
+            path_pattern {str} -- Path of the files, e.g. 'frames/bloch_{0:05d}.png'
+
+        Keyword Arguments:
+            dpi {int, float, None} -- Resolution of the images (default: {None})
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> br = qvantum.BlochRenderer()
+            >>> br.render_frames([[(0, 0, 1)], [(1, 0, 0)]], 'bloch_{0:03d}.png')
+            ['bloch_000.png', 'bloch_001.png']
+        """
+
+        paths = []
+        for i in range(len(trajectory)):
+
+            self.update(trajectory[i])
+            paths.append(path_pattern.format(i))
+            self.save_frame(paths[-1], dpi)
+
+        return paths
+
+    @check_bloch.bloch_renderer_save_animation_check
+    def save_animation(self, trajectory, path, fps=25, writer=None, dpi=None):
+        """Method to write a trajectory as an animation (e.g. mp4 via ffmpeg or gif via
+        pillow). Only the vectors are redrawn between two frames.
+
+        Arguments:
+            trajectory {list} -- List of frames, every frame is a list of Bloch coordinates
+            path {str} -- Path of the output file
+
+        Keyword Arguments:
+            fps {int} -- Frames per second (default: {25})
+            writer {str, None} -- Name of the matplotlib movie writer, None means the default
+                one for the extension (default: {None})
+            dpi {int, float, None} -- Resolution of the frames (default: {None})
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> br = qvantum.BlochRenderer()
+            >>> br.save_animation([[(0, 0, 1)], [(1, 0, 0)]], 'bloch.gif', fps=2, writer='pillow')
+        """
+
+        from matplotlib import animation
+
+        ani = animation.FuncAnimation(self.__figure, lambda i: self.update(trajectory[i]), \
+            frames=len(trajectory), blit=False, repeat=False)
+        ani.save(path, writer=writer, fps=fps, dpi=dpi, \
+            savefig_kwargs={'facecolor': self.__figure.get_facecolor()})
+
+    def close(self):
+        """Method to release the figure of the renderer. The renderer can't be used afterwards.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> br = qvantum.BlochRenderer()
+            >>> br.close()
+        """
+
+        self.__quivers = []
+        self.__figure.clear()
@@ -0,0 +1,299 @@
+'''circuit builder class'''
+
+# pylint: disable=E1101, W1401
+
+from . import check_builder
+from . import circuit
+import collections
+from . import engine
+from . import gate
+from . import layer
+import numpy
+
+_KIND_CACHE_SIZE = 1024
+
+class CircuitBuilder(object):
+    """circuit builder class
+
+    An instance of circuit builder class builds a circuit from a flat sequence of gates on
+    explicit qubits, so the layers don't have to be written qubit by qubit with identity gates
+    on the idle qubits. Every gate is put into the earliest layer after the gates it depends on
+    (as soon as possible scheduling of the dependency graph), which gives the minimal number of
+    layers for the sequence. Diagonal gates (PauliZ, Phase, Pi8, ControlledZ, RotationZ, ...)
+    commute with each other, so a diagonal gate only has to follow the last non-diagonal gate on
+    its qubits and it can fill an earlier free slot: the first layer after that gate which is
+    free on all of its qubits. Every qubit keeps a pointer to its first such free layer, so the
+    scheduling takes linear time in the number of gates. Identity gates are skipped.
+
+    The gates of a layer act on neighbouring qubits, so a gate which is given on distant qubits
+    is moved next to each other by Swap gates, and they are moved back after the gate.
+
+    If a window is given, only the last window layers are kept open, the earlier ones are built
+    immediately. It bounds the memory of the scheduling of long gate sequences.
+
+    The instances of circuit builder class have the following methods:
+
+    - __init__()         - initialize circuit builder
+    - get_qubit_number() - getter of number of qubits
+    - get_depth()        - getter of number of layers
+    - add()              - add a gate on some qubits
+    - barrier()          - make the next gates follow every previous gate on some qubits
+    - build()            - build the circuit
+    """
+
+    @check_builder.builder_init_check
+    def __init__(self, qubit_number, window=None):
+        """Method to initialize a circuit builder for the given number of qubits.
+
+        Arguments:
+            qubit_number {int} -- Number of qubits of the circuit
+
+        Keyword Arguments:
+            window {int, None} -- Number of open layers, unlimited if None (default: {None})
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> b = qvantum.CircuitBuilder(3)
+            >>> b.add(qvantum.Hadamard(), 0)
+            >>> b.add(qvantum.CNOT(0, 1), 1)
+            >>> b.add(qvantum.PauliX(), 0)
+            >>> b.get_depth()
+            2
+        """
+
+        self.__qubit_number = qubit_number
+        self.__window = window
+        self.__frontier = [0] * qubit_number
+        self.__hole = [0] * qubit_number
+        self.__open = collections.deque()
+        self.__base = 0
+        self.__layers = []
+        self.__identity = gate.Gate()
+        self.__swap = gate.Swap()
+        self.__kinds = {}
+
+    def get_qubit_number(self):
+        """Method to return the number of qubits of the circuit.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.CircuitBuilder(3).get_qubit_number()
+            3
+        """
+
+        return self.__qubit_number
+
+    def get_depth(self):
+        """Method to return the number of layers of the circuit built so far.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> b = qvantum.CircuitBuilder(2)
+            >>> b.add(qvantum.Hadamard(), 0)
+            >>> b.add(qvantum.Hadamard(), 0)
+            >>> b.get_depth()
+            2
+        """
+
+        return self.__base + len(self.__open)
+
+    def __kind(self, g):
+        """Returns whether the gate is diagonal and whether it's an identity gate. The results
+        of the last gate objects are cached."""
+
+        if id(g) not in self.__kinds:
+            if len(self.__kinds) >= _KIND_CACHE_SIZE:
+                self.__kinds.clear()
+
+            if g.get_parameters():
+                kind = (isinstance(g, gate.Rotation) and g.get_axis() == 'Z', False)
+
+            else:
+                matrix = numpy.asarray(g.get_matrix())
+                diagonal = numpy.count_nonzero(matrix - numpy.diag(numpy.diag(matrix))) == 0
+                kind = (diagonal, diagonal and numpy.array_equal(matrix, \
+                    numpy.identity(len(matrix))))
+
+            self.__kinds[id(g)] = (g, kind)
+
+        return self.__kinds[id(g)][1]
+
+    def __close(self):
+        """Builds the oldest open layer, the free qubits get identity gates."""
+
+        slots = self.__open.popleft()
+        self.__base = self.__base + 1
+        gate_list = []
+        wire = 0
+        while wire < self.__qubit_number:
+
+            if slots[wire] is None:
+                gate_list.append(self.__identity)
+                wire = wire + 1
+
+            else:
+                gate_list.append(slots[wire])
+                wire = wire + engine.gate_width(slots[wire])
+
+        self.__layers.append(layer.Layer(gate_list))
+
+    def __first_hole(self, wire):
+        """Returns the first open layer after the last non-diagonal gate on the qubit which is
+        free on the qubit. The pointer of the qubit only moves forward."""
+
+        hole = max(self.__base, self.__hole[wire])
+        while hole - self.__base < len(self.__open) \
+            and self.__open[hole - self.__base][wire] is not None:
+
+            hole = hole + 1
+
+        self.__hole[wire] = hole
+        return hole
+
+    def __schedule(self, g, position):
+        """Puts the gate on the qubits position, ... into the earliest possible layer."""
+
+        wires = range(position, position + engine.gate_width(g))
+        index = max([self.__base] + [self.__frontier[wire] for wire in wires])
+        diagonal = self.__kind(g)[0]
+        if diagonal:
+            candidate = max(self.__first_hole(wire) for wire in wires)
+            if candidate < index and all(self.__open[candidate - self.__base][wire] is None \
+                for wire in wires):
+                index = candidate
+
+        while index - self.__base >= len(self.__open):
+
+            self.__open.append([None] * self.__qubit_number)
+
+        slots = self.__open[index - self.__base]
+        for wire in wires:
+
+            slots[wire] = False
+            self.__frontier[wire] = max(self.__frontier[wire], index + 1)
+            if not diagonal:
+                self.__hole[wire] = index + 1
+
+        slots[position] = g
+        while self.__window is not None and len(self.__open) > self.__window:
+
+            self.__close()
+
+    @check_builder.add_check
+    def add(self, g, qubits):
+        """Method to add a gate on the given qubits. If qubits is an integer, the gate acts on the
+        qubits qubits, qubits + 1, ... Otherwise it's the list of the qubits of the gate in the
+        order of the matrix of the gate; qubits which are not next to each other are moved next to
+        each other by Swap gates and they are moved back after the gate.
+
+        Arguments:
+            g {gate} -- The added gate
+            qubits {int, list} -- The first qubit or the list of the qubits of the gate
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> b = qvantum.CircuitBuilder(3)
+            >>> b.add(qvantum.CNOT(0, 1), [0, 2])
+            >>> b.get_depth()
+            3
+        """
+
+        if self.__kind(g)[1]:
+            return
+
+        if isinstance(qubits, int):
+            self.__schedule(g, qubits)
+            return
+
+        position = min(qubits)
+        places = dict((qubit, qubit) for qubit in qubits)
+        swaps = []
+        for i, qubit in enumerate(qubits):
+
+            while places[qubit] > position + i:
+
+                wire = places[qubit] - 1
+                self.__schedule(self.__swap, wire)
+                swaps.append(wire)
+                for other in qubits:
+
+                    if places[other] == wire:
+                        places[other] = wire + 1
+
+                places[qubit] = wire
+
+        self.__schedule(g, position)
+        for wire in reversed(swaps):
+
+            self.__schedule(self.__swap, wire)
+
+    @check_builder.barrier_check
+    def barrier(self, qubits=None):
+        """Method to make the next gates on the given qubits follow every previous gate on them,
+        even the diagonal ones.
+
+        Keyword Arguments:
+            qubits {list, None} -- List of the qubits, every qubit if None (default: {None})
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> b = qvantum.CircuitBuilder(2)
+            >>> b.add(qvantum.PauliZ(), 0)
+            >>> b.barrier()
+            >>> b.add(qvantum.PauliZ(), 1)
+            >>> b.get_depth()
+            2
+        """
+
+        if qubits is None:
+            qubits = range(self.__qubit_number)
+
+        index = max(self.__frontier[qubit] for qubit in qubits)
+        for qubit in qubits:
+
+            self.__frontier[qubit] = index
+            self.__hole[qubit] = max(self.__hole[qubit], index)
+
+    def build(self):
+        """Method to build the circuit from the added gates. The builder is emptied, so it can be
+        used for a new circuit. A circuit without gates has one layer of identity gates.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> b = qvantum.CircuitBuilder(3)
+            >>> b.add(qvantum.Hadamard(), 0)
+            >>> b.add(qvantum.CNOT(0, 1), 1)
+            >>> b.add(qvantum.PauliZ(), 2)
+            >>> c = b.build()
+            >>> [g.get_name() for g in c.get_nth_layer(0).get_gate_list().values()]
+            ['Hadamard', 'Controlled-Not']
+            >>> [g.get_name() for g in c.get_nth_layer(1).get_gate_list().values()]
+            ['Identity', 'Identity', 'Pauli-Z']
+        """
+
+        while self.__open:
+
+            self.__close()
+
+        layers = self.__layers or [layer.Layer([self.__identity] * self.__qubit_number)]
+        self.__layers = []
+        self.__base = 0
+        self.__frontier = [0] * self.__qubit_number
+        self.__hole = [0] * self.__qubit_number
+
+        return circuit.Circuit(layers)
@@ -0,0 +1,173 @@
+'''result cache class'''
+
+# pylint: disable=E1101, W1401
+
+from . import check_cache
+import collections
+import hashlib
+import numpy
+import threading
+
+class ResultCache(object):
+    """result cache class
+
+    An instance of result cache class stores the results of circuit runs. It's opt-in: it's used
+    by Circuit.run() and Circuit.unitary() when it's given as the cache argument. The key of a
+    result is the structural hash of the circuit (see Circuit.get_hash()) and the hash of the
+    input amplitudes, so running the same circuit on the same input again only copies the cached
+    output amplitudes.
+
+    The results are evicted in least recently used order when the stored amplitudes exceed the
+    memory budget (in bytes). Results larger than the budget are not stored. The cache can be
+    shared between threads.
+
+    The instances of result cache class have the following methods:
+
+    - __init__()         - initialize result cache
+    - get_max_bytes()    - getter of memory budget
+    - get_statistics()   - getter of hit, miss and eviction statistics
+    - get()              - look up a result
+    - put()              - store a result
+    - clear()            - remove every result and reset statistics
+    - key()              - key of a circuit and an input
+    """
+
+    @check_cache.cache_init_check
+    def __init__(self, max_bytes=2 ** 28):
+        """Method to initialize a result cache with the given memory budget.
+
+        Keyword Arguments:
+            max_bytes {int} -- Memory budget of the stored amplitudes in bytes (default: {2 ** 28})
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> cache = qvantum.ResultCache(2 ** 20)
+            >>> cache.get_max_bytes()
+            1048576
+        """
+
+        self.__max_bytes = max_bytes
+        self.__results = collections.OrderedDict()
+        self.__bytes = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__lock = threading.Lock()
+
+    def get_max_bytes(self):
+        """Method to return the memory budget of the cache in bytes.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.ResultCache(2 ** 20).get_max_bytes()
+            1048576
+        """
+
+        return self.__max_bytes
+
+    def get_statistics(self):
+        """Method to return the statistics of the cache: number of hits, misses and evictions,
+        number of stored results and their size in bytes.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> cache = qvantum.ResultCache()
+            >>> c = qvantum.Circuit([qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()])])
+            >>> c.run(qvantum.Register([qvantum.Qubit(1, 0), qvantum.Qubit(1, 0)]), cache)
+            >>> c.run(qvantum.Register([qvantum.Qubit(1, 0), qvantum.Qubit(1, 0)]), cache)
+            >>> cache.get_statistics()
+            {'hits': 1, 'misses': 1, 'evictions': 0, 'entries': 1, 'bytes': 64}
+        """
+
+        with self.__lock:
+            return {'hits': self.__hits, 'misses': self.__misses, \
+                'evictions': self.__evictions, 'entries': len(self.__results), \
+                'bytes': self.__bytes}
+
+    def get(self, key):
+        """Method to return the cached result of the key or None. The result is a read-only
+        array, it must be copied before it's changed.
+
+        Arguments:
+            key {tuple} -- The key of the result (see key())
+        """
+
+        with self.__lock:
+            result = self.__results.pop(key, None)
+            if result is None:
+                self.__misses = self.__misses + 1
+                return None
+
+            self.__results[key] = result
+            self.__hits = self.__hits + 1
+            return result
+
+    def put(self, key, vector):
+        """Method to store a copy of the result of the key. A read-only complex array which owns
+        its data is stored without copying. The least recently used results are evicted until
+        the results fit the memory budget.
+
+        Arguments:
+            key {tuple} -- The key of the result (see key())
+            vector {numpy.ndarray} -- The output amplitudes
+        """
+
+        if vector.nbytes > self.__max_bytes:
+            return
+
+        if vector.dtype == complex and vector.base is None and not vector.flags.writeable:
+            result = vector
+
+        else:
+            result = numpy.array(vector, dtype=complex)
+            result.flags.writeable = False
+
+        with self.__lock:
+            if key in self.__results:
+                self.__bytes = self.__bytes - self.__results.pop(key).nbytes
+
+            self.__results[key] = result
+            self.__bytes = self.__bytes + result.nbytes
+            while self.__bytes > self.__max_bytes:
+
+                evicted = self.__results.popitem(last=False)[1]
+                self.__bytes = self.__bytes - evicted.nbytes
+                self.__evictions = self.__evictions + 1
+
+    def clear(self):
+        """Method to remove every result from the cache and reset the statistics.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> cache = qvantum.ResultCache()
+            >>> cache.clear()
+            >>> cache.get_statistics()
+            {'hits': 0, 'misses': 0, 'evictions': 0, 'entries': 0, 'bytes': 0}
+        """
+
+        with self.__lock:
+            self.__results.clear()
+            self.__bytes = 0
+            self.__hits = 0
+            self.__misses = 0
+            self.__evictions = 0
+
+    @staticmethod
+    def key(c, vector):
+        """Method to return the key of a circuit and input amplitudes: the structural hash of
+        the circuit and the SHA-1 digest of the amplitudes.
+
+        Arguments:
+            c {Circuit} -- The circuit
+            vector {numpy.ndarray} -- The input amplitudes
+        """
+
+        digest = hashlib.sha1(numpy.ascontiguousarray(vector, dtype=complex).data).hexdigest()
+        return c.get_hash(), digest
@@ -194,3 +194,197 @@ def phase_test_check(function):
             raise TypeError('Invalid input! c1 and c2 must be complex.')
     
     return wrapper
+
+def _bloch_vector_list(coords_list):
+    """Returns the argument as a list of Bloch coordinates. A single (u, v, w) triple is wrapped
+    into a list. Raises TypeError or ValueError when the coordinates are not valid.
+
+    Arguments:
+        coords_list {list, tuple} -- List of Bloch coordinates or one (u, v, w) triple
+    """
+
+    if isinstance(coords_list, (list, tuple)) and len(coords_list) == 3 \
+        and all(isinstance(elem, (int, float)) for elem in coords_list):
+        coords_list = [coords_list]
+
+    if isinstance(coords_list, (list, tuple)) \
+        and all(isinstance(coords, (list, tuple)) and len(coords) == 3 \
+        and all(isinstance(elem, (int, float)) for elem in coords) for coords in coords_list):
+        if all(round(coords[0] ** 2 + coords[1] ** 2 + coords[2] ** 2 - 1, 10) <= 0 \
+            for coords in coords_list):
+            return list(coords_list)
+
+        else:
+            raise ValueError('Invalid input! u, v and w must satisfy: ' +\
+                'u² + v² + w² ≤ 1.')
+
+    else:
+        raise TypeError('Invalid input! Argument must be a list of (u, v, w) triples of ' +\
+            'integer or float.')
+
+def bloch_renderer_init_check(function):
+    """Decorator to check the arguments of initialization function in Bloch renderer class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, xfigsize=15, yfigsize=7.5, frame_on=False, tight_layout_on=False, \
+            style='dark_background', surface_on=True, wireframe_on=True, surface_cmap='Blues_r', \
+            surface_alpha=0.3, wireframe_color='#d3d3d3', wireframe_linewidth=0.075, \
+            quiver_color='#ffffff', quiver_linewidth=1.5, quiver_ratio=0.1, line_color='#d3d3d3', \
+            line_linewidth=0.3, circle_edgecolor='#d3d3d3', circle_facecolor='none', \
+            circle_linewidth=0.3):
+        """Method to initialize an instance of the renderer class. The keyword arguments are the
+        same as the ones of bloch_sphere_plot(). The quiver color can also be a list of colors.
+
+        Raises:
+            TypeError
+        """
+
+        if isinstance(quiver_color, str) or (isinstance(quiver_color, list) \
+            and len(quiver_color) > 0 and all(isinstance(elem, str) for elem in quiver_color)):
+            if all(isinstance(elem, (int, float)) for elem in [xfigsize, yfigsize, \
+                surface_alpha, wireframe_linewidth, quiver_linewidth, quiver_ratio, \
+                line_linewidth, circle_linewidth]):
+                return function(self, xfigsize, yfigsize, frame_on, tight_layout_on, style, \
+                    surface_on, wireframe_on, surface_cmap, surface_alpha, wireframe_color, \
+                    wireframe_linewidth, quiver_color, quiver_linewidth, quiver_ratio, \
+                    line_color, line_linewidth, circle_edgecolor, circle_facecolor, \
+                    circle_linewidth)
+
+            else:
+                raise TypeError('Invalid input! Sizes, widths, alpha and ratio must be integer ' +\
+                    'or float.')
+
+        else:
+            raise TypeError('Invalid input! Quiver color must be string or a non-empty list of ' +\
+                'strings.')
+
+    return wrapper
+
+def bloch_renderer_update_check(function):
+    """Decorator to check the arguments of updating vectors function in Bloch renderer class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, coords_list):
+        """Method to replace the vectors on the sphere. The sphere itself is not redrawn. The
+        argument is a list of Bloch coordinates (u, v, w) or a single triple.
+
+        Arguments:
+            coords_list {list, tuple} -- List of Bloch coordinates or one (u, v, w) triple
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        return function(self, _bloch_vector_list(coords_list))
+
+    return wrapper
+
+def bloch_renderer_save_frame_check(function):
+    """Decorator to check the arguments of saving frame function in Bloch renderer class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, path, dpi=None):
+        """Method to write the current figure into a file.
+
+        Arguments:
+            path {str} -- Path of the output file
+
+        Keyword Arguments:
+            dpi {int, float, None} -- Resolution of the image (default: {None})
+
+        Raises:
+            TypeError
+        """
+
+        if isinstance(path, str) and (dpi is None or isinstance(dpi, (int, float))):
+            return function(self, path, dpi)
+
+        else:
+            raise TypeError('Invalid input! Path must be string and dpi must be integer, ' +\
+                'float or None.')
+
+    return wrapper
+
+def bloch_renderer_render_frames_check(function):
+    """Decorator to check the arguments of rendering frames function in Bloch renderer class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, trajectory, path_pattern, dpi=None):
+        """Method to write one file for every frame of a trajectory.
+
+        Arguments:
+            trajectory {list} -- List of frames
+            path_pattern {str} -- Path of the files, e.g. 'frames/bloch_{0:05d}.png'
+
+        Keyword Arguments:
+            dpi {int, float, None} -- Resolution of the images (default: {None})
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if isinstance(trajectory, (list, tuple)) and isinstance(path_pattern, str):
+            if '{' in path_pattern:
+                return function(self, [_bloch_vector_list(frame) for frame in trajectory], \
+                    path_pattern, dpi)
+
+            else:
+                raise ValueError('Invalid input! Path pattern must contain a format field for ' +\
+                    'the number of the frame.')
+
+        else:
+            raise TypeError('Invalid input! Trajectory must be a list of frames and path ' +\
+                'pattern must be string.')
+
+    return wrapper
+
+def bloch_renderer_save_animation_check(function):
+    """Decorator to check the arguments of saving animation function in Bloch renderer class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, trajectory, path, fps=25, writer=None, dpi=None):
+        """Method to write a trajectory as an animation.
+
+        Arguments:
+            trajectory {list} -- List of frames, every frame is a list of Bloch coordinates
+            path {str} -- Path of the output file
+
+        Keyword Arguments:
+            fps {int} -- Frames per second (default: {25})
+            writer {str, None} -- Name of the matplotlib movie writer (default: {None})
+            dpi {int, float, None} -- Resolution of the frames (default: {None})
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if isinstance(trajectory, (list, tuple)) and isinstance(path, str) \
+            and isinstance(fps, int) and (writer is None or isinstance(writer, str)):
+            if len(trajectory) > 0 and fps > 0:
+                return function(self, [_bloch_vector_list(frame) for frame in trajectory], \
+                    path, fps, writer, dpi)
+
+            else:
+                raise ValueError('Invalid input! Trajectory must not be empty and fps must be ' +\
+                    'greater than 0.')
+
+        else:
+            raise TypeError('Invalid input! Trajectory must be a list of frames, path must be ' +\
+                'string, fps must be integer and writer must be string or None.')
+
+    return wrapper
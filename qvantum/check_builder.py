@@ -0,0 +1,120 @@
+'''checking functions for circuit builder class'''
+
+# pylint: disable=E1101, W1401
+
+from . import engine
+from . import gate
+
+def builder_init_check(function):
+    """Decorator to check the arguments of initialization function in circuit builder class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, qubit_number, window=None):
+        """Method to initialize a circuit builder for the given number of qubits.
+
+        Arguments:
+            qubit_number {int} -- Number of qubits of the circuit
+
+        Keyword Arguments:
+            window {int, None} -- Number of open layers, unlimited if None (default: {None})
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not isinstance(qubit_number, int) or isinstance(qubit_number, bool):
+            raise TypeError('Invalid input! Number of qubits must be integer.')
+
+        if qubit_number < 1:
+            raise ValueError('Invalid input! Number of qubits must be positive.')
+
+        if window is not None and (not isinstance(window, int) or isinstance(window, bool)):
+            raise TypeError('Invalid input! Window must be integer or None.')
+
+        if window is not None and window < 1:
+            raise ValueError('Invalid input! Window must be positive.')
+
+        return function(self, qubit_number, window)
+
+    return wrapper
+
+def add_check(function):
+    """Decorator to check the arguments of adding gate function in circuit builder class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, g, qubits):
+        """Method to add a gate on the given qubits.
+
+        Arguments:
+            g {gate} -- The added gate
+            qubits {int, list} -- The first qubit or the list of the qubits of the gate
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not isinstance(g, gate.Gate):
+            raise TypeError('Invalid input! Argument must be a gate object.')
+
+        width = engine.gate_width(g)
+        if isinstance(qubits, int) and not isinstance(qubits, bool):
+            if qubits >= 0 and qubits + width <= self.get_qubit_number():
+                return function(self, g, qubits)
+
+            raise ValueError('Invalid input! The gate doesn\'t fit the circuit from the ' + \
+                'given qubit.')
+
+        if not (isinstance(qubits, list) and all(isinstance(qubit, int) \
+            and not isinstance(qubit, bool) for qubit in qubits)):
+            raise TypeError('Invalid input! Qubits must be integer or a list of integers.')
+
+        if len(qubits) != width or len(set(qubits)) != width:
+            raise ValueError('Invalid input! The gate needs ' + str(width) + ' different qubits.')
+
+        if all(qubit >= 0 and qubit < self.get_qubit_number() for qubit in qubits):
+            return function(self, g, qubits)
+
+        else:
+            raise ValueError('Invalid input! Qubits must be greater or equal to 0 and less ' + \
+                'than ' + str(self.get_qubit_number()) + '.')
+
+    return wrapper
+
+def barrier_check(function):
+    """Decorator to check the arguments of barrier function in circuit builder class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, qubits=None):
+        """Method to make the next gates on the given qubits follow every previous gate on them.
+
+        Keyword Arguments:
+            qubits {list, None} -- List of the qubits, every qubit if None (default: {None})
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if qubits is None:
+            return function(self, qubits)
+
+        if not (isinstance(qubits, list) and all(isinstance(qubit, int) \
+            and not isinstance(qubit, bool) for qubit in qubits)):
+            raise TypeError('Invalid input! Qubits must be a list of integers or None.')
+
+        if qubits and all(qubit >= 0 and qubit < self.get_qubit_number() for qubit in qubits):
+            return function(self, qubits)
+
+        else:
+            raise ValueError('Invalid input! Qubits must be greater or equal to 0 and less ' + \
+                'than ' + str(self.get_qubit_number()) + '.')
+
+    return wrapper
@@ -0,0 +1,31 @@
+'''checking functions for result cache class'''
+
+# pylint: disable=E1101, W1401
+
+def cache_init_check(function):
+    """Decorator to check the arguments of initialization function in result cache class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, max_bytes=2 ** 28):
+        """Method to initialize a result cache with the given memory budget.
+
+        Keyword Arguments:
+            max_bytes {int} -- Memory budget of the stored amplitudes in bytes (default: {2 ** 28})
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not isinstance(max_bytes, int) or isinstance(max_bytes, bool):
+            raise TypeError('Invalid input! Memory budget must be integer.')
+
+        if max_bytes > 0:
+            return function(self, max_bytes)
+
+        else:
+            raise ValueError('Invalid input! Memory budget must be positive.')
+
+    return wrapper
@@ -2,8 +2,17 @@
 
 # pylint: disable=E1101, W1401
 
+from . import cache as cache_module
+from . import check_parameter
+from . import check_register
+from . import density
 from . import layer
+from . import mps
+from . import noise
+from . import parameter
 from . import register
+from . import sparse
+from . import stabilizer
 
 def circuit_init_check(function):
     """Decorator to check the arguments of initialization function in circuit class.
@@ -168,14 +177,19 @@ def run_check(function):
         function {} -- The tested function
     """
 
-    def wrapper(self, r):
+    def wrapper(self, r, cache=None, observed=None):
         """Method to perform the computational process on a Register object as input and returns 
         the result. The size of the Register object and the size of the Circuit object must be 
-        equal.
+        equal. The cache and the observed qubits can't be given together.
         
         Arguments:
             r {register} -- Register which the circuit is applied on
         
+        Keyword Arguments:
+            cache {ResultCache, None} -- Result cache of Register runs (default: {None})
+            observed {list, None} -- Indices of the observed qubits, every qubit if None 
+                (default: {None})
+        
         Raises:
             ValueError, TypeError
         
@@ -195,10 +209,388 @@ def run_check(function):
             '|Ψ> = (-0.4342+0.1693i)|00> + (-0.2054-0.1873i)|01> + (-0.8198+0.0938i)|10> + (-0.1392-0.0727i)|11>'
         """
 
-        if isinstance(r, register.Register):
+        if not isinstance(r, (register.Register, density.DensityRegister, \
+            stabilizer.StabilizerRegister, mps.MPSRegister, sparse.SparseRegister)):
+            raise TypeError('Invalid input! Argument must be a register object.')
+
+        if not (cache is None or (isinstance(cache, cache_module.ResultCache) \
+            and isinstance(r, register.Register))):
+            raise TypeError('Invalid input! Cache must be a result cache object and can be ' + \
+                'used only with Register objects.')
+
+        if observed is None:
+            return function(self, r, cache, observed)
+
+        if not (isinstance(observed, list) and all(isinstance(qubit, int) \
+            and not isinstance(qubit, bool) for qubit in observed)):
+            raise TypeError('Invalid input! Observed qubits must be a list of integers or None.')
+
+        if cache is not None:
+            raise ValueError('Invalid input! Cache can\'t be used with observed qubits.')
+
+        if observed and all(qubit >= 0 and qubit < self.get_circuit_size() \
+            for qubit in observed):
+            return function(self, r, cache, observed)
+
+        else:
+            raise ValueError('Invalid input! Observed qubits must be greater or equal to 0 and ' + \
+                'less than ' + str(self.get_circuit_size()) + '.')
+    
+    return wrapper
+
+def run_async_check(function):
+    """Decorator to check the arguments of asynchronous running function in circuit class.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, r, executor=None):
+        """Method to run the circuit on a Register object in an executor without blocking the 
+        asyncio event loop. It returns an asyncio future, when it's done the register contains 
+        the result (the result of the future is the output amplitudes). It must be called from 
+        the thread of the event loop.
+        
+        Arguments:
+            r {Register} -- Register which the circuit is applied on
+        
+        Keyword Arguments:
+            executor {Executor, None} -- Thread or process executor, the default executor of 
+                the event loop if None (default: {None})
+        
+        Raises:
+            ValueError, TypeError, RuntimeError
+        """
+
+        from concurrent import futures
+
+        if not isinstance(r, register.Register):
+            raise TypeError('Invalid input! Argument must be a Register object.')
+
+        if executor is None or isinstance(executor, futures.Executor):
+            return function(self, r, executor)
+
+        else:
+            raise TypeError('Invalid input! Executor must be a concurrent.futures executor ' + \
+                'or None.')
+    
+    return wrapper
+
+def uncompute_check(function):
+    """Decorator to check the arguments of uncomputing function in circuit class.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, r):
+        """Method to run the inverse of the circuit on the register, i.e. to undo a previous run 
+        of the circuit. The inverse operations are applied on the amplitudes of the register 
+        directly, the inverse circuit is not built.
+        
+        Arguments:
+            r {register} -- Register which the inverse circuit is applied on
+        
+        Raises:
+            ValueError, TypeError
+        """
+
+        if isinstance(r, (register.Register, density.DensityRegister, \
+            stabilizer.StabilizerRegister, mps.MPSRegister, sparse.SparseRegister)):
             return function(self, r)
         
         else:
             raise TypeError('Invalid input! Argument must be a register object.')
     
     return wrapper
+
+def bind_check(function):
+    """Decorator to check the arguments of parameter binding function in circuit class.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, values):
+        """Method to bind values to the symbolic parameters of the circuit.
+        
+        Arguments:
+            values {dict} -- Dictionary of parameters (or parameter names) and values
+        
+        Raises:
+            TypeError
+        """
+
+        check_parameter.check_values(values)
+        return function(self, values)
+
+    return wrapper
+
+def run_sweep_check(function):
+    """Decorator to check the arguments of parameter sweep function in circuit class.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, r, param_grid, observable=None, batch_size=None):
+        """Method to run the circuit on the register for many parameter bindings in batched 
+        passes.
+        
+        Arguments:
+            r {register} -- Register which the circuit is applied on
+            param_grid {dict, list} -- Grid of parameter values or list of bindings
+        
+        Keyword Arguments:
+            observable {str, dict, None} -- Pauli string or weighted sum of them (default: {None})
+            batch_size {int, None} -- Maximal number of bindings in one pass (default: {None})
+        
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not isinstance(r, register.Register):
+            raise TypeError('Invalid input! Argument must be a register object.')
+
+        if isinstance(param_grid, dict):
+            check_parameter.check_values(dict((key, 0) for key in param_grid))
+            if not all(isinstance(values, (list, tuple)) \
+                and all(isinstance(value, (int, float)) for value in values) \
+                for values in param_grid.values()):
+                raise TypeError('Invalid input! Parameter grid must contain lists of integer ' +\
+                    'or float values.')
+
+        elif isinstance(param_grid, list):
+            for values in param_grid:
+
+                check_parameter.check_values(values)
+
+        else:
+            raise TypeError('Invalid input! Parameter grid must be a dictionary of lists or a ' +\
+                'list of dictionaries.')
+
+        if observable is not None:
+            check_register.check_observable(observable, r.get_qubit_number())
+
+        if batch_size is not None and not (isinstance(batch_size, int) and batch_size > 0):
+            raise ValueError('Invalid input! Batch size must be a positive integer or None.')
+
+        if r.get_qubit_number() == self.get_circuit_size():
+            return function(self, r, param_grid, observable, batch_size)
+
+        else:
+            raise ValueError('Invalid input! Register must have the same size as the layers.')
+
+    return wrapper
+
+def gradient_check(function):
+    """Decorator to check the arguments of gradient function in circuit class.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, r, observable, values, method='adjoint'):
+        """Method to compute the gradient of the expectation value of an observable with 
+        respect to the symbolic parameters of the circuit.
+        
+        Arguments:
+            r {register} -- Register which the circuit is applied on
+            observable {str, dict} -- Pauli string or weighted sum of them
+            values {dict} -- Dictionary of parameters (or parameter names) and values
+        
+        Keyword Arguments:
+            method {str} -- 'adjoint' or 'parameter-shift' (default: {'adjoint'})
+        
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not isinstance(r, register.Register):
+            raise TypeError('Invalid input! Argument must be a register object.')
+
+        check_register.check_observable(observable, r.get_qubit_number())
+        check_parameter.check_values(values)
+        names = [parameter.parameter_name(key) for key in values]
+        for p in self.get_parameters():
+
+            if p.get_name() not in names:
+                raise ValueError('Invalid input! Missing value of ' + repr(p) + '.')
+
+        if method not in ['adjoint', 'parameter-shift']:
+            raise ValueError('Invalid input! Method must be \'adjoint\' or ' +\
+                '\'parameter-shift\'.')
+
+        if r.get_qubit_number() == self.get_circuit_size():
+            return function(self, r, observable, values, method)
+
+        else:
+            raise ValueError('Invalid input! Register must have the same size as the layers.')
+
+    return wrapper
+
+def compute_uncompute_check(function):
+    """Decorator to check the arguments of compute-uncompute function in circuit class.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, r, action):
+        """Method to run the circuit on the register (compute), then the action, then the 
+        inverse of the circuit (uncompute).
+        
+        Arguments:
+            r {register} -- Register which the circuits are applied on
+            action {Circuit, function} -- Circuit or function called on the register
+        
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not isinstance(r, (register.Register, density.DensityRegister, \
+            stabilizer.StabilizerRegister, mps.MPSRegister, sparse.SparseRegister)):
+            raise TypeError('Invalid input! Argument must be a register object.')
+
+        if not (isinstance(action, type(self)) or callable(action)):
+            raise TypeError('Invalid input! Action must be a circuit object or a function.')
+
+        if r.get_qubit_number() == self.get_circuit_size():
+            return function(self, r, action)
+
+        else:
+            raise ValueError('Invalid input! Register must have the same size as the layers.')
+
+    return wrapper
+
+def unitary_check(function):
+    """Decorator to check the arguments of unitary function in circuit class.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, block=None, workers=None, cache=None):
+        """Method to return the unitary matrix of the circuit.
+        
+        Keyword Arguments:
+            block {int, None} -- Number of columns in one block, as many as fit 2^20 amplitudes 
+                if None (default: {None})
+            workers {int, None} -- Number of threads, no threads if None (default: {None})
+            cache {ResultCache, None} -- Result cache of unitary matrices (default: {None})
+        
+        Raises:
+            ValueError, TypeError
+        """
+
+        for arg in [block, workers]:
+
+            if arg is not None and not isinstance(arg, int):
+                raise TypeError('Invalid input! Block and workers must be integers or None.')
+
+            if arg is not None and arg < 1:
+                raise ValueError('Invalid input! Block and workers must be positive.')
+
+        if cache is None or isinstance(cache, cache_module.ResultCache):
+            return function(self, block, workers, cache)
+
+        else:
+            raise TypeError('Invalid input! Cache must be a result cache object or None.')
+
+    return wrapper
+
+def run_noisy_check(function):
+    """Decorator to check the arguments of noisy run function in circuit class.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, r, noise_model, trajectories=100, observable=None):
+        """Method to simulate the circuit with noise by quantum trajectories.
+        
+        Arguments:
+            r {register} -- Register which the circuit is applied on
+            noise_model {NoiseModel} -- The noise model
+        
+        Keyword Arguments:
+            trajectories {int} -- Number of trajectories (default: {100})
+            observable {str, dict, None} -- Pauli string or weighted sum of them (default: {None})
+        
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not isinstance(r, register.Register):
+            raise TypeError('Invalid input! Argument must be a register object.')
+
+        if not isinstance(noise_model, noise.NoiseModel):
+            raise TypeError('Invalid input! Noise model must be a noise model object.')
+
+        if not (isinstance(trajectories, int) and trajectories > 0):
+            raise ValueError('Invalid input! Number of trajectories must be a positive integer.')
+
+        if observable is not None:
+            check_register.check_observable(observable, r.get_qubit_number())
+
+        if r.get_qubit_number() == self.get_circuit_size():
+            return function(self, r, noise_model, trajectories, observable)
+
+        else:
+            raise ValueError('Invalid input! Register must have the same size as the layers.')
+
+    return wrapper
+
+def from_qasm_check(function):
+    """Decorator to check the arguments of reading OpenQASM program function.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(source):
+        """Method to read a circuit from an OpenQASM 2 or OpenQASM 3 program.
+        
+        Arguments:
+            source {str, file} -- The program or a file object of the program
+        
+        Raises:
+            ValueError, TypeError
+        """
+
+        if isinstance(source, str) or hasattr(source, '__iter__'):
+            return function(source)
+
+        else:
+            raise TypeError('Invalid input! Argument must be a string or a file object.')
+
+    return wrapper
+
+def to_qasm_check(function):
+    """Decorator to check the arguments of writing OpenQASM program function.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, stream=None, version=2):
+        """Method to write the circuit as an OpenQASM 2 or OpenQASM 3 program.
+        
+        Keyword Arguments:
+            stream {file, None} -- File object which the program is written into (default: {None})
+            version {int} -- Version of OpenQASM: 2 or 3 (default: {2})
+        
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not (stream is None or hasattr(stream, 'write')):
+            raise TypeError('Invalid input! Stream must be a file object or None.')
+
+        if version in (2, 3) and not isinstance(version, bool):
+            return function(self, stream, version)
+
+        else:
+            raise ValueError('Invalid input! Version must be 2 or 3.')
+
+    return wrapper
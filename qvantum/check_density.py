@@ -0,0 +1,239 @@
+'''checking functions for density register class'''
+
+# pylint: disable=E1101, W1401
+
+from . import check_register
+from . import gate
+import numpy
+from . import qubit
+from . import register
+
+def density_init_check(function):
+    """Decorator to check the arguments of initialization function in density register class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, state):
+        """Method to initialize an instance of the density register class. The input is a
+        register, whose pure state is used, or a list of elements in Qubit or Random_Qubit class.
+
+        Arguments:
+            state {register, list} -- Register or list of objects from Qubit or Random_Qubit class
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if isinstance(state, register.Register):
+            return function(self, state)
+
+        elif isinstance(state, list) \
+            and all(isinstance(elem, (qubit.Qubit, qubit.Random_Qubit)) for elem in state):
+            if len(state) >= 1:
+                return function(self, state)
+
+            else:
+                raise ValueError('Invalid input! Qubit list must contain at least 1 qubit ' +\
+                    'object.')
+
+        else:
+            raise TypeError('Invalid input! Argument must be a register or a list of qubit ' +\
+                'objects.')
+
+    return wrapper
+
+def set_matrix_check(function):
+    """Decorator to check the arguments of setting density matrix function.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, matrix):
+        """Method to replace the density matrix.
+
+        Arguments:
+            matrix {numpy.ndarray} -- The new density matrix
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not (isinstance(matrix, numpy.ndarray) and numpy.issubdtype(matrix.dtype, numpy.number)):
+            raise TypeError('Invalid input! Argument must be a numeric numpy array.')
+
+        size = self.get_state_number()
+        if matrix.shape != (size, size):
+            raise ValueError('Invalid input! Density matrix must be ' + str(size) + 'x' + \
+                str(size) + ' sized.')
+
+        if not numpy.allclose(matrix, numpy.conjugate(matrix).T):
+            raise ValueError('Invalid input! Density matrix must be Hermitian.')
+
+        if round(numpy.trace(matrix).real, 10) != 1:
+            raise ValueError('Invalid input! Trace of density matrix must be 1.')
+
+        return function(self, matrix)
+
+    return wrapper
+
+def _check_position(self, size, position):
+    """Raises TypeError or ValueError if the position is not an integer or the 2^k x 2^k sized
+    operator doesn't fit the density register from the position.
+
+    Arguments:
+        self {DensityRegister} -- The density register
+        size {int} -- Size of the operator
+        position {int} -- Index of the first qubit which the operator acts on
+    """
+
+    if not isinstance(position, int):
+        raise TypeError('Invalid input! Position must be integer.')
+
+    width = int(size).bit_length() - 1
+    if position < 0 or position + width > self.get_qubit_number():
+        raise ValueError('Invalid input! The operator doesn\'t fit the register from the ' +\
+            'given position.')
+
+def apply_gate_check(function):
+    """Decorator to check the arguments of applying gate function in density register class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, g, position):
+        """Method to apply a gate on some qubits of the density register.
+
+        Arguments:
+            g {gate} -- The applied gate
+            position {int} -- Index of the first qubit which the gate acts on
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not isinstance(g, gate.Gate):
+            raise TypeError('Invalid input! Argument must be a gate object.')
+
+        _check_position(self, g.get_size(), position)
+        return function(self, g, position)
+
+    return wrapper
+
+def apply_channel_check(function):
+    """Decorator to check the arguments of applying channel function in density register class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, kraus_list, position):
+        """Method to apply a quantum channel given by its Kraus operators on some qubits of the
+        density register.
+
+        Arguments:
+            kraus_list {list} -- List of Kraus operators (numpy arrays or matrices)
+            position {int} -- Index of the first qubit which the channel acts on
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not (isinstance(kraus_list, list) and len(kraus_list) > 0 \
+            and all(isinstance(kraus, numpy.ndarray) for kraus in kraus_list)):
+            raise TypeError('Invalid input! Argument must be a non-empty list of numpy arrays.')
+
+        size = kraus_list[0].shape[0]
+        if not all(kraus.shape == (size, size) for kraus in kraus_list) \
+            or size & (size - 1) or size < 2:
+            raise ValueError('Invalid input! Kraus operators must be 2^k x 2^k sized.')
+
+        completeness = sum(numpy.dot(numpy.conjugate(kraus).T, kraus) for kraus in kraus_list)
+        if not numpy.allclose(completeness, numpy.identity(size)):
+            raise ValueError('Invalid input! Kraus operators must satisfy Σ K†K = I.')
+
+        _check_position(self, size, position)
+        return function(self, kraus_list, position)
+
+    return wrapper
+
+def expectation_check(function):
+    """Decorator to check the arguments of expectation value function in density register class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, observable):
+        """Method to return the expectation value of an observable which is a Pauli string or a
+        weighted sum of Pauli strings.
+
+        Arguments:
+            observable {str, dict} -- Pauli string or dictionary of Pauli strings and weights
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        check_register.check_observable(observable, self.get_qubit_number())
+        return function(self, observable)
+
+    return wrapper
+
+def nth_check(function):
+    """Decorator to check the qubit index argument of functions in density register class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, nth):
+        """Method which uses the n-th qubit of the density register.
+
+        Arguments:
+            nth {int} -- Number of n-th qubit
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not isinstance(nth, int):
+            raise TypeError('Invalid input! Argument must be integer.')
+
+        if nth >= 0 and nth <= self.get_qubit_number() - 1:
+            return function(self, nth)
+
+        else:
+            raise ValueError('Invalid input! Argument must be greater or equal to 0 and ' +\
+                'less or equal to ' + str(self.get_qubit_number() - 1) + '.')
+
+    return wrapper
+
+def delete_qubit_check(function):
+    """Decorator to check the arguments of deleting qubit function in density register class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    @nth_check
+    def wrapper(self, nth):
+        """Method to discard the n-th qubit of the density register.
+
+        Arguments:
+            nth {int} -- Number of n-th qubit
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if self.get_qubit_number() > 1:
+            return function(self, nth)
+
+        else:
+            raise ValueError('Invalid input! The last qubit can\'t be deleted.')
+
+    return wrapper
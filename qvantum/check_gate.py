@@ -2,7 +2,9 @@
 
 # pylint: disable=E1101, W1401
 
+from . import check_parameter
 import numpy
+from . import parameter
 from . import qubit
 from . import register
 
@@ -142,7 +144,7 @@ def power_check(function):
         original matrix of the gate with the results matrix.
         
         Arguments:
-            power {int} -- The power which the gate is raised on
+            power {int, float} -- The power which the gate is raised on
         
         Raises:
             TypeError
@@ -172,11 +174,62 @@ def power_check(function):
                     [0, 0, 0, 0, 0, 0, 0, 1]])
         """
 
-        if isinstance(power, int):
+        if isinstance(power, (int, float)) and not isinstance(power, bool) \
+            and numpy.isfinite(power):
             return function(self, power)
 
         else:
-            raise TypeError('Invalid input! Argument must be integer.')
+            raise TypeError('Invalid input! Argument must be integer or float.')
+    
+    return wrapper
+
+def values_check(function):
+    """Decorator to check the arguments of parameter binding functions in gate class.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, values):
+        """Method which uses the given values of symbolic parameters.
+        
+        Arguments:
+            values {dict} -- Dictionary of parameters (or parameter names) and values
+        
+        Raises:
+            TypeError
+        """
+
+        check_parameter.check_values(values)
+        return function(self, values)
+    
+    return wrapper
+
+def derivative_check(function):
+    """Decorator to check the arguments of derivative function in gate class.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, values, param):
+        """Method to return the derivative of the matrix of the gate with respect to a symbolic 
+        parameter at the given parameter values.
+        
+        Arguments:
+            values {dict} -- Dictionary of parameters (or parameter names) and values
+            param {Parameter, str} -- The parameter (or its name)
+        
+        Raises:
+            ValueError, TypeError
+        """
+
+        check_parameter.check_values(values)
+        if isinstance(param, (str, parameter.Parameter)):
+            return function(self, values, param)
+        
+        else:
+            raise TypeError('Invalid input! Parameter must be a parameter object or a string.')
     
     return wrapper
 
@@ -225,7 +278,7 @@ def Ising_check(function):
         """Method to initialize Ising gate.
 
         Arguments:
-            phi {int, float} -- The used angle
+            phi {int, float, Parameter} -- The used angle
         
         Raises:
             TypeError
@@ -236,11 +289,75 @@ def Ising_check(function):
             >>> h = qvantum.Ising(1)
         """
 
-        if isinstance(phi, (int, float)):
+        if isinstance(phi, (int, float, parameter.Parameter)):
             return function(self, phi)
         
         else:
-            raise TypeError('Invalid input! Argument must be integer or float.')
+            raise TypeError('Invalid input! Argument must be integer, float or parameter.')
+    
+    return wrapper
+
+def Rotation_check(function):
+    """Decorator to check the arguments of calling rotation gate.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, axis, theta):
+        """Method to initialize rotation gate.
+
+        Arguments:
+            axis {str} -- Axis of the rotation: 'X', 'Y' or 'Z'
+            theta {int, float, Parameter} -- The used angle
+        
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> rx = qvantum.Rotation('X', 0.5)
+        """
+
+        if axis not in ['X', 'Y', 'Z']:
+            raise ValueError('Invalid input! Axis must be \'X\', \'Y\' or \'Z\'.')
+
+        if isinstance(theta, (int, float, parameter.Parameter)):
+            return function(self, axis, theta)
+        
+        else:
+            raise TypeError('Invalid input! Angle must be integer, float or parameter.')
+    
+    return wrapper
+
+def rotation_angle_check(function):
+    """Decorator to check the arguments of calling Rotation-X, Rotation-Y and Rotation-Z gates.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, theta):
+        """Method to initialize rotation gate around a fixed axis.
+
+        Arguments:
+            theta {int, float, Parameter} -- The used angle
+        
+        Raises:
+            TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> rx = qvantum.RotationX(0.5)
+        """
+
+        if isinstance(theta, (int, float, parameter.Parameter)):
+            return function(self, theta)
+        
+        else:
+            raise TypeError('Invalid input! Argument must be integer, float or parameter.')
     
     return wrapper
 
@@ -307,3 +424,35 @@ def Fredkin_check(function):
             'control.')
     
     return wrapper
+
+def Dagger_check(function):
+    """Decorator to check the arguments of calling Dagger gate.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, g):
+        """Method to initialize the adjoint of a gate.
+
+        Arguments:
+            g {gate} -- The wrapped gate
+        
+        Raises:
+            TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> d = qvantum.Dagger(qvantum.Phase())
+        """
+
+        from . import gate
+
+        if isinstance(g, gate.Gate):
+            return function(self, g)
+        
+        else:
+            raise TypeError('Invalid input! Argument must be a gate object.')
+    
+    return wrapper
@@ -0,0 +1,197 @@
+'''checking functions for matrix product state register class'''
+
+# pylint: disable=E1101, W1401
+
+from . import check_register
+from . import gate
+from . import qubit
+
+MAX_VECTOR_QUBITS = 30
+
+def mps_init_check(function):
+    """Decorator to check the arguments of initialization function in matrix product state
+    register class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, qubit_list, max_bond=None, threshold=1e-12):
+        """Method to initialize a matrix product state register in the product state of the
+        qubits.
+
+        Arguments:
+            qubit_list {list} -- List of objects from Qubit or Random_Qubit class
+
+        Keyword Arguments:
+            max_bond {int, None} -- Maximal bond dimension, unlimited if None (default: {None})
+            threshold {int, float} -- Relative threshold of dropped singular values
+                (default: {1e-12})
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not (isinstance(qubit_list, list) \
+            and all(isinstance(elem, (qubit.Qubit, qubit.Random_Qubit)) for elem in qubit_list)):
+            raise TypeError('Invalid input! Argument must be a list of qubit objects.')
+
+        if len(qubit_list) < 1:
+            raise ValueError('Invalid input! Qubit list must contain at least 1 qubit object.')
+
+        if max_bond is not None and not isinstance(max_bond, int):
+            raise TypeError('Invalid input! Maximal bond dimension must be integer or None.')
+
+        if max_bond is not None and max_bond < 1:
+            raise ValueError('Invalid input! Maximal bond dimension must be positive.')
+
+        if not isinstance(threshold, (int, float)):
+            raise TypeError('Invalid input! Threshold must be integer or float.')
+
+        if threshold < 0 or threshold >= 1:
+            raise ValueError('Invalid input! Threshold must be between 0 and 1.')
+
+        return function(self, qubit_list, max_bond, threshold)
+
+    return wrapper
+
+def apply_gate_check(function):
+    """Decorator to check the arguments of applying gate function in matrix product state
+    register class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, g, position):
+        """Method to apply a gate on some qubits of the register.
+
+        Arguments:
+            g {gate} -- The applied gate
+            position {int} -- Index of the first qubit which the gate acts on
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not isinstance(g, gate.Gate):
+            raise TypeError('Invalid input! Argument must be a gate object.')
+
+        if not isinstance(position, int):
+            raise TypeError('Invalid input! Position must be integer.')
+
+        width = int(g.get_size()).bit_length() - 1
+        if position >= 0 and position + width <= self.get_qubit_number():
+            return function(self, g, position)
+
+        else:
+            raise ValueError('Invalid input! The gate doesn\'t fit the register from the ' +\
+                'given position.')
+
+    return wrapper
+
+def expectation_check(function):
+    """Decorator to check the arguments of expectation value function in matrix product state
+    register class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, observable):
+        """Method to return the expectation value of an observable which is a Pauli string or a
+        weighted sum of Pauli strings.
+
+        Arguments:
+            observable {str, dict} -- Pauli string or dictionary of Pauli strings and weights
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        check_register.check_observable(observable, self.get_qubit_number())
+        return function(self, observable)
+
+    return wrapper
+
+def sample_check(function):
+    """Decorator to check the arguments of sampling function in matrix product state register
+    class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, shots=1):
+        """Method to sample the measurement of the whole register the given times.
+
+        Keyword Arguments:
+            shots {int} -- Number of samples (default: {1})
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not isinstance(shots, int):
+            raise TypeError('Invalid input! Argument must be integer.')
+
+        if shots >= 1:
+            return function(self, shots)
+
+        else:
+            raise ValueError('Invalid input! Number of shots must be at least 1.')
+
+    return wrapper
+
+def nth_check(function):
+    """Decorator to check the qubit index argument of functions in matrix product state
+    register class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, nth):
+        """Method which uses the n-th qubit of the register.
+
+        Arguments:
+            nth {int} -- Number of n-th qubit
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not isinstance(nth, int):
+            raise TypeError('Invalid input! Argument must be integer.')
+
+        if nth >= 0 and nth <= self.get_qubit_number() - 1:
+            return function(self, nth)
+
+        else:
+            raise ValueError('Invalid input! Argument must be greater or equal to 0 and ' +\
+                'less or equal to ' + str(self.get_qubit_number() - 1) + '.')
+
+    return wrapper
+
+def to_vector_check(function):
+    """Decorator to check the size of the register before building its state vector.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self):
+        """Method to return the state vector of the register.
+
+        Raises:
+            ValueError
+        """
+
+        if self.get_qubit_number() <= MAX_VECTOR_QUBITS:
+            return function(self)
+
+        else:
+            raise ValueError('Invalid input! The state vector of more than ' + \
+                str(MAX_VECTOR_QUBITS) + ' qubits can\'t be built.')
+
+    return wrapper
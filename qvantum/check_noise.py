@@ -0,0 +1,186 @@
+'''checking functions for noise classes'''
+
+# pylint: disable=E1101, W1401
+
+import numpy
+
+def channel_init_check(function):
+    """Decorator to check the arguments of initialization function in channel class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, kraus_list, name='Channel'):
+        """Method to initialize a channel from its Kraus operators.
+
+        Arguments:
+            kraus_list {list} -- List of 2x2 Kraus operators (numpy arrays)
+
+        Keyword Arguments:
+            name {str} -- Name of the channel (default: {'Channel'})
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not (isinstance(kraus_list, list) and len(kraus_list) > 0 \
+            and all(isinstance(kraus, numpy.ndarray) for kraus in kraus_list)):
+            raise TypeError('Invalid input! Argument must be a non-empty list of numpy arrays.')
+
+        if not isinstance(name, str):
+            raise TypeError('Invalid input! Name must be a string.')
+
+        if not all(kraus.shape == (2, 2) for kraus in kraus_list):
+            raise ValueError('Invalid input! Kraus operators must be 2x2 sized.')
+
+        completeness = sum(numpy.dot(numpy.conjugate(kraus).T, kraus) for kraus in kraus_list)
+        if not numpy.allclose(completeness, numpy.identity(2)):
+            raise ValueError('Invalid input! Kraus operators must satisfy Σ K†K = I.')
+
+        return function(self, kraus_list, name)
+
+    return wrapper
+
+def _check_probability(p):
+    """Raises TypeError or ValueError if the argument is not a probability.
+
+    Arguments:
+        p {int, float} -- The probability
+    """
+
+    if not isinstance(p, (int, float)) or isinstance(p, bool):
+        raise TypeError('Invalid input! Probability must be integer or float.')
+
+    if p < 0 or p > 1:
+        raise ValueError('Invalid input! Probability must be between 0 and 1.')
+
+def probability_check(function):
+    """Decorator to check the arguments of initialization function in channel classes with
+    one probability.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, p):
+        """Method to initialize a channel with one probability.
+
+        Arguments:
+            p {int, float} -- The probability
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        _check_probability(p)
+        return function(self, p)
+
+    return wrapper
+
+def readout_init_check(function):
+    """Decorator to check the arguments of initialization function in readout error class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, p01, p10):
+        """Method to initialize readout error.
+
+        Arguments:
+            p01 {int, float} -- Probability of reading 1 instead of 0
+            p10 {int, float} -- Probability of reading 0 instead of 1
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        _check_probability(p01)
+        _check_probability(p10)
+        return function(self, p01, p10)
+
+    return wrapper
+
+def add_gate_noise_check(function):
+    """Decorator to check the arguments of attaching channel to gate type function.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, name, channel):
+        """Method to attach a channel to the gates with the given name.
+
+        Arguments:
+            name {str} -- Name of the gates
+            channel {Channel} -- The channel
+
+        Raises:
+            TypeError
+        """
+
+        from . import noise
+
+        if isinstance(name, str) and isinstance(channel, noise.Channel):
+            return function(self, name, channel)
+
+        else:
+            raise TypeError('Invalid input! Arguments must be a gate name and a channel object.')
+
+    return wrapper
+
+def add_layer_noise_check(function):
+    """Decorator to check the arguments of attaching channel to layer function.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, nth, channel):
+        """Method to attach a channel to the n-th layer of a circuit.
+
+        Arguments:
+            nth {int} -- Number of the layer
+            channel {Channel} -- The channel
+
+        Raises:
+            TypeError
+        """
+
+        from . import noise
+
+        if isinstance(nth, int) and isinstance(channel, noise.Channel):
+            return function(self, nth, channel)
+
+        else:
+            raise TypeError('Invalid input! Arguments must be an integer and a channel object.')
+
+    return wrapper
+
+def set_readout_error_check(function):
+    """Decorator to check the arguments of setting readout error function.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, readout_error):
+        """Setter of the readout error of the measurements.
+
+        Arguments:
+            readout_error {ReadoutError, None} -- The readout error or None
+
+        Raises:
+            TypeError
+        """
+
+        from . import noise
+
+        if readout_error is None or isinstance(readout_error, noise.ReadoutError):
+            return function(self, readout_error)
+
+        else:
+            raise TypeError('Invalid input! Argument must be a readout error object or None.')
+
+    return wrapper
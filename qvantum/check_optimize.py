@@ -0,0 +1,32 @@
+'''checking functions for optimization functions'''
+
+# pylint: disable=E1101, W1401
+
+def optimize_check(function):
+    """Decorator to check the arguments of optimizing function.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(c):
+        """This function returns the optimized circuit and the report of the optimization: the
+        number of cancelled gates, the number of gates which are merged into other gates and the
+        number of dropped layers. The circuit itself is not changed.
+
+        Arguments:
+            c {Circuit} -- The optimized circuit
+
+        Raises:
+            TypeError
+        """
+
+        from . import circuit
+
+        if isinstance(c, circuit.Circuit):
+            return function(c)
+
+        else:
+            raise TypeError('Invalid input! Argument must be a circuit object.')
+
+    return wrapper
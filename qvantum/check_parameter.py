@@ -0,0 +1,51 @@
+'''checking functions for parameter class'''
+
+# pylint: disable=E1101, W1401
+
+def parameter_init_check(function):
+    """Decorator to check the arguments of initialization function in parameter class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, name):
+        """Method to initialize an instance of the Parameter class.
+
+        Arguments:
+            name {str} -- Name of the parameter
+
+        Raises:
+            TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> theta = qvantum.Parameter('theta')
+            >>> theta.get_name()
+            'theta'
+        """
+
+        if isinstance(name, str):
+            return function(self, name)
+
+        else:
+            raise TypeError('Invalid input! Argument must be string.')
+
+    return wrapper
+
+def check_values(values):
+    """Raises TypeError if the argument is not a dictionary of parameters (or parameter names) and
+    integer or float values.
+
+    Arguments:
+        values {dict} -- Dictionary of parameters (or names) and values
+    """
+
+    from . import parameter
+
+    if not (isinstance(values, dict) \
+        and all(isinstance(key, (str, parameter.Parameter)) for key in values) \
+        and all(isinstance(value, (int, float)) for value in values.values())):
+        raise TypeError('Invalid input! Argument must be a dictionary of parameters (or ' +\
+            'parameter names) and integer or float values.')
@@ -173,6 +173,165 @@ def set_amplitudes_check(function):
     
     return wrapper
 
+def set_vector_check(function):
+    """Decorator to check the arguments of setting vector function in register class.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, vector):
+        """Method to set new amplitudes from a one dimensional numpy array.
+        
+        Arguments:
+            vector {numpy.ndarray} -- Array of amplitudes
+        
+        Raises:
+            ValueError, TypeError
+        """
+
+        if isinstance(vector, numpy.ndarray) and vector.ndim == 1 \
+            and numpy.issubdtype(vector.dtype, numpy.number):
+            if len(vector) == self.get_state_number():
+                if round(numpy.vdot(vector, vector).real - 1, 10) == 0:
+                    return function(self, vector)
+
+                else:
+                    raise ValueError('Invalid input! The square sum of absolute value of ' +\
+                        'amplitudes must be equal to 1.')
+
+            else:
+                raise ValueError('Invalid input! The vector must be the same size as the ' +\
+                    'number of possible states.')
+
+        else:
+            raise TypeError('Invalid input! Argument must be a one dimensional numpy array of ' +\
+                'numbers.')
+
+    return wrapper
+
+def _check_selection(top, threshold):
+    """Raises TypeError or ValueError if the top and threshold arguments of amplitude selection 
+    are not valid.
+
+    Arguments:
+        top {int, None} -- Number of dominant amplitudes
+        threshold {int, float, None} -- Lower bound of absolute values
+    """
+
+    if (top is None or isinstance(top, int)) \
+        and (threshold is None or isinstance(threshold, (int, float))):
+        if (top is not None and top < 1) or (threshold is not None and threshold < 0):
+            raise ValueError('Invalid input! Top must be at least 1 and threshold must be ' +\
+                'greater or equal to 0.')
+
+    else:
+        raise TypeError('Invalid input! Top must be integer or None and threshold must be ' +\
+            'integer, float or None.')
+
+def iter_amplitudes_check(function):
+    """Decorator to check the arguments of amplitude generator function in register class.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, top=None, threshold=None):
+        """Generator method to stream the states and their amplitudes as (state, amplitude) 
+        pairs.
+        
+        Keyword Arguments:
+            top {int, None} -- Number of dominant amplitudes (default: {None})
+            threshold {int, float, None} -- Lower bound of absolute values (default: {None})
+        
+        Raises:
+            ValueError, TypeError
+        """
+
+        _check_selection(top, threshold)
+        return function(self, top, threshold)
+
+    return wrapper
+
+def show_check(function):
+    """Decorator to check the arguments of showing function in register class.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, top=None, threshold=None, max_chars=None):
+        """Method to show the state function of the register object.
+        
+        Keyword Arguments:
+            top {int, None} -- Number of dominant amplitudes to show (default: {None})
+            threshold {int, float, None} -- Lower bound of absolute values (default: {None})
+            max_chars {int, None} -- Maximal length of the result (default: {None})
+        
+        Raises:
+            ValueError, TypeError
+        """
+
+        _check_selection(top, threshold)
+        if max_chars is None or isinstance(max_chars, int):
+            if max_chars is None or max_chars >= 9:
+                return function(self, top, threshold, max_chars)
+
+            else:
+                raise ValueError('Invalid input! Max chars must be at least 9.')
+
+        else:
+            raise TypeError('Invalid input! Max chars must be integer or None.')
+
+    return wrapper
+
+def check_observable(observable, qubit_number):
+    """Raises TypeError or ValueError if the observable is not a Pauli string or a dictionary of 
+    Pauli strings and real weights which fits a register with the given number of qubits.
+
+    Arguments:
+        observable {str, dict} -- Pauli string or dictionary of Pauli strings and weights
+        qubit_number {int} -- Number of qubits in the register
+    """
+
+    if isinstance(observable, str):
+        observable = {observable: 1}
+
+    if isinstance(observable, dict) and len(observable) > 0 \
+        and all(isinstance(key, str) for key in observable) \
+        and all(isinstance(value, (int, float)) for value in observable.values()):
+        if not all(len(key) == qubit_number and all(char in 'IXYZ' for char in key) \
+            for key in observable):
+            raise ValueError('Invalid input! Pauli strings must contain ' + str(qubit_number) +\
+                ' characters from I, X, Y and Z.')
+
+    else:
+        raise TypeError('Invalid input! Observable must be a Pauli string or a non-empty ' +\
+            'dictionary of Pauli strings and integer or float weights.')
+
+def expectation_check(function):
+    """Decorator to check the arguments of expectation value function in register class.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, observable):
+        """Method to return the expectation value of an observable which is a Pauli string or a 
+        weighted sum of Pauli strings.
+        
+        Arguments:
+            observable {str, dict} -- Pauli string or dictionary of Pauli strings and weights
+        
+        Raises:
+            ValueError, TypeError
+        """
+
+        check_observable(observable, self.get_qubit_number())
+        return function(self, observable)
+
+    return wrapper
+
 def measure_nth_qubit_check(function):
     """Decorator to check the arguments of measuring qubit function in register class.
     
@@ -223,30 +382,50 @@ def delete_qubit_check(function):
         function {} -- The tested function
     """
 
-    def wrapper(self, nth):
-        """Method to delete the n-th qubit from the regsiter. This method has some drawback which 
-        is discussed later. The input parameter must be an integer corresponding to the number of 
-        qubits in the register.
+    def wrapper(self, nth, value=None):
+        """Method to delete the n-th qubit from the regsiter. The qubit is projected onto the 
+        given value (0 or 1) and removed, the remaining amplitudes are renormalized. If the value 
+        is None, the qubit is projected onto its more probable value.
         
         Arguments:
             nth {int} -- Number of n-th possible qubit
         
+        Keyword Arguments:
+            value {int, None} -- Value of the qubit to project onto: 0, 1 or None (default: {None})
+        
         Raises:
             ValueError, TypeError
+        """
+    
+        if isinstance(nth, int) and (value is None or isinstance(value, int)):
+            if value is None or value == 0 or value == 1:
+                return function(self, nth, value)
+
+            else:
+                raise ValueError('Invalid input! Value must be 0, 1 or None.')
         
-        Examples:
-            >>> import qvantum
-            >>>
-            >>> q1 = qvantum.Random_Qubit()
-            >>> q2 = qvantum.Random_Qubit()
-            >>> q3 = qvantum.Random_Qubit()
-            >>>
-            >>> r = qvantum.Register([q1, q2, q3])
-            >>> r.show()
-            '|Ψ> = (-0.0414-0.7876i)|000> + (-0.3986-0.4355i)|001> + (-0.0142+0.0084i)|010> + (-0.0042+0.0116i)|011> + (0.1003-0.0924i)|100> + (0.0140-0.1011i)|101> + (-0.0027-0.0010i)|110> + (-0.0020+0.0007i)|111>'
-            >>> r.delete_qubit(2)
-            >>> r.show()
-            '|Ψ> = (0.4927-0.6160i)|00> + (-0.0083-0.5904i)|01> + (0.1364-0.0024i)|10> + (0.0777-0.0663i)|11>'
+        else:
+            raise TypeError('Invalid input! Argument must be integer and value must be integer ' +\
+                'or None.')
+    
+    return wrapper
+
+def partial_trace_check(function):
+    """Decorator to check the arguments of partial trace function in register class.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, nth):
+        """Method to return the reduced density matrix of the register after tracing out the n-th 
+        qubit.
+        
+        Arguments:
+            nth {int} -- Number of n-th possible qubit
+        
+        Raises:
+            ValueError, TypeError
         """
     
         if isinstance(nth, int):
@@ -300,3 +479,56 @@ def insert_qubit_check(function):
             raise TypeError('Invalid input! Argument must a pair of qubit object and integer.')
     
     return wrapper
+
+def save_check(function):
+    """Decorator to check the arguments of saving function in register class.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, path):
+        """Method to save a checkpoint of the register.
+        
+        Arguments:
+            path {str} -- Path of the file
+        
+        Raises:
+            TypeError
+        """
+
+        if isinstance(path, str):
+            return function(self, path)
+
+        else:
+            raise TypeError('Invalid input! Path must be a string.')
+
+    return wrapper
+
+def load_check(function):
+    """Decorator to check the arguments of loading function in register class.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(path, mmap=True):
+        """Method to load a register from a checkpoint.
+        
+        Arguments:
+            path {str} -- Path of the file
+        
+        Keyword Arguments:
+            mmap {bool} -- If True, the file is memory mapped (default: {True})
+        
+        Raises:
+            TypeError
+        """
+
+        if isinstance(path, str) and isinstance(mmap, bool):
+            return function(path, mmap)
+
+        else:
+            raise TypeError('Invalid input! Arguments must be a path string and a boolean.')
+
+    return wrapper
@@ -0,0 +1,132 @@
+'''checking functions for serialization functions'''
+
+# pylint: disable=E1101, W1401
+
+def _check_object(obj):
+    """Raises TypeError if the argument is not a circuit, a layer or a gate.
+
+    Arguments:
+        obj {Circuit, Layer, Gate} -- The serialized object
+    """
+
+    from . import circuit
+    from . import gate
+    from . import layer
+
+    if not isinstance(obj, (circuit.Circuit, layer.Layer, gate.Gate)):
+        raise TypeError('Invalid input! Argument must be a circuit, a layer or a gate object.')
+
+def dumps_check(function):
+    """Decorator to check the arguments of serializing function.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(obj):
+        """This function serializes a circuit, a layer or a gate into bytes.
+
+        Arguments:
+            obj {Circuit, Layer, Gate} -- The serialized object
+
+        Raises:
+            TypeError
+        """
+
+        _check_object(obj)
+        return function(obj)
+
+    return wrapper
+
+def loads_check(function):
+    """Decorator to check the arguments of loading function.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(data, verify=True):
+        """This function loads a circuit, a layer or a gate from the bytes which are created by
+        dumps().
+
+        Arguments:
+            data {bytes} -- The serialized object
+
+        Keyword Arguments:
+            verify {bool} -- If True, the content hash is checked (default: {True})
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        from . import serialize
+
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError('Invalid input! Argument must be bytes.')
+
+        if not isinstance(verify, bool):
+            raise TypeError('Invalid input! Verify must be boolean.')
+
+        if len(data) < serialize._PREAMBLE.size:
+            raise ValueError('Invalid input! The data is too short.')
+
+        return function(data, verify)
+
+    return wrapper
+
+def dump_check(function):
+    """Decorator to check the arguments of serializing into file function.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(obj, path):
+        """This function serializes a circuit, a layer or a gate into a file.
+
+        Arguments:
+            obj {Circuit, Layer, Gate} -- The serialized object
+            path {str} -- Path of the file
+
+        Raises:
+            TypeError
+        """
+
+        _check_object(obj)
+        if not isinstance(path, str):
+            raise TypeError('Invalid input! Path must be a string.')
+
+        return function(obj, path)
+
+    return wrapper
+
+def load_check(function):
+    """Decorator to check the arguments of loading from file function.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(path, verify=True):
+        """This function loads a circuit, a layer or a gate from a file which is created by
+        dump().
+
+        Arguments:
+            path {str} -- Path of the file
+
+        Keyword Arguments:
+            verify {bool} -- If True, the content hash is checked (default: {True})
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not isinstance(path, str):
+            raise TypeError('Invalid input! Path must be a string.')
+
+        if not isinstance(verify, bool):
+            raise TypeError('Invalid input! Verify must be boolean.')
+
+        return function(path, verify)
+
+    return wrapper
@@ -0,0 +1,161 @@
+'''checking functions for job server'''
+
+# pylint: disable=E1101, W1401
+
+import numpy
+
+def _is_int(value):
+    """Returns whether the value is an integer (but not a boolean)."""
+
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def job_queue_init_check(function):
+    """Decorator to check the arguments of initialization function in job queue class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, workers=None, max_jobs=1024, max_batch=64, wait=0.002):
+        """Method to initialize a job queue.
+
+        Keyword Arguments:
+            workers {int, None} -- Number of worker threads, the default of ThreadPoolExecutor
+                if None (default: {None})
+            max_jobs {int} -- Maximal number of queued and running jobs (default: {1024})
+            max_batch {int} -- Maximal number of jobs in one batch (default: {64})
+            wait {int, float} -- Maximal time in seconds for a job to wait for other jobs of
+                the same circuit (default: {0.002})
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not (workers is None or _is_int(workers)) or not _is_int(max_jobs) \
+            or not _is_int(max_batch):
+            raise TypeError('Invalid input! Number of workers, jobs and batch size must be ' + \
+                'integers.')
+
+        if not isinstance(wait, (int, float)) or isinstance(wait, bool):
+            raise TypeError('Invalid input! Waiting time must be integer or float.')
+
+        if (workers is None or workers > 0) and max_jobs > 0 and max_batch > 0 and wait >= 0:
+            return function(self, workers, max_jobs, max_batch, wait)
+
+        else:
+            raise ValueError('Invalid input! Number of workers, jobs and batch size must be ' + \
+                'positive, waiting time must be non-negative.')
+
+    return wrapper
+
+def submit_check(function):
+    """Decorator to check the arguments of submitting function in job queue class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, c, vector):
+        """Method to submit a job: the circuit and the input amplitudes.
+
+        Arguments:
+            c {Circuit} -- The circuit
+            vector {numpy.ndarray} -- The input amplitudes
+
+        Raises:
+            ValueError, TypeError, RuntimeError
+        """
+
+        from . import circuit
+
+        if not isinstance(c, circuit.Circuit):
+            raise TypeError('Invalid input! Argument must be a circuit object.')
+
+        if not isinstance(vector, numpy.ndarray):
+            raise TypeError('Invalid input! Amplitudes must be a numpy array.')
+
+        if vector.shape == (2 ** c.get_circuit_size(),):
+            return function(self, c, vector)
+
+        else:
+            raise ValueError('Invalid input! Amplitudes must have the same size as the ' + \
+                'circuit.')
+
+    return wrapper
+
+def make_server_check(function):
+    """Decorator to check the arguments of server making function.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(job_queue, host='127.0.0.1', port=8765):
+        """This function returns an HTTP server (not started yet) which runs the jobs of the
+        requests on the job queue.
+
+        Arguments:
+            job_queue {JobQueue} -- The job queue
+
+        Keyword Arguments:
+            host {str} -- Host name of the server (default: {'127.0.0.1'})
+            port {int} -- Port of the server, a free port if 0 (default: {8765})
+
+        Raises:
+            TypeError
+        """
+
+        from . import serve
+
+        if not isinstance(job_queue, serve.JobQueue):
+            raise TypeError('Invalid input! Argument must be a job queue object.')
+
+        if isinstance(host, str) and _is_int(port):
+            return function(job_queue, host, port)
+
+        else:
+            raise TypeError('Invalid input! Host must be string and port must be integer.')
+
+    return wrapper
+
+def run_remote_check(function):
+    """Decorator to check the arguments of remote running function.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(c, state=None, observable=None, url='http://127.0.0.1:8765', timeout=None):
+        """This function runs a circuit on a job server and returns the result.
+
+        Arguments:
+            c {Circuit} -- The circuit
+
+        Keyword Arguments:
+            state {str, None} -- Bit string of the input basis state, all zeros if None
+                (default: {None})
+            observable {str, None} -- Pauli string of the observable (default: {None})
+            url {str} -- URL of the server (default: {'http://127.0.0.1:8765'})
+            timeout {int, float, None} -- Timeout of the request in seconds (default: {None})
+
+        Raises:
+            ValueError, TypeError, RuntimeError
+        """
+
+        from . import circuit
+
+        if not isinstance(c, circuit.Circuit):
+            raise TypeError('Invalid input! Argument must be a circuit object.')
+
+        if not all(value is None or isinstance(value, str) for value in (state, observable)) \
+            or not isinstance(url, str):
+            raise TypeError('Invalid input! State, observable and URL must be strings.')
+
+        if timeout is None or (isinstance(timeout, (int, float)) \
+            and not isinstance(timeout, bool) and timeout > 0):
+            return function(c, state, observable, url, timeout)
+
+        else:
+            raise ValueError('Invalid input! Timeout must be a positive number or None.')
+
+    return wrapper
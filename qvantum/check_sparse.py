@@ -0,0 +1,167 @@
+'''checking functions for sparse register class'''
+
+# pylint: disable=E1101, W1401
+
+from . import check_register
+from . import gate
+from . import qubit
+
+MAX_VECTOR_QUBITS = 30
+MAX_QUBITS = 62
+
+def sparse_init_check(function):
+    """Decorator to check the arguments of initialization function in sparse register class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, qubit_list, threshold=1e-12, dense_fraction=0.25):
+        """Method to initialize a sparse register in the product state of the qubits.
+
+        Arguments:
+            qubit_list {list} -- List of objects from Qubit or Random_Qubit class
+
+        Keyword Arguments:
+            threshold {int, float} -- Amplitudes with smaller absolute value are dropped
+                (default: {1e-12})
+            dense_fraction {int, float} -- Fraction of non-zero amplitudes above which the
+                register is stored densely (default: {0.25})
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not (isinstance(qubit_list, list) \
+            and all(isinstance(elem, (qubit.Qubit, qubit.Random_Qubit)) for elem in qubit_list)):
+            raise TypeError('Invalid input! Argument must be a list of qubit objects.')
+
+        if len(qubit_list) < 1 or len(qubit_list) > MAX_QUBITS:
+            raise ValueError('Invalid input! Qubit list must contain at least 1 and at most ' + \
+                str(MAX_QUBITS) + ' qubit objects.')
+
+        if not isinstance(threshold, (int, float)) or isinstance(threshold, bool):
+            raise TypeError('Invalid input! Threshold must be integer or float.')
+
+        if threshold < 0 or threshold >= 1:
+            raise ValueError('Invalid input! Threshold must be between 0 and 1.')
+
+        if not isinstance(dense_fraction, (int, float)) or isinstance(dense_fraction, bool):
+            raise TypeError('Invalid input! Dense fraction must be integer or float.')
+
+        if dense_fraction <= 0 or dense_fraction > 1:
+            raise ValueError('Invalid input! Dense fraction must be greater than 0 and less ' + \
+                'or equal to 1.')
+
+        return function(self, qubit_list, threshold, dense_fraction)
+
+    return wrapper
+
+def apply_gate_check(function):
+    """Decorator to check the arguments of applying gate function in sparse register class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, g, position):
+        """Method to apply a gate on some qubits of the register.
+
+        Arguments:
+            g {gate} -- The applied gate
+            position {int} -- Index of the first qubit which the gate acts on
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not isinstance(g, gate.Gate):
+            raise TypeError('Invalid input! Argument must be a gate object.')
+
+        if not isinstance(position, int):
+            raise TypeError('Invalid input! Position must be integer.')
+
+        width = int(g.get_size()).bit_length() - 1
+        if position >= 0 and position + width <= self.get_qubit_number():
+            return function(self, g, position)
+
+        else:
+            raise ValueError('Invalid input! The gate doesn\'t fit the register from the ' +\
+                'given position.')
+
+    return wrapper
+
+def expectation_check(function):
+    """Decorator to check the arguments of expectation value function in sparse register class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, observable):
+        """Method to return the expectation value of an observable which is a Pauli string or a
+        weighted sum of Pauli strings.
+
+        Arguments:
+            observable {str, dict} -- Pauli string or dictionary of Pauli strings and weights
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        check_register.check_observable(observable, self.get_qubit_number())
+        return function(self, observable)
+
+    return wrapper
+
+def nth_check(function):
+    """Decorator to check the qubit index argument of functions in sparse register class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, nth):
+        """Method which uses the n-th qubit of the register.
+
+        Arguments:
+            nth {int} -- Number of n-th qubit
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not isinstance(nth, int):
+            raise TypeError('Invalid input! Argument must be integer.')
+
+        if nth >= 0 and nth <= self.get_qubit_number() - 1:
+            return function(self, nth)
+
+        else:
+            raise ValueError('Invalid input! Argument must be greater or equal to 0 and ' +\
+                'less or equal to ' + str(self.get_qubit_number() - 1) + '.')
+
+    return wrapper
+
+def get_vector_check(function):
+    """Decorator to check the size of the register before building its dense vector.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self):
+        """Method to return all the amplitudes as a numpy array.
+
+        Raises:
+            ValueError
+        """
+
+        if self.get_qubit_number() <= MAX_VECTOR_QUBITS:
+            return function(self)
+
+        else:
+            raise ValueError('Invalid input! The dense vector of more than ' + \
+                str(MAX_VECTOR_QUBITS) + ' qubits can\'t be built.')
+
+    return wrapper
@@ -0,0 +1,139 @@
+'''checking functions for stabilizer register class'''
+
+# pylint: disable=E1101, W1401
+
+from . import check_register
+
+MAX_VECTOR_QUBITS = 30
+
+def stabilizer_init_check(function):
+    """Decorator to check the arguments of initialization function in stabilizer register class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, qubit_number):
+        """Method to initialize a stabilizer register in the state |00...0>.
+
+        Arguments:
+            qubit_number {int} -- Number of qubits
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not isinstance(qubit_number, int):
+            raise TypeError('Invalid input! Argument must be integer.')
+
+        if qubit_number >= 1:
+            return function(self, qubit_number)
+
+        else:
+            raise ValueError('Invalid input! Number of qubits must be at least 1.')
+
+    return wrapper
+
+def nth_check(function):
+    """Decorator to check the qubit index argument of functions in stabilizer register class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, nth):
+        """Method which uses the n-th qubit of the stabilizer register.
+
+        Arguments:
+            nth {int} -- Number of n-th qubit
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not isinstance(nth, int):
+            raise TypeError('Invalid input! Argument must be integer.')
+
+        if nth >= 0 and nth <= self.get_qubit_number() - 1:
+            return function(self, nth)
+
+        else:
+            raise ValueError('Invalid input! Argument must be greater or equal to 0 and ' +\
+                'less or equal to ' + str(self.get_qubit_number() - 1) + '.')
+
+    return wrapper
+
+def sample_check(function):
+    """Decorator to check the arguments of sampling function in stabilizer register class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, shots=1):
+        """Method to sample the measurement of the whole register the given times.
+
+        Keyword Arguments:
+            shots {int} -- Number of samples (default: {1})
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        if not isinstance(shots, int):
+            raise TypeError('Invalid input! Argument must be integer.')
+
+        if shots >= 1:
+            return function(self, shots)
+
+        else:
+            raise ValueError('Invalid input! Number of shots must be at least 1.')
+
+    return wrapper
+
+def expectation_check(function):
+    """Decorator to check the arguments of expectation value function in stabilizer register
+    class.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, observable):
+        """Method to return the expectation value of an observable which is a Pauli string or a
+        weighted sum of Pauli strings.
+
+        Arguments:
+            observable {str, dict} -- Pauli string or dictionary of Pauli strings and weights
+
+        Raises:
+            ValueError, TypeError
+        """
+
+        check_register.check_observable(observable, self.get_qubit_number())
+        return function(self, observable)
+
+    return wrapper
+
+def to_vector_check(function):
+    """Decorator to check the size of the register before building its state vector.
+
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self):
+        """Method to return the state vector of the register.
+
+        Raises:
+            ValueError
+        """
+
+        if self.get_qubit_number() <= MAX_VECTOR_QUBITS:
+            return function(self)
+
+        else:
+            raise ValueError('Invalid input! The state vector of more than ' + \
+                str(MAX_VECTOR_QUBITS) + ' qubits can\'t be built.')
+
+    return wrapper
@@ -5,7 +5,58 @@
 from . import check_circuit
 import collections
 import copy
+from . import engine
+import hashlib
+from . import layer
+from . import parameter
+import itertools
 import numpy
+from . import pauli
+from . import register
+from . import stabilizer
+
+_UNITARY_BLOCK_AMPLITUDES = 2 ** 20
+
+def _run_layers(c, vector, cancelled=None):
+    """Runs the circuit on the amplitudes layer by layer and returns the result, or None if the
+    run is cancelled between two layers. It's the worker function of Circuit.run_async(), so it
+    can be sent to worker processes as well.
+
+    Arguments:
+        c {Circuit} -- The circuit
+        vector {numpy.ndarray} -- The input amplitudes
+
+    Keyword Arguments:
+        cancelled {threading.Event, None} -- Event which is set when the run is cancelled 
+            (default: {None})
+    """
+
+    qubit_number = c.get_circuit_size()
+    for l in c.get_layer_list().values():
+
+        if cancelled is not None and cancelled.is_set():
+            return None
+
+        vector = engine.run_operations(vector, engine.layer_operations(l), qubit_number)
+
+    return vector
+
+def _finish_run(r, cancelled, future):
+    """Writes the result of an asynchronous run into the register, or stops the worker if the
+    run is cancelled.
+
+    Arguments:
+        r {register} -- Register which the circuit is applied on
+        cancelled {threading.Event, None} -- Event which stops the worker between two layers
+        future {asyncio.Future} -- The future of the run
+    """
+
+    if future.cancelled():
+        if cancelled is not None:
+            cancelled.set()
+
+    elif future.exception() is None:
+        r.set_vector(future.result())
 
 class Circuit(object):
     """circuit class
@@ -26,6 +77,24 @@ class Circuit(object):
     - delete_layer()     - delete layer from circuit
     - insert_layer()     - insert layer into circuit
     - run()              - run circuit on starting register
+    - run_async()        - run circuit on starting register in an executor (asyncio)
+    - get_parameters()   - getter of symbolic parameters of circuit
+    - bind()             - bind values to the symbolic parameters
+    - run_sweep()        - run circuit for many parameter values in one batch
+    - gradient()         - gradient of an expectation value with respect to the parameters
+    - inverse()          - inverse (adjoint) circuit
+    - uncompute()        - run inverse circuit on register
+    - compute_uncompute() - run circuit, an action and inverse circuit on register
+    - get_hash()         - structural hash of circuit
+    - unitary()          - unitary matrix of circuit
+    - run_noisy()        - run noisy trajectories of circuit
+    - is_clifford()      - check whether the circuit contains only Clifford gates
+    - from_qasm()        - read circuit from OpenQASM program
+    - to_qasm()          - write circuit as OpenQASM program
+    - optimize()         - optimized circuit with cancelled and merged gates
+
+    The circuit is executed gate by gate on the amplitudes of the register (see the engine 
+    module), the matrices of the layers are not built.
     """
 
     @check_circuit.circuit_init_check
@@ -51,8 +120,8 @@ class Circuit(object):
             <qvantum.layer.Layer at 0x27b474c2cf8>
         """
 
-        if all(layer_list[0].get_layer_size() == layer_list[i].get_layer_size() \
-            for i in range(len(layer_list))):
+        size = layer_list[0].get_layer_size()
+        if all(size == elem.get_layer_size() for elem in layer_list):
             ranks = [i for i in range(len(layer_list))]
 
             self.__layer_list = collections.OrderedDict(zip(ranks, layer_list))
@@ -61,6 +130,41 @@ class Circuit(object):
             raise ValueError('Invalid input! Argument must be a list of layer objects with same ' +\
                 'size.')
 
+    def __reduce__(self):
+        """Method which makes the pickled form of the circuit the compact serialized form (see 
+        the serialize module), so circuits are cheap to send to worker processes. Every gate of 
+        the unpickled circuit is a new object, gates of custom subclasses of Gate are unpickled 
+        as plain Gate objects with the same name and matrix.
+        """
+
+        from . import serialize
+
+        return serialize._unpickle, (serialize.dumps(self),)
+
+    def __copy__(self):
+        """Method which keeps copy.copy() on the default path instead of the pickled form: the 
+        copy shares the layers of the circuit.
+        """
+
+        result = type(self).__new__(type(self))
+        result.__dict__.update(self.__dict__)
+
+        return result
+
+    def __deepcopy__(self, memo):
+        """Method which keeps copy.deepcopy() on the default path instead of the pickled form, 
+        so the gates keep their classes and shared gates stay shared in the copy.
+        
+        Arguments:
+            memo {dict} -- The memo dictionary of copy.deepcopy()
+        """
+
+        result = type(self).__new__(type(self))
+        memo[id(self)] = result
+        result.__dict__.update(copy.deepcopy(self.__dict__, memo))
+
+        return result
+
     def get_layer_list(self):
         """Method to return the layers which are contained by the current Circuit object.
 
@@ -229,14 +333,28 @@ class Circuit(object):
                 str(len(self.__layer_list)) + '.')
 
     @check_circuit.run_check
-    def run(self, r):
+    def run(self, r, cache=None, observed=None):
         """Method to perform the computational process on a Register object as input and returns 
         the result. The size of the Register object and the size of the Circuit object must be 
-        equal.
+        equal. If a result cache is given, the output amplitudes are looked up by the structural 
+        hash of the circuit and the hash of the input amplitudes, and on a hit they are only 
+        copied into the register (see ResultCache).
+
+        If the observed qubits are given, only the gates in their backward light cone are run 
+        (see engine.light_cone()). The measurement probabilities and expectation values of the 
+        observed qubits are the same as after the whole circuit, the state of the other qubits 
+        is not. The result cache can't be used together with the observed qubits, since the 
+        output of a pruned run isn't the output of the circuit; ValueError is raised if both 
+        are given.
         
         Arguments:
             r {register} -- Register which the circuit is applied on
         
+        Keyword Arguments:
+            cache {ResultCache, None} -- Result cache of Register runs (default: {None})
+            observed {list, None} -- Indices of the observed qubits, every qubit if None 
+                (default: {None})
+        
         Raises:
             ValueError, TypeError
         
@@ -254,14 +372,693 @@ class Circuit(object):
             >>> c.run(r)
             >>> r.show()
             '|Ψ> = (-0.4342+0.1693i)|00> + (-0.2054-0.1873i)|01> + (-0.8198+0.0938i)|10> + (-0.1392-0.0727i)|11>'
+            >>>
+            >>> r = qvantum.Register([qvantum.Qubit(1, 0), qvantum.Qubit(1, 0)])
+            >>> c = qvantum.Circuit([qvantum.Layer([qvantum.Hadamard(), qvantum.PauliX()])])
+            >>> c.run(r, observed=[1])
+            >>> r.show()
+            '|Ψ> = (0.0000+0.0000i)|00> + (1.0000+0.0000i)|01> + (0.0000+0.0000i)|10> + (0.0000+0.0000i)|11>'
         """
 
-        if r.get_qubit_number() == self.get_circuit_size():
-            for key in self.__layer_list:
+        if r.get_qubit_number() != self.get_circuit_size():
+            raise ValueError('Invalid input! Register must have the same size as the layers.')
 
-                vector = numpy.asarray(self.__layer_list[key].get_layer_matrix() * \
-                    r.ket()).flatten()
-                r.set_amplitudes(list(vector))
+        if observed is not None:
+            self.__apply(r, engine.light_cone(self.get_operations(), observed))
+            return
+
+        if cache is None:
+            self.__apply(r, self.get_operations())
+            return
+
+        key = cache.key(self, r.get_vector())
+        result = cache.get(key)
+        if result is None:
+            self.__apply(r, self.get_operations())
+            cache.put(key, r.get_vector())
 
         else:
+            r.set_vector(result.copy())
+
+    @check_circuit.run_async_check
+    def run_async(self, r, executor=None):
+        """Method to run the circuit on a Register object in an executor without blocking the 
+        asyncio event loop. It returns an asyncio future, when it's done the register contains 
+        the result (the result of the future is the output amplitudes). It must be called from 
+        a coroutine or a callback of the running event loop, otherwise RuntimeError is raised.
+
+        The circuit is run in the given thread or process executor (concurrent.futures), or in 
+        the default executor of the event loop if it's None, so the runs of many circuits (e.g. 
+        by asyncio.gather) share one worker pool. If the future is cancelled, a thread stops 
+        the run at the next layer and the register isn't changed; a process can only be 
+        cancelled before the run is started.
+        
+        Arguments:
+            r {Register} -- Register which the circuit is applied on
+        
+        Keyword Arguments:
+            executor {Executor, None} -- Thread or process executor, the default executor of 
+                the event loop if None (default: {None})
+        
+        Raises:
+            ValueError, TypeError, RuntimeError
+        
+        Examples:
+            >>> import asyncio
+            >>> import qvantum
+            >>>
+            >>> async def main():
+            ...     r = qvantum.Register([qvantum.Qubit(1, 0), qvantum.Qubit(1, 0)])
+            ...     c = qvantum.Circuit([qvantum.Layer([qvantum.Hadamard(), qvantum.PauliX()])])
+            ...     await c.run_async(r)
+            ...     return r.show()
+            >>>
+            >>> asyncio.run(main())
+            '|Ψ> = (0.0000+0.0000i)|00> + (0.7071+0.0000i)|01> + (0.0000+0.0000i)|10> + (0.7071+0.0000i)|11>'
+        """
+
+        import asyncio
+        from concurrent import futures
+        import functools
+        import threading
+
+        if r.get_qubit_number() != self.get_circuit_size():
             raise ValueError('Invalid input! Register must have the same size as the layers.')
+
+        cancelled = None
+        if not isinstance(executor, futures.ProcessPoolExecutor):
+            cancelled = threading.Event()
+
+        future = asyncio.get_running_loop().run_in_executor(executor, _run_layers, self, \
+            r.get_vector(), cancelled)
+        future.add_done_callback(functools.partial(_finish_run, r, cancelled))
+
+        return future
+
+    def inverse(self):
+        """Method to return the inverse (adjoint) of the circuit: the layers in reversed order, 
+        every gate replaced by its inverse (see Gate.get_inverse()). No matrix is multiplied or 
+        inverted, self-inverse gates are reused and the other gates are wrapped in Dagger gates, 
+        so the inverse follows the parameters bound to the circuit.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> l1 = qvantum.Layer([qvantum.Hadamard(), qvantum.Phase()])
+            >>> l2 = qvantum.Layer([qvantum.CNOT(1, 0)])
+            >>> c = qvantum.Circuit([l1, l2])
+            >>> [g.get_name() for g in c.inverse().get_nth_layer(1).get_gate_list().values()]
+            ['Hadamard', 'Phase-Dagger']
+        """
+
+        layer_list = []
+        for l in reversed(list(self.get_layer_list().values())):
+
+            layer_list.append(layer.Layer([g.get_inverse() for g in l.get_gate_list().values()]))
+
+        return Circuit(layer_list)
+
+    @check_circuit.uncompute_check
+    def uncompute(self, r):
+        """Method to run the inverse of the circuit on the register, i.e. to undo a previous run 
+        of the circuit. The inverse operations are applied on the amplitudes of the register 
+        directly, the inverse circuit is not built.
+        
+        Arguments:
+            r {register} -- Register which the inverse circuit is applied on
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> r = qvantum.Register([qvantum.Qubit(1, 0), qvantum.Qubit(1, 0)])
+            >>> c = qvantum.Circuit([qvantum.Layer([qvantum.Hadamard(), qvantum.Phase()])])
+            >>> c.run(r)
+            >>> c.uncompute(r)
+            >>> r.show()
+            '|Ψ> = (1.0000+0.0000i)|00> + (0.0000+0.0000i)|01> + (0.0000+0.0000i)|10> + (0.0000+0.0000i)|11>'
+        """
+
+        operations = [(position, gate.get_inverse()) \
+            for position, gate in reversed(self.get_operations())]
+        self.__apply(r, operations)
+
+    @check_circuit.compute_uncompute_check
+    def compute_uncompute(self, r, action):
+        """Method to run the circuit on the register (compute), then the action, then the 
+        inverse of the circuit (uncompute). The action is a circuit or a function which gets the 
+        register, e.g. a phase flip between the computation and the uncomputation of an oracle.
+        
+        Arguments:
+            r {register} -- Register which the circuits are applied on
+            action {Circuit, function} -- Circuit or function called on the register
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> r = qvantum.Register([qvantum.Qubit(1, 0), qvantum.Qubit(1, 0)])
+            >>> compute = qvantum.Circuit([qvantum.Layer([qvantum.CNOT(0, 1)])])
+            >>> action = qvantum.Circuit([qvantum.Layer([qvantum.Gate(), qvantum.PauliZ()])])
+            >>> compute.compute_uncompute(r, action)
+        """
+
+        self.run(r)
+        if isinstance(action, Circuit):
+            action.run(r)
+
+        else:
+            action(r)
+
+        self.uncompute(r)
+
+    def get_hash(self):
+        """Method to return the structural hash of the circuit: a hex digest of the layers, the 
+        positions, names and matrices of the gates. Circuits with the same hash have the same 
+        structure and the same (bound) matrices. If a gate has an unbound parameter, ValueError 
+        is raised.
+
+        Raises:
+            ValueError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> l1 = qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()])
+            >>> l2 = qvantum.Layer([qvantum.CNOT(1, 0)])
+            >>> qvantum.Circuit([l1, l2]).get_hash()
+            'a0d70b08dfa9fdd65556af24bc499f278017ab96'
+        """
+
+        digest = hashlib.sha1()
+        for l in self.get_layer_list().values():
+
+            digest.update(b'layer')
+            for position, gate in engine.layer_operations(l):
+
+                matrix = numpy.ascontiguousarray(gate.get_matrix(), dtype=complex)
+                digest.update(repr((position, gate.get_name(), matrix.shape)).encode('utf-8'))
+                digest.update(matrix.tobytes())
+
+        return digest.hexdigest()
+
+    @check_circuit.unitary_check
+    def unitary(self, block=None, workers=None, cache=None):
+        """Method to return the unitary matrix of the circuit. Blocks of columns of the identity 
+        matrix are run through the circuit by the engine, so beside the result only one block 
+        of columns per worker is in the memory and no layer matrix is built. The blocks are 
+        processed by a thread pool if workers is given. If a result cache is given, the matrix 
+        is cached by the structural hash of the circuit (see get_hash()) within the memory 
+        budget of the cache, and the cached matrix is returned read-only without copying.
+        
+        Keyword Arguments:
+            block {int, None} -- Number of columns in one block, as many as fit 2^20 amplitudes 
+                if None (default: {None})
+            workers {int, None} -- Number of threads, no threads if None (default: {None})
+            cache {ResultCache, None} -- Result cache of unitary matrices (default: {None})
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> l1 = qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()])
+            >>> l2 = qvantum.Layer([qvantum.CNOT(0, 1)])
+            >>> c = qvantum.Circuit([l1, l2])
+            >>> c.unitary(block=2)
+            matrix([[ 0.70710678+0.j,  0.        +0.j,  0.70710678+0.j,  0.        +0.j],
+                    [ 0.        +0.j,  0.70710678+0.j,  0.        +0.j,  0.70710678+0.j],
+                    [ 0.        +0.j,  0.70710678+0.j,  0.        +0.j, -0.70710678+0.j],
+                    [ 0.70710678+0.j,  0.        +0.j, -0.70710678+0.j,  0.        +0.j]])
+        """
+
+        key = (self.get_hash(), 'unitary')
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return numpy.matrix(cached, copy=False)
+
+        qubit_number = self.get_circuit_size()
+        size = 2 ** qubit_number
+        operations = self.get_operations()
+        if block is None:
+            block = max(1, min(size, _UNITARY_BLOCK_AMPLITUDES // size))
+
+        result = numpy.empty((size, size), dtype=complex)
+
+        def run_block(start):
+            """Runs the identity columns start, ..., start + block - 1 through the circuit and 
+            writes them into the result.
+
+            Arguments:
+                start {int} -- Index of the first column of the block
+            """
+
+            stop = min(start + block, size)
+            columns = numpy.zeros((stop - start, size), dtype=complex)
+            columns[numpy.arange(stop - start), numpy.arange(start, stop)] = 1
+            result[:, start:stop] = engine.run_operations(columns, operations, qubit_number).T
+
+        if workers is None:
+            for start in range(0, size, block):
+
+                run_block(start)
+
+        else:
+            from concurrent import futures
+
+            with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(run_block, range(0, size, block)))
+
+        if cache is not None:
+            result.flags.writeable = False
+            cache.put(key, result)
+
+        return numpy.matrix(result, copy=False)
+
+    def __apply(self, r, operations):
+        """Applies the operations on the register: on the amplitudes of a register by the 
+        engine, other registers (DensityRegister, StabilizerRegister, MPSRegister, 
+        SparseRegister) apply them by themselves.
+
+        Arguments:
+            r {register} -- Register which the operations are applied on
+            operations {list} -- List of (position, gate) pairs
+        """
+
+        if isinstance(r, register.Register):
+            r.set_vector(engine.run_operations(r.get_vector(), operations, \
+                self.get_circuit_size()))
+
+        else:
+            r.apply_operations(operations)
+
+    def is_clifford(self):
+        """Method to check whether the circuit contains only Clifford gates (identity, Hadamard, 
+        Phase and its inverse, PauliX, PauliY, PauliZ, CNOT, ControlledZ, Swap), i.e. whether it 
+        can be run on a StabilizerRegister.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> l1 = qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()])
+            >>> l2 = qvantum.Layer([qvantum.CNOT(0, 1)])
+            >>> qvantum.Circuit([l1, l2]).is_clifford()
+            True
+        """
+
+        return stabilizer.is_clifford(self.get_operations())
+
+    @staticmethod
+    @check_circuit.from_qasm_check
+    def from_qasm(source):
+        """Method to read a circuit from an OpenQASM 2 or OpenQASM 3 program. The program is 
+        parsed statement by statement and the gates are scheduled into layers as they are read, 
+        so long programs are read with bounded memory (see the qasm module).
+        
+        Arguments:
+            source {str, file} -- The program or a file object of the program
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> c = qvantum.Circuit.from_qasm('OPENQASM 2.0; include "qelib1.inc"; ' + \
+                    'qreg q[3]; h q[0]; cx q[0], q[2];')
+            >>> c.get_layer_number()
+            3
+        """
+
+        from . import qasm
+
+        return qasm.read(source)
+
+    @check_circuit.to_qasm_check
+    def to_qasm(self, stream=None, version=2):
+        """Method to write the circuit as an OpenQASM 2 or OpenQASM 3 program. If a stream is 
+        given, the statements are written into it layer by layer, otherwise the program is 
+        returned as a string.
+        
+        Keyword Arguments:
+            stream {file, None} -- File object which the program is written into (default: {None})
+            version {int} -- Version of OpenQASM: 2 or 3 (default: {2})
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> l1 = qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()])
+            >>> l2 = qvantum.Layer([qvantum.CNOT(0, 1)])
+            >>> print(qvantum.Circuit([l1, l2]).to_qasm())
+            OPENQASM 2.0;
+            include "qelib1.inc";
+            qreg q[2];
+            h q[0];
+            cx q[0], q[1];
+        """
+
+        from . import qasm
+
+        return qasm.write(self, stream, version)
+
+    def optimize(self):
+        """Method to return the optimized circuit and the report of the optimization. Adjacent
+        gates on the same qubits whose product is the identity are cancelled, adjacent diagonal
+        gates are merged, PauliX pairs around diagonal gates are removed and the identity layers
+        are dropped (see the optimize module). The circuit itself is not changed.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> l1 = qvantum.Layer([qvantum.PauliX(), qvantum.Gate()])
+            >>> l2 = qvantum.Layer([qvantum.ControlledZ()])
+            >>> l3 = qvantum.Layer([qvantum.PauliX(), qvantum.Gate()])
+            >>> optimized, report = qvantum.Circuit([l1, l2, l3]).optimize()
+            >>> optimized.get_layer_number()
+            1
+            >>> report
+            {'cancelled': 2, 'merged': 0, 'layers': 2}
+        """
+
+        from . import optimize
+
+        return optimize.optimize(self)
+
+    def get_operations(self):
+        """Method to return the gates of the circuit in order of execution as a list of 
+        (position, gate) pairs, where position is the index of the first qubit which the gate 
+        acts on.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> l1 = qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()])
+            >>> l2 = qvantum.Layer([qvantum.CNOT(1, 0)])
+            >>> c = qvantum.Circuit([l1, l2])
+            >>> c.get_operations()
+            [(0, <qvantum.gate.Hadamard at 0x27b47e65630>), (1, <qvantum.gate.Gate at 0x27b47e65cc0>), (0, <qvantum.gate.CNOT at 0x27b47e65e48>)]
+        """
+
+        return engine.circuit_operations(self.__layer_list.values())
+
+    def get_parameters(self):
+        """Method to return the list of symbolic parameters used by the gates of the circuit, in 
+        order of their first appearance.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> phi = qvantum.Parameter('phi')
+            >>> l1 = qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()])
+            >>> l2 = qvantum.Layer([qvantum.Ising(phi)])
+            >>> c = qvantum.Circuit([l1, l2])
+            >>> c.get_parameters()
+            [Parameter('phi')]
+        """
+
+        parameters = []
+        for position, gate in self.get_operations():
+            for p in gate.get_parameters():
+
+                if p not in parameters:
+                    parameters.append(p)
+
+        return parameters
+
+    @check_circuit.bind_check
+    def bind(self, values):
+        """Method to bind values to the symbolic parameters of the circuit. The layers and the 
+        circuit are reused as they are, only the small matrices of the gates which use the given 
+        parameters are recomputed.
+        
+        Arguments:
+            values {dict} -- Dictionary of parameters (or parameter names) and values
+        
+        Raises:
+            TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> phi = qvantum.Parameter('phi')
+            >>> l1 = qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()])
+            >>> l2 = qvantum.Layer([qvantum.Ising(phi)])
+            >>> c = qvantum.Circuit([l1, l2])
+            >>> for value in [0.1, 0.2, 0.3]:
+            ...     c.bind({'phi': value})
+            ...     c.run(r)
+        """
+
+        for position, gate in self.get_operations():
+
+            if gate.get_parameters():
+                gate.bind(values)
+
+    @check_circuit.run_sweep_check
+    def run_sweep(self, r, param_grid, observable=None, batch_size=None):
+        """Method to run the circuit on the register for many parameter bindings in batched 
+        passes. The register and the gates are not changed. The parameter grid is either a 
+        dictionary of parameters (or names) and lists of values, in which case every combination 
+        is used (in the order of itertools.product), or a list of dictionaries of parameter 
+        values. The result is a numpy array with one row of amplitudes per binding, or, if an 
+        observable is given, the array of its expectation values. Every binding is a row of one 
+        stacked array, so one pass over the gates serves all of them; batch_size limits the 
+        number of rows processed together.
+        
+        Arguments:
+            r {register} -- Register which the circuit is applied on
+            param_grid {dict, list} -- Grid of parameter values or list of bindings
+        
+        Keyword Arguments:
+            observable {str, dict, None} -- Pauli string or weighted sum of them (default: {None})
+            batch_size {int, None} -- Maximal number of bindings in one pass (default: {None})
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> phi = qvantum.Parameter('phi')
+            >>> r = qvantum.Register([qvantum.Qubit(1, 0), qvantum.Qubit(1, 0)])
+            >>> c = qvantum.Circuit([qvantum.Layer([qvantum.Ising(phi)])])
+            >>> c.run_sweep(r, {'phi': [0, 0.5, 1]}, observable='ZZ')
+            array([1., 1., 1.])
+        """
+
+        if isinstance(param_grid, dict):
+            keys = list(param_grid.keys())
+            bindings = [dict(zip(keys, values)) \
+                for values in itertools.product(*[param_grid[key] for key in keys])]
+
+        else:
+            bindings = list(param_grid)
+
+        if batch_size is None:
+            batch_size = max(len(bindings), 1)
+
+        operations = self.get_operations()
+        results = []
+        for start in range(0, len(bindings), batch_size):
+
+            values = bindings[start:start + batch_size]
+            states = numpy.tile(r.get_vector(), (len(values), 1))
+            states = engine.run_operations(states, operations, self.get_circuit_size(), values)
+            if observable is None:
+                results.append(states)
+
+            else:
+                results.append(pauli.pauli_expectation(states, observable))
+
+        if observable is None:
+            return numpy.concatenate(results) if results else \
+                numpy.zeros((0, r.get_state_number()), dtype=complex)
+
+        return numpy.concatenate(results) if results else numpy.zeros(0)
+
+    @check_circuit.gradient_check
+    def gradient(self, r, observable, values, method='adjoint'):
+        """Method to compute the gradient of the expectation value <Ψ|O|Ψ> of an observable with 
+        respect to the symbolic parameters of the circuit, where |Ψ> is the result of the circuit 
+        run on the register with the given parameter values. The register and the gates are not 
+        changed. The result is an ordered dictionary of parameter names and derivatives in the 
+        order of get_parameters().
+
+        With the 'adjoint' method the state is run forward once, then the circuit is walked 
+        backwards with the state and O|Ψ>, so the whole gradient costs about three runs of the 
+        circuit and two extra state vectors. With the 'parameter-shift' method every occurrence 
+        of a parameter is evaluated at shifted angles according to the shift rule of its gate 
+        (two evaluations for rotations, four for Ising), all shifted circuits being one stacked 
+        batch.
+        
+        Arguments:
+            r {register} -- Register which the circuit is applied on
+            observable {str, dict} -- Pauli string or weighted sum of them
+            values {dict} -- Dictionary of parameters (or parameter names) and values
+        
+        Keyword Arguments:
+            method {str} -- 'adjoint' or 'parameter-shift' (default: {'adjoint'})
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> theta = qvantum.Parameter('theta')
+            >>> r = qvantum.Register([qvantum.Qubit(1, 0), qvantum.Qubit(1, 0)])
+            >>> c = qvantum.Circuit([qvantum.Layer([qvantum.RotationY(theta), qvantum.Gate()])])
+            >>> c.gradient(r, 'ZI', {'theta': 0.5})
+            OrderedDict([('theta', -0.47942553860420295)])
+        """
+
+        values = dict((parameter.parameter_name(key), value) for key, value in values.items())
+        if method == 'adjoint':
+            derivatives = self.__adjoint_gradient(r.get_vector(), observable, values)
+
+        else:
+            derivatives = self.__shift_gradient(r.get_vector(), observable, values)
+
+        gradient = collections.OrderedDict()
+        for p in self.get_parameters():
+
+            gradient[p.get_name()] = float(derivatives.get(p.get_name(), 0))
+
+        return gradient
+
+    def __adjoint_gradient(self, vector, observable, values):
+        """Returns the derivatives of the expectation value by adjoint differentiation. The 
+        derivative of a gate occurrence is 2 * Re <λ|dU|φ>, where φ is the state before the gate 
+        and λ is O|Ψ> run backwards to the same point.
+
+        Arguments:
+            vector {numpy.ndarray} -- Amplitudes of the starting register
+            observable {str, dict} -- Pauli string or weighted sum of them
+            values {dict} -- Dictionary of parameter names and values
+        """
+
+        qubit_number = self.get_circuit_size()
+        operations = self.get_operations()
+        matrices = [numpy.asarray(gate.get_bound_matrix(values)) for position, gate in operations]
+        state = vector
+        for (position, gate), matrix in zip(operations, matrices):
+
+            state = engine.apply_matrix(state, matrix, position, qubit_number)
+
+        adjoint = pauli.apply_observable(state, observable)
+        derivatives = {}
+        for (position, gate), matrix in reversed(list(zip(operations, matrices))):
+
+            state = engine.apply_matrix(state, matrix.conjugate().T, position, qubit_number)
+            for p in gate.get_parameters():
+
+                derivative = numpy.asarray(gate.get_derivative_matrix(values, p))
+                value = 2 * numpy.vdot(adjoint, \
+                    engine.apply_matrix(state, derivative, position, qubit_number)).real
+                derivatives[p.get_name()] = derivatives.get(p.get_name(), 0) + value
+
+            adjoint = engine.apply_matrix(adjoint, matrix.conjugate().T, position, qubit_number)
+
+        return derivatives
+
+    def __shift_gradient(self, vector, observable, values):
+        """Returns the derivatives of the expectation value by the parameter-shift rule. For a 
+        gate whose expectation values have the frequencies ω, 2ω, ..., Rω the derivative is
+
+            ω * sum((-1)^(μ-1) / (4R sin^2(x_μ / 2)) * F(θ + x_μ / ω)),  x_μ = (2μ - 1)π / 2R
+
+        for μ = 1, ..., 2R. Every shifted evaluation is a row of one stacked array.
+
+        Arguments:
+            vector {numpy.ndarray} -- Amplitudes of the starting register
+            observable {str, dict} -- Pauli string or weighted sum of them
+            values {dict} -- Dictionary of parameter names and values
+        """
+
+        qubit_number = self.get_circuit_size()
+        operations = self.get_operations()
+        shifts = []
+        for index, (position, gate) in enumerate(operations):
+            for p in gate.get_parameters():
+
+                frequency, number = gate.get_shift_rule()
+                for mu in range(1, 2 * number + 1):
+
+                    x = (2 * mu - 1) * numpy.pi / (2 * number)
+                    shifted = dict(values)
+                    shifted[p.get_name()] = values[p.get_name()] + x / frequency
+                    weight = frequency * (-1) ** (mu - 1) / (4 * number * numpy.sin(x / 2) ** 2)
+                    shifts.append((index, p.get_name(), weight, shifted))
+
+        states = numpy.tile(vector, (len(shifts), 1))
+        for index, (position, gate) in enumerate(operations):
+
+            matrix = numpy.asarray(gate.get_bound_matrix(values))
+            rows = [row for row, shift in enumerate(shifts) if shift[0] == index]
+            if rows:
+                matrix = numpy.tile(matrix, (len(shifts), 1, 1))
+                for row in rows:
+
+                    matrix[row] = numpy.asarray(gate.get_bound_matrix(shifts[row][3]))
+
+            states = engine.apply_matrix(states, matrix, position, qubit_number)
+
+        expectations = pauli.pauli_expectation(states, observable) if shifts else []
+        derivatives = {}
+        for (index, name, weight, shifted), expectation in zip(shifts, expectations):
+
+            derivatives[name] = derivatives.get(name, 0) + weight * expectation
+
+        return derivatives
+
+    @check_circuit.run_noisy_check
+    def run_noisy(self, r, noise_model, trajectories=100, observable=None):
+        """Method to simulate the circuit with noise by quantum trajectories (see the noise 
+        module). The trajectories start from the state of the register and are the rows of one 
+        array, so every gate and channel is applied on all of them at once. The register is not 
+        changed. The result is the (trajectories, 2^n) array of final states or, if an 
+        observable is given, the array of its expectation values per trajectory, whose mean 
+        estimates the noisy expectation value. The final states can be sampled with readout 
+        error by NoiseModel.measure().
+        
+        Arguments:
+            r {register} -- Register which the circuit is applied on
+            noise_model {NoiseModel} -- The noise model
+        
+        Keyword Arguments:
+            trajectories {int} -- Number of trajectories (default: {100})
+            observable {str, dict, None} -- Pauli string or weighted sum of them (default: {None})
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> r = qvantum.Register([qvantum.Qubit(1, 0), qvantum.Qubit(1, 0)])
+            >>> c = qvantum.Circuit([qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()]), \
+            ...     qvantum.Layer([qvantum.CNOT(0, 1)])])
+            >>> model = qvantum.NoiseModel()
+            >>> model.add_gate_noise('Controlled-Not', qvantum.Depolarizing(0.1))
+            >>> c.run_noisy(r, model, trajectories=1000, observable='ZZ').mean()
+            0.754
+            >>> model.measure(c.run_noisy(r, model, trajectories=5))
+            ['00', '11', '11', '00', '01']
+        """
+
+        states = numpy.tile(r.get_vector(), (trajectories, 1))
+        states = noise_model.run(states, list(self.get_layer_list().values()), \
+            self.get_circuit_size())
+        if observable is None:
+            return states
+
+        return pauli.pauli_expectation(states, observable)
@@ -0,0 +1,420 @@
+'''density register class'''
+
+# pylint: disable=E1101, W1401
+
+from . import check_density
+from . import engine
+import numpy
+from . import pauli
+from . import register
+
+class DensityRegister(object):
+    """density register class
+
+    An instance of density register class is a register in a mixed state, described by its
+    density matrix ρ instead of a state vector. A pure register |Ψ> has the density matrix
+    ρ = |Ψ><Ψ|, a mixture of states (e.g. after a qubit is discarded or noise is applied) is a
+    convex combination of such matrices.
+
+    The density matrix is stored as a 2^n x 2^n numpy array. A gate U acting on k neighbouring
+    qubits is applied as ρ -> UρU† with two local kernels of the engine (U on the row index and
+    the complex conjugate of U on the column index), so no 2^n x 2^n operator is built. Circuits
+    can be run on density registers just like on registers.
+
+    The instances of density register class have the following methods:
+
+    - __init__()          - initialize density register
+    - get_qubit_number()  - getter of number of qubits in the register
+    - get_state_number()  - getter of number of possible states
+    - get_states()        - getter of states
+    - get_matrix()        - getter of density matrix
+    - set_matrix()        - setter of density matrix
+    - get_probabilities() - getter of probabilities of states
+    - get_purity()        - getter of purity of the state
+    - apply_gate()        - apply a gate on some qubits
+    - apply_channel()     - apply a quantum channel given by Kraus operators on some qubits
+    - apply_operations()  - apply a list of operations
+    - expectation()       - expectation value of a Pauli string or a sum of them
+    - measure_register()  - measure the whole register
+    - measure_nth_qubit() - measure the n-th qubit
+    - reset()             - reset the n-th qubit to 0
+    - partial_trace()     - reduced density matrix without the n-th qubit
+    - delete_qubit()      - trace out the n-th qubit
+    """
+
+    @check_density.density_init_check
+    def __init__(self, state):
+        """Method to initialize an instance of the density register class. The input is a
+        register, whose pure state is used, or a list of elements in Qubit or Random_Qubit class.
+
+        Arguments:
+            state {register, list} -- Register or list of objects from Qubit or Random_Qubit class
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> d = qvantum.DensityRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> d.get_probabilities()
+            array([0., 1., 0., 0.])
+        """
+
+        if isinstance(state, register.Register):
+            vector = state.get_vector()
+
+        else:
+            vector = numpy.ones(1, dtype=complex)
+            for q in state:
+
+                vector = numpy.kron(vector, \
+                    numpy.array([q.get_alpha(), q.get_beta()], dtype=complex))
+
+        self.__qubit_number = int(len(vector)).bit_length() - 1
+        self.__density_matrix = numpy.outer(vector, vector.conjugate())
+
+    def get_qubit_number(self):
+        """Method to return the number of qubits in the density register.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> d = qvantum.DensityRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> d.get_qubit_number()
+            2
+        """
+
+        return self.__qubit_number
+
+    def get_state_number(self):
+        """Method to return the number of possible states of the density register.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> d = qvantum.DensityRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> d.get_state_number()
+            4
+        """
+
+        return 2 ** self.__qubit_number
+
+    def get_states(self):
+        """Method to return the list of possible states of the density register.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> d = qvantum.DensityRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> d.get_states()
+            ['00', '01', '10', '11']
+        """
+
+        return ['{0:0{1}b}'.format(i, self.__qubit_number) for i in range(self.get_state_number())]
+
+    def get_matrix(self):
+        """Method to return the density matrix as a read-only numpy array view. Use set_matrix()
+        to change it.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> d = qvantum.DensityRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> d.get_matrix()
+            array([[0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j]])
+        """
+
+        view = self.__density_matrix.view()
+        view.flags.writeable = False
+        return view
+
+    @check_density.set_matrix_check
+    def set_matrix(self, matrix):
+        """Method to replace the density matrix. The matrix must be a Hermitian 2^n x 2^n numpy
+        array with trace 1, where n is the number of qubits.
+
+        Arguments:
+            matrix {numpy.ndarray} -- The new density matrix
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import numpy
+            >>> import qvantum
+            >>>
+            >>> d = qvantum.DensityRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> d.set_matrix(numpy.identity(4) / 4)
+            >>> d.get_purity()
+            0.25
+        """
+
+        self.__density_matrix = numpy.array(matrix, dtype=complex)
+
+    def get_probabilities(self):
+        """Method to return the probabilities of the states, i.e. the diagonal of the density
+        matrix, as a numpy array.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> d = qvantum.DensityRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> d.get_probabilities()
+            array([0., 1., 0., 0.])
+        """
+
+        return numpy.clip(numpy.diagonal(self.__density_matrix).real, 0, 1)
+
+    def get_purity(self):
+        """Method to return the purity Tr(ρ^2) of the state. It's 1 for pure states and 1 / 2^n
+        for the maximally mixed state.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> d = qvantum.DensityRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> d.get_purity()
+            1.0
+        """
+
+        return float(numpy.vdot(self.__density_matrix, self.__density_matrix).real)
+
+    def __conjugate(self, matrix, position):
+        """Returns UρU† for a 2^k x 2^k matrix U acting on the qubits position, ...,
+        position + k - 1. The rows of ρ.T are the columns of ρ, so U is applied on them first,
+        then the complex conjugate of U is applied on the rows of Uρ.
+        """
+
+        matrix = numpy.asarray(matrix, dtype=complex)
+        half = engine.apply_matrix(self.__density_matrix.T, matrix, position, \
+            self.__qubit_number).T
+        return engine.apply_matrix(half, matrix.conjugate(), position, self.__qubit_number)
+
+    @check_density.apply_gate_check
+    def apply_gate(self, g, position):
+        """Method to apply a gate on the qubits position, ..., position + k - 1 of the density
+        register, where k is the number of qubits of the gate: ρ -> UρU†.
+
+        Arguments:
+            g {gate} -- The applied gate
+            position {int} -- Index of the first qubit which the gate acts on
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> d = qvantum.DensityRegister([qvantum.Qubit(1, 0), qvantum.Qubit(1, 0)])
+            >>> d.apply_gate(qvantum.Hadamard(), 1)
+            >>> d.get_probabilities()
+            array([0.5, 0.5, 0. , 0. ])
+        """
+
+        self.__density_matrix = self.__conjugate(g.get_matrix(), position)
+
+    @check_density.apply_channel_check
+    def apply_channel(self, kraus_list, position):
+        """Method to apply a quantum channel given by its Kraus operators on the qubits
+        position, ..., position + k - 1 of the density register: ρ -> Σ KρK†. The Kraus
+        operators are 2^k x 2^k matrices with Σ K†K = I.
+
+        Arguments:
+            kraus_list {list} -- List of Kraus operators (numpy arrays or matrices)
+            position {int} -- Index of the first qubit which the channel acts on
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import numpy
+            >>> import qvantum
+            >>>
+            >>> d = qvantum.DensityRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> p = 0.25
+            >>> d.apply_channel([numpy.sqrt(1 - p) * numpy.identity(2), \\
+            ...     numpy.sqrt(p) * numpy.array([[1, 0], [0, -1]])], 1)
+            >>> d.get_purity()
+            1.0
+        """
+
+        result = numpy.zeros(self.__density_matrix.shape, dtype=complex)
+        for kraus in kraus_list:
+
+            result += self.__conjugate(kraus, position)
+
+        self.__density_matrix = result
+
+    def apply_operations(self, operations):
+        """Method to apply a list of (position, gate) operations in order (see the engine
+        module). It's used when a circuit is run on the density register. Identity gates are
+        skipped.
+
+        Arguments:
+            operations {list} -- List of (position, gate) pairs
+        """
+
+        for position, g in operations:
+
+            if not engine.is_identity(g):
+                self.__density_matrix = self.__conjugate(g.get_matrix(), position)
+
+    @check_density.expectation_check
+    def expectation(self, observable):
+        """Method to return the expectation value Tr(ρO) of an observable which is a Pauli
+        string or a weighted sum of Pauli strings. The density register is not changed.
+
+        Arguments:
+            observable {str, dict} -- Pauli string or dictionary of Pauli strings and weights
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> d = qvantum.DensityRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> d.expectation({'ZI': 0.5, 'IZ': 2})
+            -1.5
+        """
+
+        product = pauli.apply_observable(self.__density_matrix.T, observable)
+        return float(numpy.trace(product).real)
+
+    def __split(self, nth):
+        """Returns the density matrix as a (2^nth, 2, 2^(n-nth-1), 2^nth, 2, 2^(n-nth-1)) shaped
+        view, where the axes 1 and 4 belong to the n-th qubit.
+        """
+
+        shape = (2 ** nth, 2, 2 ** (self.__qubit_number - nth - 1))
+        return self.__density_matrix.reshape(shape + shape)
+
+    def measure_register(self):
+        """Method to perform a measurement on the whole density register and return the
+        measured state. The density register collapses onto the measured state.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> d = qvantum.DensityRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> d.measure_register()
+            '01'
+        """
+
+        probs = self.get_probabilities()
+        index = int(numpy.random.choice(len(probs), p=probs / numpy.sum(probs)))
+        self.__density_matrix = numpy.zeros(self.__density_matrix.shape, dtype=complex)
+        self.__density_matrix[index, index] = 1
+
+        return '{0:0{1}b}'.format(index, self.__qubit_number)
+
+    @check_density.nth_check
+    def measure_nth_qubit(self, nth):
+        """Method to perform a measurement on the n-th qubit of the density register and return
+        the result (0 or 1). The density matrix is projected onto the result and renormalized.
+
+        Arguments:
+            nth {int} -- Number of n-th qubit
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> d = qvantum.DensityRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> d.measure_nth_qubit(1)
+            1
+        """
+
+        tensor = self.__split(nth)
+        prob0 = numpy.trace(tensor[:, 0, :, :, 0, :].reshape( \
+            self.get_state_number() // 2, self.get_state_number() // 2)).real
+        prob0 = min(max(prob0, 0), 1)
+        result = int(numpy.random.choice([0, 1], p=[prob0, 1 - prob0]))
+
+        tensor[:, 1 - result, :, :, :, :] = 0
+        tensor[:, :, :, :, 1 - result, :] = 0
+        tensor /= prob0 if result == 0 else 1 - prob0
+
+        return result
+
+    @check_density.nth_check
+    def reset(self, nth):
+        """Method to reset the n-th qubit of the density register to 0 without reading it, i.e.
+        to apply the channel with the Kraus operators |0><0| and |0><1| on the qubit. The other
+        qubits are not changed.
+
+        Arguments:
+            nth {int} -- Number of n-th qubit
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> d = qvantum.DensityRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> d.reset(1)
+            >>> d.get_probabilities()
+            array([1., 0., 0., 0.])
+        """
+
+        tensor = self.__split(nth)
+        tensor[:, 0, :, :, 0, :] += tensor[:, 1, :, :, 1, :]
+        tensor[:, 1, :, :, :, :] = 0
+        tensor[:, :, :, :, 1, :] = 0
+
+    @check_density.nth_check
+    def partial_trace(self, nth):
+        """Method to return the reduced density matrix of the density register after tracing
+        out the n-th qubit. The density register itself is not changed. The result is a
+        2^(n-1) x 2^(n-1) sized numpy array.
+
+        Arguments:
+            nth {int} -- Number of n-th qubit
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> d = qvantum.DensityRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> d.partial_trace(0)
+            array([[0.+0.j, 0.+0.j],
+                   [0.+0.j, 1.+0.j]])
+        """
+
+        size = self.get_state_number() // 2
+        return numpy.einsum('aibcid->abcd', self.__split(nth)).reshape(size, size)
+
+    @check_density.delete_qubit_check
+    def delete_qubit(self, nth):
+        """Method to discard the n-th qubit of the density register, i.e. to replace the density
+        matrix by its partial trace over the qubit. Unlike deleting a qubit from a pure register,
+        it's exact for entangled qubits too: the remaining qubits are left in a mixed state.
+
+        Arguments:
+            nth {int} -- Number of n-th qubit
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> d = qvantum.DensityRegister([qvantum.Qubit(1, 0), qvantum.Qubit(1, 0)])
+            >>> d.apply_gate(qvantum.Hadamard(), 0)
+            >>> d.apply_gate(qvantum.CNOT(0, 1), 0)
+            >>> d.delete_qubit(1)
+            >>> d.get_purity()
+            0.5
+        """
+
+        self.__density_matrix = self.partial_trace(nth)
+        self.__qubit_number = self.__qubit_number - 1
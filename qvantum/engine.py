@@ -0,0 +1,190 @@
+'''state vector engine
+
+The functions of this module apply gates on amplitude arrays locally: a gate acting on k
+neighbouring qubits is applied as a 2^k x 2^k matrix on the corresponding axis of the
+amplitudes, so the 2^n x 2^n matrix of a layer is never built. Every function works along the
+last axis of the array, so a stack of state vectors (one row per state) is processed at once.
+
+A circuit is executed as a list of operations. An operation is a (position, gate) pair where the
+position is the index of the first qubit which the gate acts on. Identity gates (the placeholders
+of the idle qubits and any other gate whose matrix is the identity) are skipped, so a layer of
+one Hadamard and many identities costs one single qubit pass over the amplitudes.
+
+The following functions are the engine related functions in the package:
+
+- gate_width()         - number of qubits of a gate
+- is_identity()        - check whether a gate is an identity gate
+- layer_operations()   - operations of a layer
+- circuit_operations() - operations of a list of layers
+- light_cone()         - operations in the backward light cone of some qubits
+- apply_matrix()       - apply a matrix (or one matrix per state) on some qubits
+- run_operations()     - apply a list of operations
+'''
+
+# pylint: disable=E1101, W1401
+
+import numpy
+
+def gate_width(gate):
+    """Returns the number of qubits which the gate acts on.
+
+    Arguments:
+        gate {gate} -- Instance of Gate class
+    """
+
+    return int(gate.get_size()).bit_length() - 1
+
+def is_identity(gate):
+    """Returns whether the gate is an identity gate: a gate without symbolic parameters whose
+    matrix is the identity matrix.
+
+    Arguments:
+        gate {gate} -- Instance of Gate class
+    """
+
+    if gate.get_parameters():
+        return False
+
+    matrix = gate.get_matrix()
+    return numpy.array_equal(matrix, numpy.identity(matrix.shape[0]))
+
+def layer_operations(layer):
+    """This function returns the operations of a layer as a list of (position, gate) pairs.
+
+    Arguments:
+        layer {layer} -- Instance of Layer class
+    """
+
+    operations = []
+    position = 0
+    for gate in layer.get_gate_list().values():
+
+        operations.append((position, gate))
+        position = position + gate_width(gate)
+
+    return operations
+
+def circuit_operations(layer_list):
+    """This function returns the operations of the layers in order as one list of (position,
+    gate) pairs.
+
+    Arguments:
+        layer_list {list} -- List of Layer objects
+    """
+
+    operations = []
+    for layer in layer_list:
+
+        operations.extend(layer_operations(layer))
+
+    return operations
+
+def light_cone(operations, qubits):
+    """This function returns the operations which are in the backward light cone of the given
+    qubits, in order. The operations are visited backwards: an operation is kept if it acts on a
+    qubit of the light cone and then every qubit of the operation belongs to the light cone. The
+    other operations can't change the state of the given qubits (their reduced density matrix),
+    so they can be skipped if only these qubits are measured or observed.
+
+    Arguments:
+        operations {list} -- List of (position, gate) pairs
+        qubits {list} -- Indices of the observed qubits
+
+    Examples:
+        >>> import qvantum
+        >>> import qvantum.engine
+        >>>
+        >>> h = qvantum.Hadamard()
+        >>> cnot = qvantum.CNOT(0, 1)
+        >>> operations = [(0, h), (2, h), (0, cnot), (2, cnot)]
+        >>> qvantum.engine.light_cone(operations, [1]) == [(0, h), (0, cnot)]
+        True
+    """
+
+    cone = set(qubits)
+    kept = []
+    for position, gate in reversed(operations):
+
+        wires = range(position, position + gate_width(gate))
+        if not is_identity(gate) and any(wire in cone for wire in wires):
+            cone.update(wires)
+            kept.append((position, gate))
+
+    kept.reverse()
+    return kept
+
+def apply_matrix(states, matrix, position, qubit_number):
+    """This function applies a 2^k x 2^k matrix on the qubits position, ..., position + k - 1
+    and returns the result. The matrix can also be a stack of matrices with one matrix for every
+    row of the states. The input array isn't changed.
+
+    Arguments:
+        states {numpy.ndarray} -- Amplitudes, the last axis is the state axis
+        matrix {numpy.ndarray} -- Matrix or (batch, 2^k, 2^k) stack of matrices
+        position {int} -- Index of the first qubit which the matrix acts on
+        qubit_number {int} -- Number of qubits
+
+    Examples:
+        >>> import numpy
+        >>> import qvantum
+        >>> import qvantum.engine
+        >>>
+        >>> states = numpy.array([1, 0, 0, 0], dtype=complex)
+        >>> qvantum.engine.apply_matrix(states, qvantum.Hadamard().get_matrix(), 1, 2)
+        array([0.70710678+0.j, 0.70710678+0.j, 0.        +0.j, 0.        +0.j])
+    """
+
+    matrix = numpy.asarray(matrix, dtype=complex)
+    size = matrix.shape[-1]
+    width = size.bit_length() - 1
+    shape = states.shape
+    batch = int(numpy.prod(shape[:-1], dtype=int))
+    tensor = states.reshape(batch, 2 ** position, size, 2 ** (qubit_number - position - width))
+
+    if matrix.ndim == 3:
+        result = numpy.einsum('bij,bajc->baic', matrix, tensor)
+
+    elif not numpy.count_nonzero(matrix - numpy.diag(numpy.diagonal(matrix))):
+        result = tensor * numpy.diagonal(matrix)[:, None]
+
+    elif size == 2:
+        result = numpy.empty(tensor.shape, dtype=complex)
+        result[:, :, 0, :] = matrix[0, 0] * tensor[:, :, 0, :] + matrix[0, 1] * tensor[:, :, 1, :]
+        result[:, :, 1, :] = matrix[1, 0] * tensor[:, :, 0, :] + matrix[1, 1] * tensor[:, :, 1, :]
+
+    else:
+        result = numpy.moveaxis(numpy.tensordot(matrix, tensor, axes=([1], [2])), 0, 2)
+
+    return result.reshape(shape)
+
+def run_operations(states, operations, qubit_number, values=None):
+    """This function applies the operations on the amplitudes in order and returns the result.
+    Identity gates are skipped. If values is a list of parameter dictionaries (one for every row
+    of the states), the parameterized gates are applied with one matrix per row. The input array
+    isn't changed.
+
+    Arguments:
+        states {numpy.ndarray} -- Amplitudes, the last axis is the state axis
+        operations {list} -- List of (position, gate) pairs
+        qubit_number {int} -- Number of qubits
+
+    Keyword Arguments:
+        values {list, None} -- List of parameter dictionaries, one for every row (default: {None})
+    """
+
+    states = numpy.asarray(states, dtype=complex)
+    for position, gate in operations:
+
+        if is_identity(gate):
+            continue
+
+        if values is not None and gate.get_parameters():
+            matrix = numpy.stack([numpy.asarray(gate.get_bound_matrix(value)) \
+                for value in values])
+
+        else:
+            matrix = gate.get_matrix()
+
+        states = apply_matrix(states, matrix, position, qubit_number)
+
+    return states
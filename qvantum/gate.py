@@ -3,11 +3,176 @@
 # pylint: disable=E1101, W1401
 
 from . import check_gate
+import collections
+import hashlib
 import numpy
+from . import parameter
 from . import qubit
 from . import register
 import unicodedata
 
+_CACHE_SIZE = 128
+_power_cache = collections.OrderedDict()
+_eigen_cache = collections.OrderedDict()
+
+def _cache_get(cache, key):
+    """Returns the cached value of the key (and marks it as recently used) or None.
+
+    Arguments:
+        cache {collections.OrderedDict} -- The cache
+        key {} -- The key
+    """
+
+    if key not in cache:
+        return None
+
+    value = cache.pop(key)
+    cache[key] = value
+    return value
+
+def _cache_put(cache, key, value):
+    """Stores the value in the cache and drops the least recently used entry if the cache is 
+    full.
+
+    Arguments:
+        cache {collections.OrderedDict} -- The cache
+        key {} -- The key
+        value {} -- The value
+    """
+
+    cache[key] = value
+    if len(cache) > _CACHE_SIZE:
+        cache.popitem(last=False)
+
+def _matrix_key(matrix):
+    """Returns a hashable digest of the content of a matrix.
+
+    Arguments:
+        matrix {numpy.ndarray} -- The matrix
+    """
+
+    array = numpy.ascontiguousarray(matrix)
+    return (array.shape, array.dtype.str, hashlib.sha1(array.tobytes()).hexdigest())
+
+def _permutation(matrix):
+    """Returns the permutation of a permutation matrix as an array (the n-th column has its 1 in 
+    the row permutation[n]) or None if the matrix is not a permutation matrix.
+
+    Arguments:
+        matrix {numpy.ndarray} -- The matrix
+    """
+
+    array = numpy.asarray(matrix)
+    if numpy.count_nonzero(array) != len(array) or numpy.any((array != 0) & (array != 1)):
+        return None
+
+    permutation = numpy.argmax(array, axis=0)
+    if len(numpy.unique(permutation)) != len(array):
+        return None
+
+    return permutation
+
+def _permutation_power(permutation, power):
+    """Returns the integer power of a permutation by rotating its cycles.
+
+    Arguments:
+        permutation {numpy.ndarray} -- The permutation
+        power {int} -- The exponent
+    """
+
+    result = numpy.empty(len(permutation), dtype=int)
+    visited = numpy.zeros(len(permutation), dtype=bool)
+    for start in range(len(permutation)):
+
+        if visited[start]:
+            continue
+
+        cycle = [start]
+        visited[start] = True
+        while permutation[cycle[-1]] != start:
+
+            cycle.append(permutation[cycle[-1]])
+            visited[cycle[-1]] = True
+
+        for i, element in enumerate(cycle):
+
+            result[element] = cycle[(i + power) % len(cycle)]
+
+    return result
+
+def _eigen(matrix):
+    """Returns the cached eigendecomposition (eigenvalues, eigenvectors) of a unitary matrix. 
+    The Hermitian and the anti-Hermitian parts of a unitary matrix commute, so the eigenvectors 
+    of a generic real combination of them are orthonormal eigenvectors of the matrix. If the 
+    combination happens to be degenerate, the general eigensolver is used.
+
+    Arguments:
+        matrix {numpy.ndarray} -- The unitary matrix
+    """
+
+    key = _matrix_key(matrix)
+    decomposition = _cache_get(_eigen_cache, key)
+    if decomposition is None:
+        array = numpy.asarray(matrix, dtype=complex)
+        hermitian = (array + array.conjugate().T) / 2
+        antihermitian = (array - array.conjugate().T) / complex(0, 2)
+        vectors = numpy.linalg.eigh(hermitian + 0.6180339887498949 * antihermitian)[1]
+        values = numpy.einsum('ij,ik,kj->j', vectors.conjugate(), array, vectors)
+        if numpy.allclose(numpy.dot(array, vectors), vectors * values):
+            decomposition = (values, vectors, vectors.conjugate().T)
+
+        else:
+            values, vectors = numpy.linalg.eig(array)
+            decomposition = (values, vectors, numpy.linalg.inv(vectors))
+
+        _cache_put(_eigen_cache, key, decomposition)
+
+    return decomposition
+
+def _matrix_power(matrix, power):
+    """Returns the power of a unitary matrix, memoized by the matrix and the exponent. Diagonal 
+    matrices are raised elementwise, permutation matrices are raised to integer powers by their 
+    cycles, other matrices are raised to integer powers by repeated squaring and to real powers 
+    through their eigendecomposition (principal branch of the eigenvalues).
+
+    Arguments:
+        matrix {numpy.matrix} -- The unitary matrix
+        power {int, float} -- The exponent
+    """
+
+    if isinstance(power, float) and power.is_integer():
+        power = int(power)
+
+    key = (_matrix_key(matrix), power)
+    result = _cache_get(_power_cache, key)
+    if result is not None:
+        return result.copy()
+
+    array = numpy.asarray(matrix)
+    diagonal = numpy.diagonal(array)
+    permutation = _permutation(array) if isinstance(power, int) else None
+    if not numpy.count_nonzero(array - numpy.diag(diagonal)):
+        if isinstance(power, int) and power >= 0:
+            result = numpy.matrix(numpy.diag(diagonal ** power))
+
+        else:
+            result = numpy.matrix(numpy.diag(diagonal.astype(complex) ** power))
+
+    elif permutation is not None:
+        result = numpy.zeros(array.shape, dtype=array.dtype)
+        result[_permutation_power(permutation, power), numpy.arange(len(array))] = 1
+        result = numpy.matrix(result)
+
+    elif isinstance(power, int):
+        result = numpy.linalg.matrix_power(matrix, power)
+
+    else:
+        values, vectors, inverse = _eigen(array)
+        result = numpy.matrix(numpy.dot(vectors * values ** power, inverse))
+
+    _cache_put(_power_cache, key, result)
+    return result.copy()
+
 class Gate(object):
     """gate class
 
@@ -35,6 +200,12 @@ class Gate(object):
     - set_name()      - setter of name of gate
     - set_matrix()    - setter of matrix of gate
     - power()         - raise the matrix of gate to the given power
+    - get_parameters() - getter of symbolic parameters of gate
+    - get_bound_matrix() - getter of matrix of gate for the given parameter values
+    - bind()          - bind values to the symbolic parameters of gate
+    - get_derivative_matrix() - derivative of matrix of gate with respect to a parameter
+    - get_shift_rule() - parameter-shift rule of gate
+    - get_inverse()   - inverse (adjoint) of gate
     """
 
     def __init__(self):
@@ -84,11 +255,11 @@ class Gate(object):
         """
 
         if isinstance(qr, (qubit.Qubit, qubit.Random_Qubit)) and self.get_size() == 2:
-            vector = self.__gate_matrix * qr.ket()
+            vector = self.get_matrix() * qr.ket()
             qr.set_amplitudes(vector.item(0), vector.item(1))
         
         elif isinstance(qr, register.Register) and self.get_size() == qr.get_state_number():
-            vector = numpy.asarray(self.__gate_matrix * qr.ket()).flatten()
+            vector = numpy.asarray(self.get_matrix() * qr.ket()).flatten()
             qr.set_amplitudes(list(vector))
         
         else:
@@ -193,10 +364,13 @@ class Gate(object):
     @check_gate.power_check
     def power(self, power):
         """Method to raise the unitary matrix of the gate to the given power and overwrites the 
-        original matrix of the gate with the results matrix.
+        original matrix of the gate with the results matrix. The power can be any real number, 
+        non-integer powers use the principal branch of the eigenvalues. Diagonal gates are 
+        raised elementwise, permutation gates (e.g. Toffoli) by their cycles and other gates 
+        through a cached eigendecomposition, so repeated powers of the same gate are cheap.
         
         Arguments:
-            power {int} -- The power which the gate is raised on
+            power {int, float} -- The power which the gate is raised on
         
         Raises:
             TypeError
@@ -224,9 +398,144 @@ class Gate(object):
                     [0, 0, 0, 0, 0, 1, 0, 0],
                     [0, 0, 0, 0, 0, 0, 1, 0],
                     [0, 0, 0, 0, 0, 0, 0, 1]])
+            >>> s = qvantum.PauliX()
+            >>> s.power(0.5)
+            >>> s.get_matrix()
+            matrix([[0.5+0.5j, 0.5-0.5j],
+                    [0.5-0.5j, 0.5+0.5j]])
+        """
+
+        self.__gate_matrix = _matrix_power(self.__gate_matrix, power)
+
+    def _update_matrix(self, matrix):
+        """Replaces the matrix of the gate without checking it. It's used by the parameterized 
+        gates whose matrices are unitary by construction, so rebinding a parameter doesn't pay 
+        for the unitary check.
+        """
+
+        self.__gate_matrix = matrix
+
+    def get_parameters(self):
+        """Method to return the list of symbolic parameters (Parameter objects) of the gate. A 
+        gate without parameters returns an empty list.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.Hadamard().get_parameters()
+            []
+            >>> qvantum.Ising(qvantum.Parameter('phi')).get_parameters()
+            [Parameter('phi')]
         """
 
-        self.__gate_matrix = numpy.linalg.matrix_power(self.__gate_matrix, power)
+        return []
+
+    @check_gate.values_check
+    def get_bound_matrix(self, values):
+        """Method to return the matrix of the gate for the given parameter values without 
+        changing the gate. For a gate without parameters it's the matrix of the gate.
+        
+        Arguments:
+            values {dict} -- Dictionary of parameters (or parameter names) and values
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> g = qvantum.Ising(qvantum.Parameter('phi'))
+            >>> g.get_bound_matrix({'phi': 0})
+            matrix([[0.70710678+0.j        , 0.        +0.j        , 0.        +0.j        , 0.        -0.70710678j],
+                    [0.        +0.j        , 0.70710678+0.j        , 0.        -0.70710678j, 0.        +0.j        ],
+                    [0.        +0.j        , 0.        -0.70710678j, 0.70710678+0.j        , 0.        +0.j        ],
+                    [0.        -0.70710678j, 0.        +0.j        , 0.        +0.j        , 0.70710678+0.j        ]])
+        """
+
+        return self.get_matrix()
+
+    @check_gate.values_check
+    def bind(self, values):
+        """Method to bind values to the symbolic parameters of the gate, i.e. to recompute the 
+        matrix of the gate. Parameters which are not in the dictionary keep their values. For a 
+        gate without parameters it does nothing.
+        
+        Arguments:
+            values {dict} -- Dictionary of parameters (or parameter names) and values
+        
+        Raises:
+            TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> g = qvantum.Ising(qvantum.Parameter('phi'))
+            >>> g.bind({'phi': 0.5})
+        """
+
+        return None
+
+    @check_gate.derivative_check
+    def get_derivative_matrix(self, values, param):
+        """Method to return the derivative of the matrix of the gate with respect to a symbolic 
+        parameter at the given parameter values. For a gate which doesn't use the parameter it's 
+        the zero matrix.
+        
+        Arguments:
+            values {dict} -- Dictionary of parameters (or parameter names) and values
+            param {Parameter, str} -- The parameter (or its name)
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.Hadamard().get_derivative_matrix({}, 'phi')
+            matrix([[0.+0.j, 0.+0.j],
+                    [0.+0.j, 0.+0.j]])
+        """
+
+        return numpy.matrix(numpy.zeros((self.get_size(), self.get_size()), dtype=complex))
+
+    def get_shift_rule(self):
+        """Method to return the parameter-shift rule of the gate as a (frequency, number) pair: 
+        the expectation value of an observable is a trigonometric polynomial of the parameter 
+        with the frequencies frequency, 2 * frequency, ..., number * frequency. A gate without 
+        parameters returns None.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.Hadamard().get_shift_rule()
+            >>> qvantum.RotationX(qvantum.Parameter('theta')).get_shift_rule()
+            (1, 1)
+        """
+
+        return None
+
+    def get_inverse(self):
+        """Method to return the inverse (adjoint) of the gate without any matrix work. A gate 
+        without parameters whose matrix is Hermitian is its own inverse, so the gate itself is 
+        returned, otherwise a Dagger gate wrapping the gate, whose conjugate transpose matrix is 
+        cached and follows the parameters of the gate.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> h = qvantum.Hadamard()
+            >>> h.get_inverse() is h
+            True
+            >>> qvantum.Phase().get_inverse().get_name()
+            'Phase-Dagger'
+        """
+
+        if not self.get_parameters():
+            matrix = self.get_matrix()
+            if numpy.array_equal(matrix, matrix.conjugate().T):
+                return self
+
+        return Dagger(self)
 
 class Hadamard(Gate):
     """This class is an inherited class from the Gate class. It’s the implementation of the 
@@ -814,7 +1123,8 @@ class ControlledPhase(Gate):
 
 class Ising(Gate):
     """This class is an inherited class from the Gate class. It’s the implementation of the 
-    Ising gate. Its unitary matrix:
+    Ising gate. The angle can be a number or a symbolic Parameter, in the latter case the matrix 
+    is computed when a value is bound to the parameter. Its unitary matrix:
     
     """
 
@@ -823,7 +1133,7 @@ class Ising(Gate):
         """Method to initialize Ising gate.
 
         Arguments:
-            phi {int, float} -- The used angle
+            phi {int, float, Parameter} -- The used angle
         
         Raises:
             TypeError
@@ -831,24 +1141,183 @@ class Ising(Gate):
         Examples:
             >>> import qvantum
             >>>
-            >>> h = qvantum.Ising(1)
+            >>> h = qvantum.Ising(0.5)
+            >>> phi = qvantum.Parameter('phi')
+            >>> hp = qvantum.Ising(phi)
+            >>> hp.bind({'phi': 0.5})
         """
 
         Gate.__init__(self)
         # super().set_name('Ising')
-        # super().set_matrix(numpy.matrix([
-        #     [1, 0, 0, complex(0, -1) * complex(numpy.cos(phi), numpy.sin(phi))],
-        #     [0, 1, complex(0, -1), 0],
-        #     [0, complex(0, -1), 1, 0],
-        #     [complex(0, -1) * complex(numpy.cos(-1 * phi), numpy.sin(-1 * phi)), 0, 0, 1]
-        #     ]))
         super(Ising, self).set_name('Ising')
-        super(Ising, self).set_matrix(numpy.matrix([
+        self.__phi = phi
+        if isinstance(phi, parameter.Parameter):
+            self.__value = None
+            self._update_matrix(Ising.ising_matrix(0))
+
+        else:
+            self.__value = phi
+            self._update_matrix(Ising.ising_matrix(phi))
+
+    @staticmethod
+    def ising_matrix(phi):
+        """Returns the unitary matrix of the Ising gate for the given angle.
+
+        Arguments:
+            phi {int, float} -- The used angle
+        """
+
+        return numpy.matrix([
             [1, 0, 0, complex(0, -1) * complex(numpy.cos(phi), numpy.sin(phi))],
             [0, 1, complex(0, -1), 0],
             [0, complex(0, -1), 1, 0],
             [complex(0, -1) * complex(numpy.cos(-1 * phi), numpy.sin(-1 * phi)), 0, 0, 1]
-            ]))
+            ]) / numpy.sqrt(2)
+
+    def get_phi(self):
+        """Getter of the angle of the Ising gate. It's a number or a Parameter object.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.Ising(0.5).get_phi()
+            0.5
+        """
+
+        return self.__phi
+
+    def get_value(self):
+        """Getter of the value of the angle of the Ising gate. It's None if the angle is a 
+        parameter without bound value.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> g = qvantum.Ising(qvantum.Parameter('phi'))
+            >>> g.get_value()
+            >>> g.bind({'phi': 0.5})
+            >>> g.get_value()
+            0.5
+        """
+
+        return self.__value
+
+    def get_matrix(self):
+        """Method to return the unitary matrix of the gate. If the angle is a parameter without 
+        bound value, ValueError is raised.
+
+        Raises:
+            ValueError
+        """
+
+        if self.__value is None:
+            raise ValueError('Unbound parameter! Bind a value to ' + repr(self.__phi) + \
+                ' before using the matrix of the gate.')
+
+        return super(Ising, self).get_matrix()
+
+    def get_parameters(self):
+        """Method to return the list of symbolic parameters of the Ising gate.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.Ising(qvantum.Parameter('phi')).get_parameters()
+            [Parameter('phi')]
+        """
+
+        if isinstance(self.__phi, parameter.Parameter):
+            return [self.__phi]
+
+        return []
+
+    @check_gate.values_check
+    def get_bound_matrix(self, values):
+        """Method to return the matrix of the Ising gate for the given parameter values without 
+        changing the gate.
+        
+        Arguments:
+            values {dict} -- Dictionary of parameters (or parameter names) and values
+        
+        Raises:
+            ValueError, TypeError
+        """
+
+        if isinstance(self.__phi, parameter.Parameter):
+            value = self.__phi.resolve(values)
+            if value is not None:
+                return Ising.ising_matrix(value)
+
+        return self.get_matrix()
+
+    @check_gate.values_check
+    def bind(self, values):
+        """Method to bind a value to the angle of the Ising gate. Only the 4x4 matrix of the gate 
+        is recomputed.
+        
+        Arguments:
+            values {dict} -- Dictionary of parameters (or parameter names) and values
+        
+        Raises:
+            TypeError
+        """
+
+        if isinstance(self.__phi, parameter.Parameter):
+            value = self.__phi.resolve(values)
+            if value is not None:
+                self.__value = value
+                self._update_matrix(Ising.ising_matrix(value))
+
+    @check_gate.derivative_check
+    def get_derivative_matrix(self, values, param):
+        """Method to return the derivative of the matrix of the Ising gate with respect to the 
+        parameter at the given parameter values. Only the two corner elements depend on the 
+        angle.
+        
+        Arguments:
+            values {dict} -- Dictionary of parameters (or parameter names) and values
+            param {Parameter, str} -- The parameter (or its name)
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> g = qvantum.Ising(qvantum.Parameter('phi'))
+            >>> g.get_derivative_matrix({'phi': 0}, 'phi')
+            matrix([[0.        +0.j, 0.        +0.j, 0.        +0.j, 0.70710678+0.j],
+                    [0.        +0.j, 0.        +0.j, 0.        +0.j, 0.        +0.j],
+                    [0.        +0.j, 0.        +0.j, 0.        +0.j, 0.        +0.j],
+                   [-0.70710678+0.j, 0.        +0.j, 0.        +0.j, 0.        +0.j]])
+        """
+
+        derivative = numpy.matrix(numpy.zeros((4, 4), dtype=complex))
+        if not (isinstance(self.__phi, parameter.Parameter) and \
+            self.__phi.get_name() == parameter.parameter_name(param)):
+            return derivative
+
+        matrix = self.get_bound_matrix(values)
+        derivative[0, 3] = complex(0, 1) * matrix[0, 3]
+        derivative[3, 0] = complex(0, -1) * matrix[3, 0]
+        return derivative
+
+    def get_shift_rule(self):
+        """Method to return the parameter-shift rule of the Ising gate. The corner elements of 
+        the matrix are proportional to exp(i * phi) and exp(-i * phi), so the expectation values 
+        have the frequencies 1 and 2.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.Ising(qvantum.Parameter('phi')).get_shift_rule()
+            (1, 2)
+        """
+
+        if isinstance(self.__phi, parameter.Parameter):
+            return (1, 2)
+
+        return None
 
     def set_name(self, name):
         """Setter of name of Ising gate. Always raises BaseException.
@@ -868,6 +1337,306 @@ class Ising(Gate):
 
         raise BaseException('Can\'t change the matrix of object in Ising class.')
 
+class Rotation(Gate):
+    """This class is an inherited class from the Gate class. It’s the implementation of the 
+    rotation gates around the X, Y or Z axis of the Bloch sphere. The angle can be a number or a 
+    symbolic Parameter, in the latter case the matrix is computed when a value is bound to the 
+    parameter. Its unitary matrix with the Pauli matrix P of the axis:
+
+    exp(-i * theta / 2 * P) = cos(theta / 2) * I - i * sin(theta / 2) * P
+    """
+
+    __pauli_matrices = {
+        'X': numpy.array([[0, 1], [1, 0]], dtype=complex),
+        'Y': numpy.array([[0, complex(0, -1)], [complex(0, 1), 0]], dtype=complex),
+        'Z': numpy.array([[1, 0], [0, -1]], dtype=complex)
+        }
+
+    @check_gate.Rotation_check
+    def __init__(self, axis, theta):
+        """Method to initialize rotation gate.
+
+        Arguments:
+            axis {str} -- Axis of the rotation: 'X', 'Y' or 'Z'
+            theta {int, float, Parameter} -- The used angle
+        
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> rx = qvantum.Rotation('X', 0.5)
+            >>> ry = qvantum.Rotation('Y', qvantum.Parameter('theta'))
+        """
+
+        Gate.__init__(self)
+        super(Rotation, self).set_name('Rotation-' + axis)
+        self.__axis = axis
+        self.__theta = theta
+        if isinstance(theta, parameter.Parameter):
+            self.__value = None
+            self._update_matrix(Rotation.rotation_matrix(axis, 0))
+
+        else:
+            self.__value = theta
+            self._update_matrix(Rotation.rotation_matrix(axis, theta))
+
+    @staticmethod
+    def rotation_matrix(axis, theta):
+        """Returns the unitary matrix of the rotation gate for the given axis and angle.
+
+        Arguments:
+            axis {str} -- Axis of the rotation: 'X', 'Y' or 'Z'
+            theta {int, float} -- The used angle
+        """
+
+        return numpy.matrix(numpy.cos(theta / 2.0) * numpy.identity(2, dtype=complex) + \
+            complex(0, -1) * numpy.sin(theta / 2.0) * Rotation.__pauli_matrices[axis])
+
+    def get_axis(self):
+        """Getter of the axis of the rotation gate.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.RotationY(0.5).get_axis()
+            'Y'
+        """
+
+        return self.__axis
+
+    def get_theta(self):
+        """Getter of the angle of the rotation gate. It's a number or a Parameter object.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.RotationY(0.5).get_theta()
+            0.5
+        """
+
+        return self.__theta
+
+    def get_value(self):
+        """Getter of the value of the angle of the rotation gate. It's None if the angle is a 
+        parameter without bound value.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> g = qvantum.RotationY(qvantum.Parameter('theta'))
+            >>> g.get_value()
+            >>> g.bind({'theta': 0.5})
+            >>> g.get_value()
+            0.5
+        """
+
+        return self.__value
+
+    def get_matrix(self):
+        """Method to return the unitary matrix of the gate. If the angle is a parameter without 
+        bound value, ValueError is raised.
+
+        Raises:
+            ValueError
+        """
+
+        if self.__value is None:
+            raise ValueError('Unbound parameter! Bind a value to ' + repr(self.__theta) + \
+                ' before using the matrix of the gate.')
+
+        return super(Rotation, self).get_matrix()
+
+    def get_parameters(self):
+        """Method to return the list of symbolic parameters of the rotation gate.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.RotationZ(qvantum.Parameter('theta')).get_parameters()
+            [Parameter('theta')]
+        """
+
+        if isinstance(self.__theta, parameter.Parameter):
+            return [self.__theta]
+
+        return []
+
+    @check_gate.values_check
+    def get_bound_matrix(self, values):
+        """Method to return the matrix of the rotation gate for the given parameter values 
+        without changing the gate.
+        
+        Arguments:
+            values {dict} -- Dictionary of parameters (or parameter names) and values
+        
+        Raises:
+            ValueError, TypeError
+        """
+
+        if isinstance(self.__theta, parameter.Parameter):
+            value = self.__theta.resolve(values)
+            if value is not None:
+                return Rotation.rotation_matrix(self.__axis, value)
+
+        return self.get_matrix()
+
+    @check_gate.values_check
+    def bind(self, values):
+        """Method to bind a value to the angle of the rotation gate. Only the 2x2 matrix of the 
+        gate is recomputed.
+        
+        Arguments:
+            values {dict} -- Dictionary of parameters (or parameter names) and values
+        
+        Raises:
+            TypeError
+        """
+
+        if isinstance(self.__theta, parameter.Parameter):
+            value = self.__theta.resolve(values)
+            if value is not None:
+                self.__value = value
+                self._update_matrix(Rotation.rotation_matrix(self.__axis, value))
+
+    @check_gate.derivative_check
+    def get_derivative_matrix(self, values, param):
+        """Method to return the derivative of the matrix of the rotation gate with respect to the 
+        parameter at the given parameter values, i.e. -i / 2 * P * U.
+        
+        Arguments:
+            values {dict} -- Dictionary of parameters (or parameter names) and values
+            param {Parameter, str} -- The parameter (or its name)
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> g = qvantum.RotationZ(qvantum.Parameter('theta'))
+            >>> g.get_derivative_matrix({'theta': 0}, 'theta')
+            matrix([[0.-0.5j, 0.+0.j ],
+                    [0.+0.j , 0.+0.5j]])
+        """
+
+        if not (isinstance(self.__theta, parameter.Parameter) and \
+            self.__theta.get_name() == parameter.parameter_name(param)):
+            return numpy.matrix(numpy.zeros((2, 2), dtype=complex))
+
+        return numpy.matrix(complex(0, -0.5) * \
+            numpy.dot(Rotation.__pauli_matrices[self.__axis], self.get_bound_matrix(values)))
+
+    def get_shift_rule(self):
+        """Method to return the parameter-shift rule of the rotation gate. The generator has the 
+        eigenvalues -1/2 and 1/2, so the expectation values have the only frequency 1.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.RotationX(qvantum.Parameter('theta')).get_shift_rule()
+            (1, 1)
+        """
+
+        if isinstance(self.__theta, parameter.Parameter):
+            return (1, 1)
+
+        return None
+
+    def set_name(self, name):
+        """Setter of name of rotation gate. Always raises BaseException.
+
+        Raises:
+            BaseException
+        """
+        
+        raise BaseException('Can\'t change the name of object in Rotation class.')
+
+    def set_matrix(self, matrix):
+        """Setter of matrix of rotation gate. Always raises BaseException.
+
+        Raises:
+            BaseException
+        """
+
+        raise BaseException('Can\'t change the matrix of object in Rotation class.')
+
+class RotationX(Rotation):
+    """This class is an inherited class from the Rotation class. It’s the implementation of the 
+    rotation gate around the X axis. Its unitary matrix:
+    
+    [[cos(theta / 2), -i * sin(theta / 2)], [-i * sin(theta / 2), cos(theta / 2)]]
+    """
+
+    @check_gate.rotation_angle_check
+    def __init__(self, theta):
+        """Method to initialize Rotation-X gate.
+
+        Arguments:
+            theta {int, float, Parameter} -- The used angle
+        
+        Raises:
+            TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> rx = qvantum.RotationX(qvantum.Parameter('theta'))
+        """
+
+        Rotation.__init__(self, 'X', theta)
+
+class RotationY(Rotation):
+    """This class is an inherited class from the Rotation class. It’s the implementation of the 
+    rotation gate around the Y axis. Its unitary matrix:
+    
+    [[cos(theta / 2), -sin(theta / 2)], [sin(theta / 2), cos(theta / 2)]]
+    """
+
+    @check_gate.rotation_angle_check
+    def __init__(self, theta):
+        """Method to initialize Rotation-Y gate.
+
+        Arguments:
+            theta {int, float, Parameter} -- The used angle
+        
+        Raises:
+            TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> ry = qvantum.RotationY(qvantum.Parameter('theta'))
+        """
+
+        Rotation.__init__(self, 'Y', theta)
+
+class RotationZ(Rotation):
+    """This class is an inherited class from the Rotation class. It’s the implementation of the 
+    rotation gate around the Z axis. Its unitary matrix:
+    
+    [[exp(-i * theta / 2), 0], [0, exp(i * theta / 2)]]
+    """
+
+    @check_gate.rotation_angle_check
+    def __init__(self, theta):
+        """Method to initialize Rotation-Z gate.
+
+        Arguments:
+            theta {int, float, Parameter} -- The used angle
+        
+        Raises:
+            TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> rz = qvantum.RotationZ(qvantum.Parameter('theta'))
+        """
+
+        Rotation.__init__(self, 'Z', theta)
+
 class Toffoli(Gate):
     """This class is an inherited class from the Gate class. It’s the implementation of the 
     Toffoli gate. It’s called on 3 qubits. The parameters determine which one is the target 
@@ -1087,3 +1856,179 @@ class Fredkin(Gate):
         """
 
         raise BaseException('Can\'t change the matrix of object in Fredkin class.')
+
+class Dagger(Gate):
+    """This class is an inherited class from the Gate class. It’s the adjoint (inverse) of 
+    another gate: its matrix is the conjugate transpose of the matrix of the wrapped gate. The 
+    conjugate transpose is cached and only recomputed when the matrix of the wrapped gate 
+    changes (e.g. a parameter is rebound). The symbolic parameters are the parameters of the 
+    wrapped gate, so binding a Dagger gate binds the wrapped gate.
+    """
+
+    @check_gate.Dagger_check
+    def __init__(self, g):
+        """Method to initialize the adjoint of a gate.
+
+        Arguments:
+            g {gate} -- The wrapped gate
+        
+        Raises:
+            TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> d = qvantum.Dagger(qvantum.Phase())
+            >>> d.get_matrix()
+            matrix([[1.-0.j, 0.-0.j],
+                    [0.-0.j, 0.-1.j]])
+        """
+
+        Gate.__init__(self)
+        super(Dagger, self).set_name(g.get_name() + '-Dagger')
+        self.__gate = g
+        self.__source = None
+
+    def get_gate(self):
+        """Getter of the wrapped gate.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.Dagger(qvantum.Phase()).get_gate()
+            <qvantum.gate.Phase at 0x1ae588c2d68>
+        """
+
+        return self.__gate
+
+    def get_matrix(self):
+        """Method to return the unitary matrix of the gate, i.e. the conjugate transpose of the 
+        matrix of the wrapped gate.
+
+        Raises:
+            ValueError
+        """
+
+        matrix = self.__gate.get_matrix()
+        if matrix is not self.__source:
+            self._update_matrix(matrix.conjugate().T)
+            self.__source = matrix
+
+        return super(Dagger, self).get_matrix()
+
+    def get_size(self):
+        """Method to retun the size of the unitary matrix of the gate.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.Dagger(qvantum.CNOT(0, 1)).get_size()
+            4
+        """
+
+        return self.__gate.get_size()
+
+    def get_parameters(self):
+        """Method to return the list of symbolic parameters of the wrapped gate.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.Dagger(qvantum.Ising(qvantum.Parameter('phi'))).get_parameters()
+            [Parameter('phi')]
+        """
+
+        return self.__gate.get_parameters()
+
+    @check_gate.values_check
+    def get_bound_matrix(self, values):
+        """Method to return the conjugate transpose of the bound matrix of the wrapped gate 
+        without changing the gates.
+        
+        Arguments:
+            values {dict} -- Dictionary of parameters (or parameter names) and values
+        
+        Raises:
+            ValueError, TypeError
+        """
+
+        if self.__gate.get_parameters():
+            return self.__gate.get_bound_matrix(values).conjugate().T
+
+        return self.get_matrix()
+
+    @check_gate.values_check
+    def bind(self, values):
+        """Method to bind values to the symbolic parameters of the wrapped gate.
+        
+        Arguments:
+            values {dict} -- Dictionary of parameters (or parameter names) and values
+        
+        Raises:
+            TypeError
+        """
+
+        self.__gate.bind(values)
+
+    @check_gate.derivative_check
+    def get_derivative_matrix(self, values, param):
+        """Method to return the conjugate transpose of the derivative of the matrix of the 
+        wrapped gate.
+        
+        Arguments:
+            values {dict} -- Dictionary of parameters (or parameter names) and values
+            param {Parameter, str} -- The parameter (or its name)
+        
+        Raises:
+            ValueError, TypeError
+        """
+
+        return self.__gate.get_derivative_matrix(values, param).conjugate().T
+
+    def get_shift_rule(self):
+        """Method to return the parameter-shift rule of the wrapped gate. The conjugate transpose 
+        doesn't change the frequencies.
+        """
+
+        return self.__gate.get_shift_rule()
+
+    def get_inverse(self):
+        """Method to return the inverse of the gate, i.e. the wrapped gate.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> p = qvantum.Phase()
+            >>> qvantum.Dagger(p).get_inverse() is p
+            True
+        """
+
+        return self.__gate
+
+    def power(self, power):
+        """Method to raise the matrix of Dagger gate to a power. Always raises BaseException, 
+        raise the wrapped gate instead.
+
+        Raises:
+            BaseException
+        """
+
+        raise BaseException('Can\'t raise the matrix of object in Dagger class to a power.')
+
+    def set_name(self, name):
+        """Setter of name of Dagger gate. Always raises BaseException.
+
+        Raises:
+            BaseException
+        """
+        
+        raise BaseException('Can\'t change the name of object in Dagger class.')
+
+    def set_matrix(self, matrix):
+        """Setter of matrix of Dagger gate. Always raises BaseException.
+
+        Raises:
+            BaseException
+        """
+
+        raise BaseException('Can\'t change the matrix of object in Dagger class.')
@@ -5,6 +5,7 @@
 from . import check_layer
 import collections
 import copy
+from . import engine
 import numpy
 
 class Layer(object):
@@ -112,7 +113,7 @@ class Layer(object):
         """Method to return the result of the Kronecker multiplication of the gates’ matrices 
         which are contained by the current Layer object. When the Layer is applied on a Register 
         during one step of a calculation the state vector of the Register is multiplied by this 
-        matrix.
+        matrix. Neighbouring identity gates are multiplied in as one identity matrix.
 
         Examples:
             >>> import qvantum
@@ -125,16 +126,29 @@ class Layer(object):
                     [ 0.        ,  0.70710678, -0.        , -0.70710678]])
         """
 
-        m = numpy.identity(self.__gate_list[0].get_matrix().shape[0])
-        for i in range(len(self.__gate_list)):
+        factors = []
+        idle = 0
+        for gate in self.__gate_list.values():
 
-            if i == 0:
-                m = m * self.__gate_list[i].get_matrix()
+            if engine.is_identity(gate):
+                idle = idle + engine.gate_width(gate)
+                continue
 
-            else:
-                m = numpy.kron(m, self.__gate_list[i].get_matrix())
+            if idle:
+                factors.append(numpy.identity(2 ** idle))
+                idle = 0
 
-        return m
+            factors.append(gate.get_matrix())
+
+        if idle:
+            factors.append(numpy.identity(2 ** idle))
+
+        m = factors[0]
+        for factor in factors[1:]:
+
+            m = numpy.kron(m, factor)
+
+        return numpy.matrix(m)
 
     def get_matrix_size(self):
         """Method to return the size of the matrix of the current Layer object.
@@ -152,7 +166,7 @@ class Layer(object):
             4
         """
 
-        return int(self.get_layer_matrix().shape[0])
+        return int(2 ** self.get_layer_size())
     
     def get_layer_size(self):
         """Method to return the size of the current Layer object. Remember, it’s not the size 
@@ -174,7 +188,7 @@ class Layer(object):
             2
         """
 
-        return int(numpy.log2(self.get_matrix_size()))
+        return int(sum(engine.gate_width(gate) for gate in self.__gate_list.values()))
 
     @check_layer.delete_gate_check
     def delete_gate(self, nth):
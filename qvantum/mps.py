@@ -0,0 +1,375 @@
+'''matrix product state register class'''
+
+# pylint: disable=E1101, W1401
+
+from . import check_mps
+from . import engine
+import numpy
+
+_PAULI_MATRICES = {
+    'I': numpy.identity(2, dtype=complex),
+    'X': numpy.array([[0, 1], [1, 0]], dtype=complex),
+    'Y': numpy.array([[0, complex(0, -1)], [complex(0, 1), 0]], dtype=complex),
+    'Z': numpy.array([[1, 0], [0, -1]], dtype=complex)
+    }
+
+class MPSRegister(object):
+    """matrix product state register class
+
+    An instance of matrix product state register class is a register whose amplitudes are
+    stored as a chain of small tensors, one (left bond, 2, right bond) shaped tensor per qubit:
+
+        <i_0 i_1 ... i_(n-1)|Ψ> = A_0[i_0] A_1[i_1] ... A_(n-1)[i_(n-1)]
+
+    The sizes of the bonds (the bond dimensions) grow with the entanglement of the state, so a
+    weakly entangled state of 50-100 qubits needs little memory. A gate on k neighbouring qubits
+    contracts their tensors, applies the 2^k x 2^k matrix and splits the result back by singular
+    value decompositions. Singular values below the threshold (relative to the largest one) and
+    beyond the maximal bond dimension are dropped; the dropped weight is accumulated as the
+    truncation error. The chain is kept in mixed canonical form around one site (the
+    orthogonality center), so the truncations are optimal and measurements, sampling and
+    expectation values are computed by local contractions without forming the 2^n vector.
+
+    The instances of matrix product state register class have the following methods:
+
+    - __init__()               - initialize register
+    - get_qubit_number()       - getter of number of qubits in the register
+    - get_bond_dimensions()    - getter of bond dimensions
+    - get_truncation_error()   - getter of accumulated truncation error
+    - apply_gate()             - apply a gate on some qubits
+    - apply_operations()       - apply a list of operations
+    - expectation()            - expectation value of a Pauli string or a sum of them
+    - sample()                 - sample measurement results without changing the register
+    - measure_nth_qubit()      - measure the n-th qubit
+    - measure_register()       - measure the whole register
+    - to_vector()              - state vector of the register
+    """
+
+    @check_mps.mps_init_check
+    def __init__(self, qubit_list, max_bond=None, threshold=1e-12):
+        """Method to initialize a matrix product state register in the product state of the
+        qubits.
+
+        Arguments:
+            qubit_list {list} -- List of objects from Qubit or Random_Qubit class
+
+        Keyword Arguments:
+            max_bond {int, None} -- Maximal bond dimension, unlimited if None (default: {None})
+            threshold {int, float} -- Relative threshold of dropped singular values
+                (default: {1e-12})
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> m = qvantum.MPSRegister([qvantum.Qubit(1, 0) for i in range(60)], max_bond=32)
+            >>> m.get_qubit_number()
+            60
+        """
+
+        self.__tensors = [numpy.array([q.get_alpha(), q.get_beta()], \
+            dtype=complex).reshape(1, 2, 1) for q in qubit_list]
+        self.__max_bond = max_bond
+        self.__threshold = threshold
+        self.__center = 0
+        self.__truncation_error = 0.0
+
+    def get_qubit_number(self):
+        """Method to return the number of qubits in the register.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.MPSRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)]).get_qubit_number()
+            2
+        """
+
+        return len(self.__tensors)
+
+    def get_bond_dimensions(self):
+        """Method to return the list of bond dimensions between the neighbouring qubits.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> m = qvantum.MPSRegister([qvantum.Qubit(1, 0) for i in range(3)])
+            >>> m.get_bond_dimensions()
+            [1, 1]
+        """
+
+        return [tensor.shape[2] for tensor in self.__tensors[:-1]]
+
+    def get_truncation_error(self):
+        """Method to return the accumulated truncation error, i.e. the sum of the squares of the
+        dropped (normalized) singular values. It's 0 if nothing was dropped.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.MPSRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)]).get_truncation_error()
+            0.0
+        """
+
+        return self.__truncation_error
+
+    def __move_center(self, site):
+        """Moves the orthogonality center to the given site by QR decompositions."""
+
+        while self.__center < site:
+
+            tensor = self.__tensors[self.__center]
+            left, phys, right = tensor.shape
+            q, r = numpy.linalg.qr(tensor.reshape(left * phys, right))
+            self.__tensors[self.__center] = q.reshape(left, phys, q.shape[1])
+            self.__tensors[self.__center + 1] = numpy.tensordot(r, \
+                self.__tensors[self.__center + 1], axes=([1], [0]))
+            self.__center = self.__center + 1
+
+        while self.__center > site:
+
+            tensor = self.__tensors[self.__center]
+            left, phys, right = tensor.shape
+            q, r = numpy.linalg.qr(tensor.reshape(left, phys * right).T)
+            self.__tensors[self.__center] = q.T.reshape(q.shape[1], phys, right)
+            self.__tensors[self.__center - 1] = numpy.tensordot( \
+                self.__tensors[self.__center - 1], r.T, axes=([2], [0]))
+            self.__center = self.__center - 1
+
+    def __split(self, theta, position, width):
+        """Splits the (left bond, 2^width, right bond) shaped tensor into the tensors of the
+        sites position, ..., position + width - 1 by truncated SVDs, leaving the orthogonality
+        center on the last site.
+        """
+
+        left = theta.shape[0]
+        right = theta.shape[2]
+        for site in range(position, position + width - 1):
+
+            rest = theta.shape[1] // 2
+            u, s, v = numpy.linalg.svd(theta.reshape(left * 2, rest * right), \
+                full_matrices=False)
+            keep = int(numpy.sum(s > self.__threshold * s[0])) if s[0] > 0 else 1
+            if self.__max_bond is not None:
+                keep = min(keep, self.__max_bond)
+
+            keep = max(keep, 1)
+            norm = numpy.sum(numpy.square(s))
+            if norm > 0:
+                self.__truncation_error += float(numpy.sum(numpy.square(s[keep:])) / norm)
+
+            s = s[:keep] / numpy.linalg.norm(s[:keep])
+            self.__tensors[site] = u[:, :keep].reshape(left, 2, keep)
+            theta = (s[:, None] * v[:keep]).reshape(keep, rest, right)
+            left = keep
+
+        self.__tensors[position + width - 1] = theta.reshape(left, 2, right)
+        self.__center = position + width - 1
+
+    def __apply_matrix(self, matrix, position):
+        """Applies a 2^k x 2^k matrix on the sites position, ..., position + k - 1."""
+
+        width = int(matrix.shape[0]).bit_length() - 1
+        self.__move_center(position)
+        theta = self.__tensors[position]
+        for site in range(position + 1, position + width):
+
+            theta = numpy.tensordot(theta, self.__tensors[site], axes=([2], [0]))
+            theta = theta.reshape(theta.shape[0], -1, theta.shape[-1])
+
+        theta = numpy.einsum('ij,ajb->aib', matrix, theta)
+        self.__split(theta, position, width)
+
+    @check_mps.apply_gate_check
+    def apply_gate(self, g, position):
+        """Method to apply a gate on the qubits position, ..., position + k - 1 of the register,
+        where k is the number of qubits of the gate.
+
+        Arguments:
+            g {gate} -- The applied gate
+            position {int} -- Index of the first qubit which the gate acts on
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> m = qvantum.MPSRegister([qvantum.Qubit(1, 0) for i in range(3)])
+            >>> m.apply_gate(qvantum.Hadamard(), 0)
+            >>> m.apply_gate(qvantum.CNOT(0, 1), 0)
+            >>> m.get_bond_dimensions()
+            [2, 1]
+        """
+
+        self.__apply_matrix(numpy.asarray(g.get_matrix(), dtype=complex), position)
+
+    def apply_operations(self, operations):
+        """Method to apply a list of (position, gate) operations in order (see the engine
+        module). It's used when a circuit is run on the register. Identity gates are skipped.
+
+        Arguments:
+            operations {list} -- List of (position, gate) pairs
+        """
+
+        for position, g in operations:
+
+            if not engine.is_identity(g):
+                self.__apply_matrix(numpy.asarray(g.get_matrix(), dtype=complex), position)
+
+    @check_mps.expectation_check
+    def expectation(self, observable):
+        """Method to return the expectation value of an observable which is a Pauli string or a
+        weighted sum of Pauli strings. Every Pauli string is evaluated by contracting the chain
+        from left to right with the single qubit Pauli matrices, the register is not changed.
+
+        Arguments:
+            observable {str, dict} -- Pauli string or dictionary of Pauli strings and weights
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> m = qvantum.MPSRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> m.expectation({'ZI': 0.5, 'IZ': 2})
+            -1.5
+        """
+
+        if isinstance(observable, str):
+            observable = {observable: 1}
+
+        result = 0.0
+        for pauli_string, weight in observable.items():
+
+            environment = numpy.ones((1, 1), dtype=complex)
+            for tensor, char in zip(self.__tensors, pauli_string):
+
+                environment = numpy.einsum('ab,aic,ij,bjd->cd', environment, \
+                    tensor.conjugate(), _PAULI_MATRICES[char], tensor)
+
+            result = result + weight * environment[0, 0].real
+
+        return float(result)
+
+    def __sample_indices(self, shots):
+        """Returns the sampled bits as a (shots, n) array. The orthogonality center is moved to
+        the 0th site, so the conditional probabilities of every site are local.
+        """
+
+        self.__move_center(0)
+        bits = numpy.zeros((shots, self.get_qubit_number()), dtype=int)
+        vectors = numpy.ones((shots, 1), dtype=complex)
+        for site, tensor in enumerate(self.__tensors):
+
+            candidates = numpy.einsum('ba,aic->bic', vectors, tensor)
+            probs = numpy.sum(numpy.square(numpy.absolute(candidates)), axis=-1)
+            probs = probs / numpy.sum(probs, axis=-1, keepdims=True)
+            bit = (numpy.random.random_sample(shots) >= probs[:, 0]).astype(int)
+            bits[:, site] = bit
+            vectors = candidates[numpy.arange(shots), bit] / \
+                numpy.sqrt(probs[numpy.arange(shots), bit])[:, None]
+
+        return bits
+
+    @check_mps.sample_check
+    def sample(self, shots=1):
+        """Method to sample the measurement of the whole register the given times and return
+        the measured states as a list of strings. All samples are drawn together site by site,
+        the register is not changed.
+
+        Keyword Arguments:
+            shots {int} -- Number of samples (default: {1})
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> m = qvantum.MPSRegister([qvantum.Qubit(1, 0) for i in range(2)])
+            >>> m.apply_gate(qvantum.Hadamard(), 0)
+            >>> m.apply_gate(qvantum.CNOT(0, 1), 0)
+            >>> m.sample(4)
+            ['00', '11', '11', '00']
+        """
+
+        return [''.join(str(bit) for bit in row) for row in self.__sample_indices(shots)]
+
+    @check_mps.nth_check
+    def measure_nth_qubit(self, nth):
+        """Method to perform a measurement on the n-th qubit and return the result (0 or 1). The
+        state collapses according to the result.
+
+        Arguments:
+            nth {int} -- Number of n-th qubit
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> m = qvantum.MPSRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> m.measure_nth_qubit(1)
+            1
+        """
+
+        self.__move_center(nth)
+        tensor = self.__tensors[nth]
+        prob0 = numpy.vdot(tensor[:, 0, :], tensor[:, 0, :]).real
+        prob0 = min(max(prob0 / numpy.vdot(tensor, tensor).real, 0), 1)
+        result = int(numpy.random.choice([0, 1], p=[prob0, 1 - prob0]))
+
+        tensor = tensor.copy()
+        tensor[:, 1 - result, :] = 0
+        self.__tensors[nth] = tensor / numpy.linalg.norm(tensor)
+
+        return result
+
+    def measure_register(self):
+        """Method to perform a measurement on the whole register and return the measured state.
+        The register collapses into the measured product state.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> m = qvantum.MPSRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> m.measure_register()
+            '01'
+        """
+
+        bits = self.__sample_indices(1)[0]
+        self.__tensors = [numpy.array([1 - bit, bit], dtype=complex).reshape(1, 2, 1) \
+            for bit in bits]
+        self.__center = 0
+
+        return ''.join(str(bit) for bit in bits)
+
+    @check_mps.to_vector_check
+    def to_vector(self):
+        """Method to return the state vector of the register (2^n amplitudes, the 0th qubit is
+        the most significant bit).
+
+        Raises:
+            ValueError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> m = qvantum.MPSRegister([qvantum.Qubit(1, 0) for i in range(2)])
+            >>> m.apply_gate(qvantum.Hadamard(), 0)
+            >>> m.apply_gate(qvantum.CNOT(0, 1), 0)
+            >>> m.to_vector()
+            array([0.70710678+0.j, 0.        +0.j, 0.        +0.j, 0.70710678+0.j])
+        """
+
+        vector = numpy.ones((1, 1), dtype=complex)
+        for tensor in self.__tensors:
+
+            vector = numpy.tensordot(vector, tensor, axes=([1], [0]))
+            vector = vector.reshape(-1, tensor.shape[2])
+
+        return vector.reshape(-1)
@@ -0,0 +1,413 @@
+'''noise channels
+
+The classes of this module describe the noise of a quantum computer. A channel is given by its
+Kraus operators K_1, ..., K_m (2x2 matrices with Σ K†K = I) and acts on one qubit. A noise
+model attaches channels to gate types (by the name of the gates) and to layers, and may contain
+a readout error which flips the measured bits.
+
+Noisy circuits are simulated by quantum trajectories: every trajectory is a pure state vector
+and after every noisy gate one Kraus operator is chosen randomly for it, with the probability
+||KΨ||^2. The trajectories are the rows of one 2-D array, so every gate and every channel is
+applied on all of them at once by the engine, and the average over the trajectories gives the
+same expectation values as the density matrix of the noisy circuit with O(2^n) memory per
+trajectory.
+
+The following classes are the noise related classes in the package:
+
+- Channel          - quantum channel on one qubit given by Kraus operators
+- Depolarizing     - depolarizing channel
+- AmplitudeDamping - amplitude damping channel
+- Dephasing        - dephasing channel
+- ReadoutError     - classical bit flip of measured results
+- NoiseModel       - channels per gate type and per layer, readout error
+'''
+
+# pylint: disable=E1101, W1401
+
+from . import check_noise
+from . import engine
+import numpy
+
+class Channel(object):
+    """channel class
+
+    An instance of channel class is a quantum channel acting on one qubit, given by its Kraus
+    operators.
+
+    The instances of channel class have the following methods:
+
+    - __init__()   - initialize channel
+    - get_name()   - getter of name of channel
+    - get_kraus()  - getter of Kraus operators of channel
+    """
+
+    @check_noise.channel_init_check
+    def __init__(self, kraus_list, name='Channel'):
+        """Method to initialize a channel from its Kraus operators.
+
+        Arguments:
+            kraus_list {list} -- List of 2x2 Kraus operators (numpy arrays)
+
+        Keyword Arguments:
+            name {str} -- Name of the channel (default: {'Channel'})
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import numpy
+            >>> import qvantum
+            >>>
+            >>> flip = qvantum.Channel([numpy.sqrt(0.9) * numpy.identity(2), \\
+            ...     numpy.sqrt(0.1) * numpy.array([[0, 1], [1, 0]])], 'Bit-Flip')
+        """
+
+        self.__name = name
+        self.__kraus_list = [numpy.array(kraus, dtype=complex) for kraus in kraus_list]
+
+    def get_name(self):
+        """Method to return the name of the channel.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.Depolarizing(0.1).get_name()
+            'Depolarizing'
+        """
+
+        return self.__name
+
+    def get_kraus(self):
+        """Method to return the list of Kraus operators of the channel.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.Dephasing(0.1).get_kraus()
+            [array([[0.9486833+0.j, 0.       +0.j],
+                   [0.       +0.j, 0.9486833+0.j]]), array([[ 0.31622777+0.j,  0.        +0.j],
+                   [ 0.        +0.j, -0.31622777+0.j]])]
+        """
+
+        return list(self.__kraus_list)
+
+class Depolarizing(Channel):
+    """This class is an inherited class from the Channel class. It's the depolarizing channel:
+    with probability p one of the X, Y and Z errors happens on the qubit (each with p / 3).
+    """
+
+    @check_noise.probability_check
+    def __init__(self, p):
+        """Method to initialize depolarizing channel.
+
+        Arguments:
+            p {int, float} -- Probability of an error
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> d = qvantum.Depolarizing(0.01)
+        """
+
+        Channel.__init__(self, [
+            numpy.sqrt(1 - p) * numpy.identity(2),
+            numpy.sqrt(p / 3.0) * numpy.array([[0, 1], [1, 0]]),
+            numpy.sqrt(p / 3.0) * numpy.array([[0, complex(0, -1)], [complex(0, 1), 0]]),
+            numpy.sqrt(p / 3.0) * numpy.array([[1, 0], [0, -1]])
+            ], 'Depolarizing')
+
+class AmplitudeDamping(Channel):
+    """This class is an inherited class from the Channel class. It's the amplitude damping
+    channel: the state |1> decays into |0> with probability gamma (energy relaxation).
+    """
+
+    @check_noise.probability_check
+    def __init__(self, gamma):
+        """Method to initialize amplitude damping channel.
+
+        Arguments:
+            gamma {int, float} -- Probability of the decay
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> a = qvantum.AmplitudeDamping(0.05)
+        """
+
+        Channel.__init__(self, [
+            numpy.array([[1, 0], [0, numpy.sqrt(1 - gamma)]]),
+            numpy.array([[0, numpy.sqrt(gamma)], [0, 0]])
+            ], 'Amplitude-Damping')
+
+class Dephasing(Channel):
+    """This class is an inherited class from the Channel class. It's the dephasing channel: a Z
+    error happens on the qubit with probability p.
+    """
+
+    @check_noise.probability_check
+    def __init__(self, p):
+        """Method to initialize dephasing channel.
+
+        Arguments:
+            p {int, float} -- Probability of a Z error
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> d = qvantum.Dephasing(0.1)
+        """
+
+        Channel.__init__(self, [
+            numpy.sqrt(1 - p) * numpy.identity(2),
+            numpy.sqrt(p) * numpy.array([[1, 0], [0, -1]])
+            ], 'Dephasing')
+
+class ReadoutError(object):
+    """readout error class
+
+    An instance of readout error class flips the measured bits classically: a measured 0 is read
+    as 1 with probability p01 and a measured 1 is read as 0 with probability p10.
+
+    The instances of readout error class have the following methods:
+
+    - __init__()         - initialize readout error
+    - get_probabilities() - getter of flip probabilities
+    - apply()            - flip the bits of measured indices
+    """
+
+    @check_noise.readout_init_check
+    def __init__(self, p01, p10):
+        """Method to initialize readout error.
+
+        Arguments:
+            p01 {int, float} -- Probability of reading 1 instead of 0
+            p10 {int, float} -- Probability of reading 0 instead of 1
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> e = qvantum.ReadoutError(0.02, 0.05)
+        """
+
+        self.__p01 = p01
+        self.__p10 = p10
+
+    def get_probabilities(self):
+        """Method to return the flip probabilities as a (p01, p10) pair.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.ReadoutError(0.02, 0.05).get_probabilities()
+            (0.02, 0.05)
+        """
+
+        return (self.__p01, self.__p10)
+
+    def apply(self, indices, qubit_number):
+        """Method to flip the bits of measured basis state indices randomly and return the new
+        indices as a numpy array.
+
+        Arguments:
+            indices {numpy.ndarray} -- Measured basis state indices
+            qubit_number {int} -- Number of qubits
+        """
+
+        indices = numpy.array(indices, dtype=int)
+        for nth in range(qubit_number):
+
+            bit = 1 << (qubit_number - nth - 1)
+            ones = (indices & bit) != 0
+            flip = numpy.random.random_sample(len(indices)) < \
+                numpy.where(ones, self.__p10, self.__p01)
+            indices = indices ^ (flip * bit)
+
+        return indices
+
+class NoiseModel(object):
+    """noise model class
+
+    An instance of noise model class describes where noise happens in a circuit: channels can
+    be attached to gate types (the channel acts on every qubit of the gate after every gate with
+    the given name) and to layers (the channel acts on every qubit after the n-th layer). A
+    readout error can be set for the measurements.
+
+    The instances of noise model class have the following methods:
+
+    - __init__()             - initialize noise model
+    - add_gate_noise()       - attach channel to a gate type
+    - add_layer_noise()      - attach channel to a layer
+    - set_readout_error()    - setter of readout error
+    - get_gate_channels()    - getter of channels of a gate type
+    - get_layer_channels()   - getter of channels of a layer
+    - get_readout_error()    - getter of readout error
+    - run()                  - run noisy trajectories of a circuit
+    - measure()              - measure trajectories with readout error
+    """
+
+    def __init__(self):
+        """Method to initialize an empty noise model.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> model = qvantum.NoiseModel()
+            >>> model.add_gate_noise('Controlled-Not', qvantum.Depolarizing(0.02))
+            >>> model.add_layer_noise(0, qvantum.AmplitudeDamping(0.01))
+        """
+
+        self.__gate_channels = {}
+        self.__layer_channels = {}
+        self.__readout_error = None
+
+    @check_noise.add_gate_noise_check
+    def add_gate_noise(self, name, channel):
+        """Method to attach a channel to the gates with the given name (e.g. 'Hadamard'). The
+        channel acts on every qubit of the gate after the gate.
+
+        Arguments:
+            name {str} -- Name of the gates
+            channel {Channel} -- The channel
+
+        Raises:
+            TypeError
+        """
+
+        self.__gate_channels.setdefault(name, []).append(channel)
+
+    @check_noise.add_layer_noise_check
+    def add_layer_noise(self, nth, channel):
+        """Method to attach a channel to the n-th layer of a circuit. The channel acts on every
+        qubit after the layer.
+
+        Arguments:
+            nth {int} -- Number of the layer
+            channel {Channel} -- The channel
+
+        Raises:
+            TypeError
+        """
+
+        self.__layer_channels.setdefault(nth, []).append(channel)
+
+    @check_noise.set_readout_error_check
+    def set_readout_error(self, readout_error):
+        """Setter of the readout error of the measurements.
+
+        Arguments:
+            readout_error {ReadoutError, None} -- The readout error or None
+
+        Raises:
+            TypeError
+        """
+
+        self.__readout_error = readout_error
+
+    def get_gate_channels(self, name):
+        """Method to return the list of channels attached to the gates with the given name.
+
+        Arguments:
+            name {str} -- Name of the gates
+        """
+
+        return list(self.__gate_channels.get(name, []))
+
+    def get_layer_channels(self, nth):
+        """Method to return the list of channels attached to the n-th layer.
+
+        Arguments:
+            nth {int} -- Number of the layer
+        """
+
+        return list(self.__layer_channels.get(nth, []))
+
+    def get_readout_error(self):
+        """Getter of the readout error of the measurements (None if there's no readout error)."""
+
+        return self.__readout_error
+
+    def run(self, states, layer_list, qubit_number):
+        """Method to run noisy trajectories of a circuit given by its layers. Every row of the
+        states is a trajectory, all of them are processed together. The input array isn't
+        changed, the final states are returned.
+
+        Arguments:
+            states {numpy.ndarray} -- (trajectories, 2^n) array of amplitudes
+            layer_list {list} -- List of Layer objects
+            qubit_number {int} -- Number of qubits
+        """
+
+        states = numpy.asarray(states, dtype=complex)
+        for nth, layer in enumerate(layer_list):
+
+            for position, gate in engine.layer_operations(layer):
+
+                states = engine.apply_matrix(states, gate.get_matrix(), position, qubit_number)
+                for channel in self.get_gate_channels(gate.get_name()):
+                    for qubit in range(position, position + engine.gate_width(gate)):
+
+                        states = apply_channel(states, channel, qubit, qubit_number)
+
+            for channel in self.get_layer_channels(nth):
+                for qubit in range(qubit_number):
+
+                    states = apply_channel(states, channel, qubit, qubit_number)
+
+        return states
+
+    def measure(self, states):
+        """Method to measure every trajectory (row of the states) and return the measured states
+        as a list of strings. The readout error of the model is applied on the results.
+
+        Arguments:
+            states {numpy.ndarray} -- (trajectories, 2^n) array of amplitudes
+        """
+
+        states = numpy.atleast_2d(states)
+        qubit_number = int(states.shape[-1]).bit_length() - 1
+        probs = numpy.square(numpy.absolute(states))
+        cumulative = numpy.cumsum(probs / numpy.sum(probs, axis=-1, keepdims=True), axis=-1)
+        randoms = numpy.random.random_sample((len(states), 1))
+        indices = numpy.minimum(numpy.sum(cumulative < randoms, axis=-1), states.shape[-1] - 1)
+        if self.__readout_error is not None:
+            indices = self.__readout_error.apply(indices, qubit_number)
+
+        return ['{0:0{1}b}'.format(int(index), qubit_number) for index in indices]
+
+def apply_channel(states, channel, qubit, qubit_number):
+    """This function applies a channel on one qubit of every trajectory (row of the states) and
+    returns the result. The probabilities of the Kraus operators come from the 2x2 reduced
+    density matrix of the qubit in every row, then one Kraus operator per row is chosen and the
+    chosen (renormalized) operators are applied as one stack of matrices.
+
+    Arguments:
+        states {numpy.ndarray} -- (trajectories, 2^n) array of amplitudes
+        channel {Channel} -- The channel
+        qubit {int} -- Index of the qubit
+        qubit_number {int} -- Number of qubits
+    """
+
+    kraus_list = numpy.array(channel.get_kraus())
+    tensor = states.reshape(len(states), 2 ** qubit, 2, 2 ** (qubit_number - qubit - 1))
+    reduced = numpy.einsum('baic,bajc->bij', tensor, tensor.conjugate())
+    probs = numpy.einsum('kij,bjl,kil->bk', kraus_list, reduced, kraus_list.conjugate()).real
+    probs = numpy.clip(probs, 0, None)
+    cumulative = numpy.cumsum(probs / numpy.sum(probs, axis=-1, keepdims=True), axis=-1)
+    randoms = numpy.random.random_sample((len(states), 1))
+    chosen = numpy.minimum(numpy.sum(cumulative < randoms, axis=-1), len(kraus_list) - 1)
+    norms = numpy.sqrt(probs[numpy.arange(len(states)), chosen])
+    matrices = kraus_list[chosen] / norms[:, None, None]
+
+    return engine.apply_matrix(states, matrices, qubit, qubit_number)
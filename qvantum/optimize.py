@@ -0,0 +1,216 @@
+'''Peephole optimization of circuits
+
+The optimizer walks through the gates of a circuit in order of execution and keeps the last gates
+of every qubit, so it finds the gates which follow each other directly on the same qubits, even
+if they are in distant layers. The following rewrites are applied until none of them applies:
+
+- a pair of gates on the same qubits whose product is the identity is cancelled (Hadamard -
+  Hadamard, PauliX - PauliX, CNOT - CNOT, Swap - Swap, a gate and its Dagger, ...)
+- a pair of diagonal gates on the same qubits (PauliZ, Phase, Pi8, ControlledZ,
+  ControlledPhase, ...) is merged into one diagonal gate
+- a pair of PauliX gates around a diagonal gate is removed and the diagonal gate is replaced by
+  the diagonal gate with flipped qubit, e.g. the PauliX layers around a phase oracle
+
+Gates with symbolic parameters are kept as they are. The layers which become identity layers are
+dropped. Every removed gate is a pass over the amplitudes which is saved when the circuit is run.
+
+The following functions are the optimization functions in the package:
+
+- optimize() - optimize a circuit
+'''
+
+# pylint: disable=E1101, W1401
+
+from . import check_optimize
+from . import circuit
+from . import engine
+from . import gate
+from . import layer
+import numpy
+
+_TOLERANCE = 1e-12
+
+_X_MATRIX = numpy.array([[0, 1], [1, 0]])
+
+_DIAGONAL_GATES = (gate.PauliZ, gate.Phase, gate.Pi8, gate.ControlledZ, gate.ControlledPhase)
+
+_prototypes = []
+
+def _fixed_matrix(g):
+    """Returns the matrix of the gate as an array or None if the gate has symbolic parameters.
+
+    Arguments:
+        g {gate} -- The gate
+    """
+
+    if g.get_parameters():
+        return None
+
+    return numpy.asarray(g.get_matrix())
+
+def _is_identity(matrix):
+    """Returns whether the matrix is the identity matrix.
+
+    Arguments:
+        matrix {numpy.ndarray} -- The matrix
+    """
+
+    return numpy.allclose(matrix, numpy.identity(len(matrix)), rtol=0, atol=_TOLERANCE)
+
+def _is_diagonal(matrix):
+    """Returns whether the matrix is diagonal.
+
+    Arguments:
+        matrix {numpy.ndarray} -- The matrix
+    """
+
+    return numpy.count_nonzero(matrix - numpy.diag(numpy.diag(matrix))) == 0
+
+def _diagonal_gate(diagonal):
+    """Returns a new gate with the given diagonal: a standard diagonal gate if there is one with
+    the same matrix, otherwise a gate named Diagonal. The prototypes are only compared, they are
+    never put into a circuit.
+
+    Arguments:
+        diagonal {numpy.ndarray} -- The diagonal of the matrix
+    """
+
+    if not _prototypes:
+        _prototypes.extend(cls() for cls in _DIAGONAL_GATES)
+
+    for prototype in _prototypes:
+
+        matrix = numpy.asarray(prototype.get_matrix())
+        if len(matrix) == len(diagonal) and numpy.allclose(numpy.diag(matrix), diagonal, \
+            rtol=0, atol=_TOLERANCE):
+            return type(prototype)()
+
+    g = gate.Gate()
+    g.set_name('Diagonal')
+    g.set_matrix(numpy.matrix(numpy.diag(diagonal)))
+    return g
+
+def _pass(layer_operations, qubit_number, report):
+    """Applies the rewrites once in order of execution. Returns the gates of the layers as
+    dictionaries of position - gate pairs.
+
+    Arguments:
+        layer_operations {list} -- List of the operations of the layers
+        qubit_number {int} -- Number of qubits
+        report {dict} -- Numbers of the removed gates, updated by the pass
+    """
+
+    slots = [{} for operations in layer_operations]
+    stacks = [[] for qubit in range(qubit_number)]
+    for index, operations in enumerate(layer_operations):
+
+        for position, g in operations:
+
+            matrix = _fixed_matrix(g)
+            if matrix is not None and _is_identity(matrix):
+                continue
+
+            width = engine.gate_width(g)
+            wires = range(position, position + width)
+            stack = stacks[position]
+            top = stack[-1] if stack else None
+            if top is not None and top[1] == position and matrix is not None \
+                and all(stacks[wire] and stacks[wire][-1] == top for wire in wires) \
+                and engine.gate_width(slots[top[0]][position]) == width:
+                previous = _fixed_matrix(slots[top[0]][position])
+                if previous is not None:
+                    product = numpy.dot(matrix, previous)
+                    if _is_identity(product):
+                        del slots[top[0]][position]
+                        for wire in wires:
+
+                            stacks[wire].pop()
+
+                        report['cancelled'] = report['cancelled'] + 2
+                        continue
+
+                    if _is_diagonal(matrix) and _is_diagonal(previous):
+                        slots[top[0]][position] = _diagonal_gate(numpy.diag(product))
+                        report['merged'] = report['merged'] + 1
+                        continue
+
+            if width == 1 and matrix is not None and len(stack) > 1 \
+                and numpy.array_equal(matrix, _X_MATRIX):
+                below = stack[-2]
+                x = _fixed_matrix(slots[below[0]][below[1]])
+                diagonal = _fixed_matrix(slots[top[0]][top[1]])
+                if x is not None and numpy.array_equal(x, _X_MATRIX) \
+                    and diagonal is not None and _is_diagonal(diagonal):
+                    bit = 1 << (engine.gate_width(slots[top[0]][top[1]]) - 1 - position + top[1])
+                    flipped = numpy.diag(diagonal)[numpy.arange(len(diagonal)) ^ bit]
+                    slots[top[0]][top[1]] = _diagonal_gate(flipped)
+                    del slots[below[0]][below[1]]
+                    del stack[-2]
+                    report['cancelled'] = report['cancelled'] + 2
+                    continue
+
+            slots[index][position] = g
+            for wire in wires:
+
+                stacks[wire].append((index, position))
+
+    return slots
+
+@check_optimize.optimize_check
+def optimize(c):
+    """This function returns the optimized circuit and the report of the optimization: the
+    number of cancelled gates, the number of gates which are merged into other gates and the
+    number of dropped layers. The circuit itself is not changed.
+
+    Arguments:
+        c {Circuit} -- The optimized circuit
+
+    Raises:
+        TypeError
+
+    Examples:
+        >>> import qvantum.optimize
+        >>>
+        >>> l1 = qvantum.Layer([qvantum.Hadamard(), qvantum.Phase()])
+        >>> l2 = qvantum.Layer([qvantum.Hadamard(), qvantum.Phase()])
+        >>> optimized, report = qvantum.optimize.optimize(qvantum.Circuit([l1, l2]))
+        >>> [g.get_name() for g in optimized.get_nth_layer(0).get_gate_list().values()]
+        ['Identity', 'Pauli-Z']
+        >>> report
+        {'cancelled': 2, 'merged': 1, 'layers': 1}
+    """
+
+    qubit_number = c.get_circuit_size()
+    layer_operations = [engine.layer_operations(l) for l in c.get_layer_list().values()]
+    report = {'cancelled': 0, 'merged': 0, 'layers': 0}
+    removed = -1
+    while removed != report['cancelled'] + report['merged']:
+
+        removed = report['cancelled'] + report['merged']
+        slots = _pass(layer_operations, qubit_number, report)
+        layer_operations = [sorted(gates.items()) for gates in slots]
+
+    identity = gate.Gate()
+    layer_list = []
+    for operations in layer_operations:
+
+        if not operations:
+            continue
+
+        gate_list = []
+        wire = 0
+        for position, g in operations:
+
+            gate_list.extend([identity] * (position - wire))
+            gate_list.append(g)
+            wire = position + engine.gate_width(g)
+
+        gate_list.extend([identity] * (qubit_number - wire))
+        layer_list.append(layer.Layer(gate_list))
+
+    if not layer_list:
+        layer_list.append(layer.Layer([identity] * qubit_number))
+
+    report['layers'] = len(layer_operations) - len(layer_list)
+
+    return circuit.Circuit(layer_list), report
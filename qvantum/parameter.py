@@ -0,0 +1,103 @@
+'''parameter class'''
+
+# pylint: disable=E1101, W1401
+
+from . import check_parameter
+
+class Parameter(object):
+    """parameter class
+
+    An instance of parameter class is a symbolic angle which can be used instead of a number when
+    a parameterized gate (such as Ising) is created. The gate gets its matrix when a value is bound
+    to the parameter, e.g. by Circuit.bind(). Parameters are identified by their names, so the
+    values can be given either by the Parameter objects or by their names.
+
+    The instances of parameter class have the following methods:
+
+    - __init__()   - initialize parameter
+    - get_name()   - getter of name of parameter
+    - resolve()    - look up the value of the parameter
+    """
+
+    @check_parameter.parameter_init_check
+    def __init__(self, name):
+        """Method to initialize an instance of the Parameter class.
+
+        Arguments:
+            name {str} -- Name of the parameter
+
+        Raises:
+            TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> theta = qvantum.Parameter('theta')
+            >>> theta.get_name()
+            'theta'
+        """
+
+        self.__name = name
+
+    def __eq__(self, other):
+        return isinstance(other, Parameter) and self.__name == other.get_name()
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(('qvantum.Parameter', self.__name))
+
+    def __repr__(self):
+        return 'Parameter(' + repr(self.__name) + ')'
+
+    def get_name(self):
+        """Method to return the name of the parameter.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> theta = qvantum.Parameter('theta')
+            >>> theta.get_name()
+            'theta'
+        """
+
+        return self.__name
+
+    def resolve(self, values):
+        """Method to look up the value of the parameter in a dictionary whose keys are Parameter
+        objects or parameter names. If the parameter is not in the dictionary, None is returned.
+
+        Arguments:
+            values {dict} -- Dictionary of parameters (or names) and values
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> theta = qvantum.Parameter('theta')
+            >>> theta.resolve({'theta': 0.5})
+            0.5
+        """
+
+        if self in values:
+            return values[self]
+
+        return values.get(self.__name)
+
+def parameter_name(param):
+    """Returns the name of a parameter given by a Parameter object or by its name.
+
+    Arguments:
+        param {Parameter, str} -- The parameter (or its name)
+
+    Examples:
+        >>> import qvantum.parameter
+        >>>
+        >>> qvantum.parameter.parameter_name(qvantum.Parameter('theta'))
+        'theta'
+    """
+
+    if isinstance(param, Parameter):
+        return param.get_name()
+
+    return param
@@ -0,0 +1,208 @@
+'''Pauli strings
+
+A Pauli string is a tensor product of single qubit Pauli operators, written as a string like
+'XIZY' where the n-th character acts on the n-th qubit of the register. A weighted sum of Pauli
+strings is given as a dictionary like {'ZZI': 0.5, 'XIX': -1.2}. These are the observables of
+the package.
+
+The functions below act on amplitude arrays directly. A Pauli string only flips the bits of
+the basis states (X, Y) and multiplies them by a phase (Y, Z):
+
+    P|i> = i^(number of Y) * (-1)^(popcount(i & z_mask)) |i ^ x_mask>
+
+so neither the 2^n x 2^n matrix nor any other large object has to be built. Every function
+works along the last axis of the array, so a stack of state vectors can be passed at once.
+
+The following functions are the Pauli string related functions in the package:
+
+- pauli_masks()      - bit masks and phase of a Pauli string
+- apply_pauli()      - apply a Pauli string on amplitudes
+- apply_observable() - apply a weighted sum of Pauli strings on amplitudes
+- pauli_expectation() - expectation value of a Pauli string or a weighted sum of them
+'''
+
+# pylint: disable=E1101, W1401
+
+import numpy
+
+_index_cache = {}
+
+def _indices(size):
+    """Returns the cached array of basis state indices 0, 1, ..., size - 1.
+
+    Arguments:
+        size {int} -- Number of basis states
+    """
+
+    if size not in _index_cache:
+        _index_cache.clear()
+        _index_cache[size] = numpy.arange(size)
+
+    return _index_cache[size]
+
+def _parity(indices, mask):
+    """Returns the parity (0 or 1) of the bits of the indices selected by the mask.
+
+    Arguments:
+        indices {numpy.ndarray} -- Basis state indices
+        mask {int} -- Bit mask
+    """
+
+    if hasattr(numpy, 'bitwise_count'):
+        return numpy.bitwise_count(indices & mask) & 1
+
+    parity = numpy.zeros(len(indices), dtype=indices.dtype)
+    while mask:
+
+        bit = mask & -mask
+        parity ^= (indices & bit) != 0
+        mask ^= bit
+
+    return parity
+
+def pauli_masks(pauli_string):
+    """This function returns the X mask, the Z mask and the phase of a Pauli string. The 0th
+    character belongs to the most significant bit, just like in the states of a register.
+
+    Arguments:
+        pauli_string {str} -- Pauli string, e.g. 'XIZY'
+
+    Examples:
+        >>> import qvantum.pauli
+        >>>
+        >>> qvantum.pauli.pauli_masks('XIZY')
+        (9, 3, 1j)
+    """
+
+    x_mask = 0
+    z_mask = 0
+    y_number = 0
+    for char in pauli_string:
+
+        x_mask = x_mask << 1
+        z_mask = z_mask << 1
+        if char in 'XY':
+            x_mask = x_mask | 1
+
+        if char in 'YZ':
+            z_mask = z_mask | 1
+
+        if char == 'Y':
+            y_number = y_number + 1
+
+    return x_mask, z_mask, 1j ** y_number
+
+def _phases(size, z_mask, phase):
+    """Returns the phase of every basis state for the given Z mask and global phase.
+
+    Arguments:
+        size {int} -- Number of basis states
+        z_mask {int} -- Z mask of the Pauli string
+        phase {complex} -- Global phase of the Pauli string
+    """
+
+    return phase * (1.0 - 2.0 * _parity(_indices(size), z_mask))
+
+def apply_pauli(vector, pauli_string):
+    """This function returns the result of the Pauli string applied on the amplitudes. The
+    input array isn't changed.
+
+    Arguments:
+        vector {numpy.ndarray} -- Amplitudes, the last axis is the state axis
+        pauli_string {str} -- Pauli string, e.g. 'XIZY'
+
+    Examples:
+        >>> import numpy
+        >>> import qvantum.pauli
+        >>>
+        >>> qvantum.pauli.apply_pauli(numpy.array([1, 0, 0, 0]), 'YI')
+        array([0.+0.j, 0.+0.j, 0.+1.j, 0.+0.j])
+    """
+
+    x_mask, z_mask, phase = pauli_masks(pauli_string)
+    size = vector.shape[-1]
+    if z_mask == 0:
+        result = phase * vector
+
+    else:
+        result = _phases(size, z_mask, phase) * vector
+
+    if x_mask != 0:
+        result = result[..., _indices(size) ^ x_mask]
+
+    return result
+
+def apply_observable(vector, observable):
+    """This function returns the result of a Pauli string or a weighted sum of Pauli strings
+    applied on the amplitudes, i.e. O|Ψ>. The input array isn't changed.
+
+    Arguments:
+        vector {numpy.ndarray} -- Amplitudes, the last axis is the state axis
+        observable {str, dict} -- Pauli string or dictionary of Pauli strings and weights
+
+    Examples:
+        >>> import numpy
+        >>> import qvantum.pauli
+        >>>
+        >>> qvantum.pauli.apply_observable(numpy.array([1, 0]), {'Z': 0.5, 'X': 2})
+        array([0.5+0.j, 2. +0.j])
+    """
+
+    if isinstance(observable, str):
+        observable = {observable: 1}
+
+    result = numpy.zeros(vector.shape, dtype=complex)
+    for pauli_string, weight in observable.items():
+
+        result = result + weight * apply_pauli(vector, pauli_string)
+
+    return result
+
+def pauli_expectation(vector, observable):
+    """This function returns the expectation value <Ψ|O|Ψ> of a Pauli string or a weighted sum
+    of Pauli strings. The amplitudes are not changed. For a stack of state
+    vectors an array of expectation values is returned.
+
+    Arguments:
+        vector {numpy.ndarray} -- Amplitudes, the last axis is the state axis
+        observable {str, dict} -- Pauli string or dictionary of Pauli strings and weights
+
+    Examples:
+        >>> import numpy
+        >>> import qvantum.pauli
+        >>>
+        >>> vector = numpy.array([1, 0, 0, 1]) / numpy.sqrt(2)
+        >>> qvantum.pauli.pauli_expectation(vector, {'ZZ': 0.5, 'XX': -1.2})
+        -0.6999999999999998
+    """
+
+    if isinstance(observable, str):
+        observable = {observable: 1}
+
+    size = vector.shape[-1]
+    probs = None
+    result = 0
+    for pauli_string, weight in observable.items():
+
+        x_mask, z_mask, phase = pauli_masks(pauli_string)
+        if x_mask == 0:
+            if probs is None:
+                probs = numpy.square(numpy.absolute(vector))
+
+            if z_mask == 0:
+                value = numpy.sum(probs, axis=-1)
+
+            else:
+                value = numpy.sum(probs * (1.0 - 2.0 * _parity(_indices(size), z_mask)), axis=-1)
+
+        else:
+            flipped = vector[..., _indices(size) ^ x_mask]
+            value = numpy.sum(flipped.conjugate() * vector * _phases(size, z_mask, phase), \
+                axis=-1).real
+
+        result = result + weight * value
+
+    if numpy.ndim(result) == 0:
+        return float(result)
+
+    return numpy.asarray(result, dtype=float)
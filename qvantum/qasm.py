@@ -0,0 +1,743 @@
+'''OpenQASM import and export
+
+The circuits of the package can be read from and written into OpenQASM 2 and OpenQASM 3
+programs. The importer reads the program statement by statement and schedules the gates into
+layers as it goes by a circuit builder (see CircuitBuilder): every gate is put into the earliest
+possible layer, and only the last few layers are kept open, the earlier ones are closed and built
+immediately. So the memory used by the parser doesn't depend on the length of the program.
+
+The standard gates are mapped onto the gate classes of the package (h - Hadamard, cx - CNOT,
+ccx - Toffoli, swap - Swap, rx - RotationX, ...), the other supported gates (u3, p, sx, crz, ...)
+become gates with the corresponding matrices. The gates of a layer act on neighbouring qubits, so
+gates on distant qubits are moved next to each other by Swap gates and moved back afterwards.
+Barriers are kept, measurements are skipped, gate definitions and classical control are not
+supported. Symbolic parameters are read from and written as QASM 3 inputs.
+
+The exporter writes the gates of the circuit layer by layer, identity gates are skipped. Single
+qubit gates without a standard name are written as u3 gates (up to global phase), other two qubit
+gates (Ising, SquareSwap, ...) by their cosine-sine decomposition into u3 and controlled gates.
+
+The following functions are the OpenQASM functions in the package:
+
+- read()  - read a circuit from an OpenQASM program
+- write() - write a circuit as an OpenQASM program
+'''
+
+# pylint: disable=E1101, W1401
+
+import ast
+from . import builder as builder_module
+import collections
+from . import gate
+import io
+import numpy
+from . import parameter
+import re
+
+_WINDOW = 64
+
+_STATEMENT = re.compile(r'^([A-Za-z_]\w*)\s*(?:\((.*)\))?\s*(.*)$', re.S)
+_ARGUMENT = re.compile(r'^([A-Za-z_]\w*)\s*(?:\[\s*(\d+)\s*\])?$')
+_QREG = re.compile(r'^qreg\s+([A-Za-z_]\w*)\s*\[\s*(\d+)\s*\]$')
+_QUBIT = re.compile(r'^qubit\s*(?:\[\s*(\d+)\s*\])?\s+([A-Za-z_]\w*)$')
+_INPUT = re.compile(r'^input\s+(?:float|angle)\s*(?:\[\s*\d+\s*\])?\s+([A-Za-z_]\w*)$')
+_IGNORED = ('OPENQASM', 'include', 'creg', 'bit', 'measure')
+_UNSUPPORTED = ('gate', 'opaque', 'def', 'defcal', 'if', 'for', 'while', 'reset', 'ctrl', \
+    'inv', 'pow', 'negctrl', 'gphase')
+
+_CONSTANTS = {'pi': numpy.pi, 'tau': 2 * numpy.pi, 'euler': numpy.e}
+_FUNCTIONS = {'sin': numpy.sin, 'cos': numpy.cos, 'tan': numpy.tan, 'exp': numpy.exp, \
+    'ln': numpy.log, 'sqrt': numpy.sqrt, 'arcsin': numpy.arcsin, 'arccos': numpy.arccos, \
+    'arctan': numpy.arctan}
+_OPERATORS = {ast.Add: lambda a, b: a + b, ast.Sub: lambda a, b: a - b, \
+    ast.Mult: lambda a, b: a * b, ast.Div: lambda a, b: a / b, ast.Pow: lambda a, b: a ** b}
+
+_prototypes = {}
+
+def _shared(gates, name):
+    """Returns the instance of a gate without arguments which is shared inside one imported
+    circuit, just like gates which are reused when a circuit is built. Every import has its own
+    gates, and the exporter compares the gates against its private prototypes.
+
+    Arguments:
+        gates {dict} -- The shared gates of the import (or the prototypes of the exporter)
+        name {str} -- QASM name of the gate
+    """
+
+    if name not in gates:
+        if name == 'id':
+            gates[name] = gate.Gate()
+
+        elif name in ('sdg', 'tdg'):
+            gates[name] = gate.Dagger(_shared(gates, name[0]))
+
+        else:
+            gates[name] = {'x': gate.PauliX, 'y': gate.PauliY, 'z': gate.PauliZ, \
+                'h': gate.Hadamard, 's': gate.Phase, 't': gate.Pi8, 'swap': gate.Swap, \
+                'cz': gate.ControlledZ}[name]()
+
+    return gates[name]
+
+def _standard(gates, name, *args):
+    """Returns the shared instance of a standard gate with the given arguments.
+
+    Arguments:
+        gates {dict} -- The shared gates of the import (or the prototypes of the exporter)
+        name {str} -- Name of the class of the gate
+        args {tuple} -- Arguments of the initialization
+    """
+
+    if (name, args) not in gates:
+        gates[(name, args)] = getattr(gate, name)(*args)
+
+    return gates[(name, args)]
+
+def _u3_matrix(theta, phi, lam):
+    """Returns the matrix of the u3 gate.
+
+    Arguments:
+        theta {float} -- Rotation angle
+        phi {float} -- First phase angle
+        lam {float} -- Second phase angle
+    """
+
+    return numpy.array([
+        [numpy.cos(theta / 2), -numpy.exp(1j * lam) * numpy.sin(theta / 2)],
+        [numpy.exp(1j * phi) * numpy.sin(theta / 2), numpy.exp(1j * (phi + lam)) * \
+            numpy.cos(theta / 2)]
+        ], dtype=complex)
+
+def _single_matrix(name, values):
+    """Returns the matrix of a single qubit gate which has no class in the package.
+
+    Arguments:
+        name {str} -- QASM name of the gate
+        values {list} -- Values of the arguments of the gate
+    """
+
+    if name in ('u3', 'u', 'U'):
+        return _u3_matrix(*values)
+
+    if name == 'u2':
+        return _u3_matrix(numpy.pi / 2, values[0], values[1])
+
+    if name in ('u1', 'p', 'phase'):
+        return numpy.diag([1, numpy.exp(1j * values[0])])
+
+    if name == 'sx':
+        return numpy.array([[1 + 1j, 1 - 1j], [1 - 1j, 1 + 1j]]) / 2
+
+    if name == 'sxdg':
+        return numpy.array([[1 - 1j, 1 + 1j], [1 + 1j, 1 - 1j]]) / 2
+
+    return numpy.asarray(_single_gate(_prototypes, name, values).get_matrix(), dtype=complex)
+
+def _single_gate(gates, name, values):
+    """Returns a single qubit gate.
+
+    Arguments:
+        gates {dict} -- The shared gates of the import
+        name {str} -- QASM name of the gate
+        values {list} -- Values of the arguments of the gate
+    """
+
+    if name in ('id', 'x', 'y', 'z', 'h', 's', 't', 'sdg', 'tdg'):
+        return _shared(gates, name)
+
+    if name in ('rx', 'ry', 'rz'):
+        return getattr(gate, 'Rotation' + name[1].upper())(values[0])
+
+    return _custom_gate(name.upper(), _single_matrix(name, values))
+
+def _custom_gate(name, matrix):
+    """Returns a gate with the given name and matrix.
+
+    Arguments:
+        name {str} -- Name of the gate
+        matrix {numpy.ndarray} -- Matrix of the gate
+    """
+
+    g = gate.Gate()
+    g.set_name(name)
+    g.set_matrix(numpy.matrix(matrix))
+    return g
+
+_ARITIES = {'id': (0, 1), 'x': (0, 1), 'y': (0, 1), 'z': (0, 1), 'h': (0, 1), 's': (0, 1), \
+    't': (0, 1), 'sdg': (0, 1), 'tdg': (0, 1), 'sx': (0, 1), 'sxdg': (0, 1), 'rx': (1, 1), \
+    'ry': (1, 1), 'rz': (1, 1), 'p': (1, 1), 'phase': (1, 1), 'u1': (1, 1), 'u2': (2, 1), \
+    'u3': (3, 1), 'u': (3, 1), 'U': (3, 1), 'cx': (0, 2), 'CX': (0, 2), 'cy': (0, 2), \
+    'cz': (0, 2), 'ch': (0, 2), 'swap': (0, 2), 'crx': (1, 2), 'cry': (1, 2), 'crz': (1, 2), \
+    'cp': (1, 2), 'cphase': (1, 2), 'cu1': (1, 2), 'cu3': (3, 2), 'cu': (4, 2), 'ccx': (0, 3), \
+    'cswap': (0, 3)}
+
+_SWAP_MATRIX = numpy.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]])
+
+def _block_gate(gates, name, values, ranks):
+    """Returns the gate of a multi-qubit statement whose qubits are next to each other.
+
+    Arguments:
+        gates {dict} -- The shared gates of the import
+        name {str} -- QASM name of the gate
+        values {list} -- Values of the arguments of the gate
+        ranks {list} -- Position of the qubits of the statement in the block
+    """
+
+    if name in ('cz', 'swap'):
+        return _shared(gates, name)
+
+    if name in ('cx', 'CX'):
+        return _standard(gates, 'CNOT', ranks[0], ranks[1])
+
+    if name == 'ccx':
+        return _standard(gates, 'Toffoli', ranks[2])
+
+    if name == 'cswap':
+        return _standard(gates, 'Fredkin', ranks[0])
+
+    matrix = numpy.identity(4, dtype=complex)
+    if name == 'cu':
+        matrix[2:, 2:] = numpy.exp(1j * values[3]) * _u3_matrix(*values[:3])
+
+    else:
+        matrix[2:, 2:] = _single_matrix(name[1:], values)
+
+    if ranks[0] == 1:
+        matrix = numpy.dot(numpy.dot(_SWAP_MATRIX, matrix), _SWAP_MATRIX)
+
+    return _custom_gate(name.upper(), matrix)
+
+def _evaluate(node, inputs):
+    """Returns the value of a parsed parameter expression.
+
+    Arguments:
+        node {ast.AST} -- The parsed expression
+        inputs {set} -- Names of the declared inputs
+    """
+
+    if isinstance(node, ast.Expression):
+        return _evaluate(node.body, inputs)
+
+    if isinstance(node, ast.Name) and node.id in inputs:
+        return parameter.Parameter(node.id)
+
+    value = float(_number(node, inputs))
+    if not numpy.isfinite(value):
+        raise ValueError('parameter value is not finite')
+
+    return value
+
+def _number(node, inputs):
+    """Returns the numerical value of a parsed parameter expression.
+
+    Arguments:
+        node {ast.AST} -- The parsed expression
+        inputs {set} -- Names of the declared inputs
+    """
+
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return float(node.value)
+
+    if isinstance(node, ast.Name) and node.id in _CONSTANTS:
+        return _CONSTANTS[node.id]
+
+    if isinstance(node, ast.Name) and node.id in inputs:
+        raise ValueError('expressions of inputs are not supported')
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        value = _number(node.operand, inputs)
+        return -value if isinstance(node.op, ast.USub) else value
+
+    if isinstance(node, ast.BinOp) and type(node.op) in _OPERATORS:
+        return _OPERATORS[type(node.op)](_number(node.left, inputs), _number(node.right, inputs))
+
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) \
+        and node.func.id in _FUNCTIONS and len(node.args) == 1:
+        return _FUNCTIONS[node.func.id](_number(node.args[0], inputs))
+
+    raise ValueError('unsupported expression')
+
+def _split(text):
+    """Splits a comma separated list at the commas which are not in parentheses.
+
+    Arguments:
+        text {str} -- The comma separated list
+    """
+
+    parts = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(text):
+
+        depth = depth + (char == '(') - (char == ')')
+        if char == ',' and depth == 0:
+            parts.append(text[start:i].strip())
+            start = i + 1
+
+    parts.append(text[start:].strip())
+    return [part for part in parts if part]
+
+def _statements(stream):
+    """Generator of the (line number, statement) pairs of a QASM program without comments.
+
+    Arguments:
+        stream {} -- Iterable of the lines of the program
+    """
+
+    buffer = []
+    comment = False
+    number = 0
+    for number, line in enumerate(stream, 1):
+
+        while line:
+
+            if comment:
+                end = line.find('*/')
+                if end < 0:
+                    break
+
+                comment = False
+                line = line[end + 2:]
+                continue
+
+            cut = [i for i in (line.find('//'), line.find('/*'), line.find(';')) if i >= 0]
+            if not cut:
+                buffer.append(line)
+                break
+
+            position = min(cut)
+            buffer.append(line[:position])
+            if line.startswith('//', position):
+                break
+
+            if line.startswith('/*', position):
+                comment = True
+                line = line[position + 2:]
+                continue
+
+            statement = ' '.join(''.join(buffer).split())
+            buffer = []
+            line = line[position + 1:]
+            if statement:
+                yield number, statement
+
+    if ''.join(buffer).strip():
+        yield number, ' '.join(''.join(buffer).split())
+
+def read(source):
+    """This function reads a circuit from an OpenQASM 2 or OpenQASM 3 program.
+
+    Arguments:
+        source {str, file} -- The program or a file object of the program
+
+    Raises:
+        ValueError
+
+    Examples:
+        >>> import qvantum.qasm
+        >>>
+        >>> c = qvantum.qasm.read('OPENQASM 2.0; include "qelib1.inc"; qreg q[2]; h q[0]; ' + \
+                'cx q[0], q[1];')
+        >>> c.get_layer_number()
+        2
+    """
+
+    if isinstance(source, str):
+        source = io.StringIO(source)
+
+    registers = collections.OrderedDict()
+    inputs = set()
+    gates = {}
+    builder = None
+    for number, statement in _statements(source):
+
+        try:
+            builder = _read_statement(statement, registers, inputs, gates, builder)
+
+        except (ValueError, TypeError, ZeroDivisionError, OverflowError) as error:
+            raise ValueError('Invalid input! Line ' + str(number) + ': ' + str(error) + '.')
+
+    if not registers:
+        raise ValueError('Invalid input! The program has no qubits.')
+
+    if builder is None:
+        builder = builder_module.CircuitBuilder(_register_size(registers), _WINDOW)
+
+    return builder.build()
+
+def _register_size(registers):
+    """Returns the number of qubits of the registers.
+
+    Arguments:
+        registers {OrderedDict} -- Offsets and sizes of the quantum registers
+    """
+
+    return sum(size for offset, size in registers.values())
+
+def _read_statement(statement, registers, inputs, gates, builder):
+    """Processes one statement of a QASM program and returns the builder of the circuit.
+
+    Arguments:
+        statement {str} -- The statement
+        registers {OrderedDict} -- Offsets and sizes of the quantum registers
+        inputs {set} -- Names of the declared inputs
+        gates {dict} -- The shared gates of the import
+        builder {CircuitBuilder, None} -- The builder of the circuit
+    """
+
+    keyword = statement.split(' ', 1)[0].split('(', 1)[0].split('[', 1)[0]
+    match = _QREG.match(statement) or _QUBIT.match(statement)
+    if match:
+        if builder is not None:
+            raise ValueError('qubits must be declared before the gates')
+
+        name, size = match.group(1), match.group(2)
+        if statement.startswith('qubit'):
+            name, size = size, name or 1
+
+        registers[name] = (_register_size(registers), int(size))
+        return None
+
+    match = _INPUT.match(statement)
+    if match:
+        inputs.add(match.group(1))
+        return builder
+
+    if keyword in _IGNORED or ('=' in statement and 'measure' in statement):
+        return builder
+
+    if keyword in _UNSUPPORTED or '@' in statement:
+        raise ValueError('unsupported statement \'' + statement + '\'')
+
+    if builder is None:
+        if not registers:
+            raise ValueError('qubits must be declared before the gates')
+
+        builder = builder_module.CircuitBuilder(_register_size(registers), _WINDOW)
+
+    name, arguments, operands = _STATEMENT.match(statement).groups()
+    operands = [_operand(operand, registers) for operand in _split(operands)]
+    if name == 'barrier':
+        wires = sorted(set(wire for operand in operands for wire in operand)) or \
+            list(range(_register_size(registers)))
+        builder.barrier(wires)
+        return builder
+
+    if name not in _ARITIES:
+        raise ValueError('unsupported gate \'' + name + '\'')
+
+    values = [_evaluate(ast.parse(argument.replace('π', 'pi').replace('^', '**'), mode='eval'), inputs) \
+        for argument in _split(arguments or '')]
+    if len(values) != _ARITIES[name][0] or len(operands) != _ARITIES[name][1]:
+        raise ValueError('wrong number of arguments of gate \'' + name + '\'')
+
+    if any(isinstance(value, parameter.Parameter) for value in values) \
+        and name not in ('rx', 'ry', 'rz'):
+        raise ValueError('only rx, ry and rz gates can have input parameters')
+
+    sizes = set(len(operand) for operand in operands if len(operand) > 1)
+    if len(sizes) > 1:
+        raise ValueError('registers of different sizes')
+
+    for i in range(sizes.pop() if sizes else 1):
+
+        qubits = [operand[i if len(operand) > 1 else 0] for operand in operands]
+        _apply(builder, gates, name, values, qubits)
+
+    return builder
+
+def _operand(operand, registers):
+    """Returns the list of qubit indices of an operand like q[1] or q.
+
+    Arguments:
+        operand {str} -- The operand
+        registers {OrderedDict} -- Offsets and sizes of the quantum registers
+    """
+
+    match = _ARGUMENT.match(operand)
+    if not match or match.group(1) not in registers:
+        raise ValueError('unknown qubit \'' + operand + '\'')
+
+    offset, size = registers[match.group(1)]
+    if match.group(2) is None:
+        return list(range(offset, offset + size))
+
+    if int(match.group(2)) >= size:
+        raise ValueError('qubit index out of range \'' + operand + '\'')
+
+    return [offset + int(match.group(2))]
+
+def _apply(builder, gates, name, values, qubits):
+    """Adds the gate of one gate statement to the circuit.
+
+    Arguments:
+        builder {CircuitBuilder} -- The builder of the circuit
+        gates {dict} -- The shared gates of the import
+        name {str} -- QASM name of the gate
+        values {list} -- Values of the arguments of the gate
+        qubits {list} -- Indices of the qubits
+    """
+
+    if len(set(qubits)) != len(qubits):
+        raise ValueError('a gate can\'t act on the same qubit twice')
+
+    if len(qubits) == 1:
+        builder.add(_single_gate(gates, name, values), qubits[0])
+        return
+
+    ordered = sorted(qubits)
+    builder.add(_block_gate(gates, name, values, [ordered.index(qubit) for qubit in qubits]), \
+        ordered)
+
+def _format(value):
+    """Returns the QASM form of an angle.
+
+    Arguments:
+        value {int, float, Parameter} -- The angle
+    """
+
+    if isinstance(value, parameter.Parameter):
+        return value.get_name()
+
+    return repr(float(value))
+
+def _u3_angles(matrix):
+    """Returns the angles of the u3 gate which equals the matrix up to global phase.
+
+    Arguments:
+        matrix {numpy.ndarray} -- Single qubit unitary matrix
+    """
+
+    theta = 2 * numpy.arctan2(abs(matrix[1, 0]), abs(matrix[0, 0]))
+    if abs(matrix[0, 0]) > 1e-12:
+        alpha = numpy.angle(matrix[0, 0])
+        if abs(matrix[1, 0]) > 1e-12:
+            return theta, numpy.angle(matrix[1, 0]) - alpha, numpy.angle(-matrix[0, 1]) - alpha
+
+        return theta, 0.0, numpy.angle(matrix[1, 1]) - alpha
+
+    alpha = numpy.angle(matrix[1, 0])
+    return theta, 0.0, numpy.angle(-matrix[0, 1]) - alpha
+
+def _matches(g, prototype):
+    """Checks whether the gate has the same matrix as the prototype."""
+
+    return numpy.array_equal(numpy.asarray(g.get_matrix()), numpy.asarray(prototype.get_matrix()))
+
+def _controlled_lines(control, target, unitary, version):
+    """Returns the QASM statements of a controlled single qubit gate.
+
+    Arguments:
+        control {str} -- The control qubit
+        target {str} -- The target qubit
+        unitary {numpy.ndarray} -- Matrix of the gate on the target qubit
+        version {int} -- Version of OpenQASM (2 or 3)
+    """
+
+    theta, phi, lam = _u3_angles(unitary)
+    alpha = numpy.angle(unitary[0, 0]) if abs(unitary[0, 0]) > 1e-12 else \
+        numpy.angle(unitary[1, 0]) - phi
+    angles = _format(theta) + ',' + _format(phi) + ',' + _format(lam)
+    if version == 3:
+        return ['cu(' + angles + ',' + _format(alpha) + ') ' + control + ', ' + target + ';']
+
+    lines = ['cu3(' + angles + ') ' + control + ', ' + target + ';']
+    if abs(alpha) > 1e-12:
+        lines.append('u1(' + _format(alpha) + ') ' + control + ';')
+
+    return lines
+
+def _decomposed_lines(q, matrix, version):
+    """Returns the QASM statements of a two qubit gate by its cosine-sine decomposition
+    (L0 + L1) [[C, -S], [S, C]] (R0 + R1), where the first qubit selects the blocks. The
+    multiplexed gates are written as single qubit gates and controlled gates, up to global phase.
+
+    Arguments:
+        q {list} -- The qubits of the gate
+        matrix {numpy.ndarray} -- Matrix of the gate
+        version {int} -- Version of OpenQASM (2 or 3)
+    """
+
+    l0, c, r0 = numpy.linalg.svd(matrix[:2, :2])
+    columns = numpy.dot(matrix[2:, :2], r0.conj().T)
+    s = numpy.linalg.norm(columns, axis=0)
+    l1 = numpy.identity(2, dtype=complex)
+    if s[1] > 1e-12:
+        l1[:, 1] = columns[:, 1] / s[1]
+        l1[:, 0] = columns[:, 0] / s[0] if s[0] > 1e-12 else \
+            [-numpy.conj(l1[1, 1]), numpy.conj(l1[0, 1])]
+
+    r1 = numpy.empty((2, 2), dtype=complex)
+    for k in range(2):
+
+        if c[k] >= s[k]:
+            r1[k] = numpy.dot(l1[:, k].conj(), matrix[2:, 2:]) / c[k]
+
+        else:
+            r1[k] = -numpy.dot(l0[:, k].conj(), matrix[:2, 2:]) / s[k]
+
+    angles = 2 * numpy.arctan2(s, c)
+    factors = [
+        (q[0], q[1], numpy.dot(r0.conj().T, r1)), (None, q[1], r0),
+        (q[1], q[0], _u3_matrix(angles[1] - angles[0], 0, 0)), \
+            (None, q[0], _u3_matrix(angles[0], 0, 0)),
+        (q[0], q[1], numpy.dot(l0.conj().T, l1)), (None, q[1], l0)
+        ]
+
+    lines = []
+    for control, target, unitary in factors:
+
+        if numpy.allclose(unitary, unitary[0, 0] * numpy.identity(2)) \
+            and (control is None or numpy.allclose(unitary, numpy.identity(2))):
+            continue
+
+        if control is None:
+            lines.append('u3(' + ','.join(_format(angle) for angle in _u3_angles(unitary)) + \
+                ') ' + target + ';')
+
+        else:
+            lines.extend(_controlled_lines(control, target, unitary, version))
+
+    return lines
+
+def _operation_lines(position, g, version):
+    """Returns the QASM statements of an operation.
+
+    Arguments:
+        position {int} -- Index of the first qubit of the gate
+        g {gate} -- The gate
+        version {int} -- Version of OpenQASM (2 or 3)
+    """
+
+    q = ['q[' + str(position + i) + ']' for i in range(3)]
+    if type(g) in (gate.Rotation, gate.RotationX, gate.RotationY, gate.RotationZ):
+        theta = g.get_theta()
+        if version == 2 and isinstance(theta, parameter.Parameter):
+            theta = g.get_value()
+            if theta is None:
+                raise ValueError('Invalid input! Unbound parameter ' + repr(g.get_theta()) + \
+                    ' can\'t be exported to OpenQASM 2.')
+
+        return ['r' + g.get_axis().lower() + '(' + _format(theta) + ') ' + q[0] + ';']
+
+    if type(g) is gate.Ising and isinstance(g.get_phi(), parameter.Parameter):
+        if version == 2 and g.get_value() is None:
+            raise ValueError('Invalid input! Unbound parameter ' + repr(g.get_phi()) + \
+                ' can\'t be exported to OpenQASM 2.')
+
+        if version == 3:
+            # Ising(phi) = (RZ(-phi / 2) x RZ(-phi / 2)) Ising(0) (RZ(phi / 2) x RZ(phi / 2))
+            name = _format(g.get_phi())
+            return ['rz(' + name + '/2) ' + q[0] + ';', 'rz(' + name + '/2) ' + q[1] + ';'] + \
+                _decomposed_lines(q, numpy.asarray(gate.Ising.ising_matrix(0)), version) + \
+                ['rz(-' + name + '/2) ' + q[0] + ';', 'rz(-' + name + '/2) ' + q[1] + ';']
+
+    matrix = numpy.asarray(g.get_matrix(), dtype=complex)
+    if numpy.array_equal(matrix, numpy.identity(len(matrix))):
+        return []
+
+    if len(matrix) == 2:
+        for name in ('x', 'y', 'z', 'h', 's', 't', 'sdg', 'tdg'):
+
+            if _matches(g, _shared(_prototypes, name)):
+                return [name + ' ' + q[0] + ';']
+
+        angles = ','.join(_format(angle) for angle in _u3_angles(matrix))
+        return ['u3(' + angles + ') ' + q[0] + ';']
+
+    if len(matrix) == 4:
+        if _matches(g, _standard(_prototypes, 'CNOT', 0, 1)):
+            return ['cx ' + q[0] + ', ' + q[1] + ';']
+
+        if _matches(g, _standard(_prototypes, 'CNOT', 1, 0)):
+            return ['cx ' + q[1] + ', ' + q[0] + ';']
+
+        for name in ('cz', 'swap'):
+
+            if _matches(g, _shared(_prototypes, name)):
+                return [name + ' ' + q[0] + ', ' + q[1] + ';']
+
+        diagonal = numpy.diag(matrix)
+        if numpy.array_equal(numpy.diag(diagonal), matrix) \
+            and numpy.allclose(diagonal[:3], 1):
+            name = 'cu1(' if version == 2 else 'cp('
+            return [name + _format(numpy.angle(diagonal[3])) + ') ' + q[0] + ', ' + q[1] + ';']
+
+        for control, target, block in ((q[0], q[1], matrix), \
+            (q[1], q[0], numpy.dot(numpy.dot(_SWAP_MATRIX, matrix), _SWAP_MATRIX))):
+
+            if numpy.allclose(block[:2, :], numpy.identity(4)[:2, :]) \
+                and numpy.allclose(block[2:, :2], 0):
+                return _controlled_lines(control, target, block[2:, 2:], version)
+
+        return _decomposed_lines(q, matrix, version)
+
+    if len(matrix) == 8:
+        for i in range(3):
+
+            if _matches(g, _standard(_prototypes, 'Toffoli', i)):
+                controls = [q[j] for j in range(3) if j != i]
+                return ['ccx ' + controls[0] + ', ' + controls[1] + ', ' + q[i] + ';']
+
+            if _matches(g, _standard(_prototypes, 'Fredkin', i)):
+                targets = [q[j] for j in range(3) if j != i]
+                return ['cswap ' + q[i] + ', ' + targets[0] + ', ' + targets[1] + ';']
+
+    raise ValueError('Invalid input! Gate ' + g.get_name() + ' can\'t be exported.')
+
+def write(c, stream=None, version=2):
+    """This function writes a circuit as an OpenQASM program. The statements are written into
+    the stream layer by layer if it's given, otherwise the program is returned as a string.
+
+    Arguments:
+        c {Circuit} -- The circuit
+
+    Keyword Arguments:
+        stream {file, None} -- File object which the program is written into (default: {None})
+        version {int} -- Version of OpenQASM: 2 or 3 (default: {2})
+
+    Raises:
+        ValueError
+
+    Examples:
+        >>> import qvantum.qasm
+        >>>
+        >>> c = qvantum.Circuit([qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()]), \
+                qvantum.Layer([qvantum.CNOT(0, 1)])])
+        >>> print(qvantum.qasm.write(c))
+        OPENQASM 2.0;
+        include "qelib1.inc";
+        qreg q[2];
+        h q[0];
+        cx q[0], q[1];
+    """
+
+    lines = []
+    output = lines.append if stream is None else lambda line: stream.write(line + '\n')
+    size = c.get_circuit_size()
+    if version == 2:
+        output('OPENQASM 2.0;')
+        output('include "qelib1.inc";')
+        output('qreg q[' + str(size) + '];')
+
+    else:
+        output('OPENQASM 3.0;')
+        output('include "stdgates.inc";')
+        for p in c.get_parameters():
+
+            output('input float[64] ' + p.get_name() + ';')
+
+        output('qubit[' + str(size) + '] q;')
+
+    for l in c.get_layer_list().values():
+
+        position = 0
+        for g in l.get_gate_list().values():
+
+            for line in _operation_lines(position, g, version):
+
+                output(line)
+
+            position = position + int(g.get_size()).bit_length() - 1
+
+    if stream is None:
+        return '\n'.join(lines) + '\n'
@@ -3,10 +3,12 @@
 # pylint: disable=E1101, W1401
 
 from . import check_register
-import collections
-import itertools
+import json
 import numpy
+import os
+from . import pauli
 import unicodedata
+import uuid
 
 class Register(object):
     """register class
@@ -32,13 +34,24 @@ class Register(object):
     - get_states()        - getter of states
     - get_amplitudes()    - getter of amplitudes
     - set_amplitudes()    - setter of amplitudes
+    - get_vector()        - getter of amplitudes as numpy array
+    - set_vector()        - setter of amplitudes from numpy array
+    - iter_amplitudes()   - generator of states and amplitudes
     - show()              - register representation
     - measure_register()  - measure the whole register
     - measure_nth_qubit() - measure the n-th qubit
     - ket()               - return the ket vector of register
     - bra()               - return the bra vector of register
+    - expectation()       - expectation value of a Pauli string or a sum of them
     - delete_qubit()      - delete qubit from register
+    - partial_trace()     - reduced density matrix without the n-th qubit
     - insert_qubit()      - insert qubit into register
+    - save()              - save checkpoint of register into file
+    - load()              - load register from checkpoint file
+
+    The amplitudes are stored in a numpy array in the order of the states, i.e. the n-th element
+    belongs to the state which is the binary representation of n (the 0th qubit is the most
+    significant bit).
     """
 
     @check_register.register_init_check
@@ -65,24 +78,12 @@ class Register(object):
 
         self.__coeff_list = [[q.get_alpha(), q.get_beta()] for q in qubit_list]
 
-        states_list = list(itertools.product(range(2), repeat=len(qubit_list)))
-        states = [''.join(map(str, states_list[i])) for i in range(len(states_list))]
-        states.sort()
-        coeffs = []
-        for state in states:
-
-            product = 1
-            for i in range(len(state)):
-                
-                if state[i] == '0':
-                    product = product * qubit_list[i].get_alpha()
-
-                else:
-                    product = product * qubit_list[i].get_beta()
+        vector = numpy.ones(1, dtype=complex)
+        for q in qubit_list:
 
-            coeffs.append(product)
+            vector = numpy.kron(vector, numpy.array([q.get_alpha(), q.get_beta()], dtype=complex))
 
-        self.__state_vector = collections.OrderedDict(zip(states, coeffs))
+        self.__state_vector = vector
 
     def get_coeff_list(self):
         """Method to return the coefficients of the qubits in the regsiter.
@@ -167,11 +168,12 @@ class Register(object):
             '10'
         """
 
+        pattern = '{0:0' + str(self.get_qubit_number()) + 'b}'
         if nth is None:
-            return list(self.__state_vector.keys())
+            return [pattern.format(i) for i in range(self.get_state_number())]
         
         else:
-            return list(self.__state_vector.keys())[nth]
+            return pattern.format(range(self.get_state_number())[nth])
 
     @check_register.get_amplitudes_check
     def get_amplitudes(self, nth=None):
@@ -199,10 +201,10 @@ class Register(object):
         """
 
         if nth is None:
-            return list(self.__state_vector.values())
+            return list(self.__state_vector)
 
         else:
-            return list(self.__state_vector.values())[nth]
+            return self.__state_vector[nth]
     
     @check_register.set_amplitudes_check
     def set_amplitudes(self, amp_list):
@@ -231,18 +233,122 @@ class Register(object):
         """
 
         if len(amp_list) == self.get_state_number():
-            i = 0
-            for key in self.__state_vector:
-
-                self.__state_vector[key] = amp_list[i]
-                i = i + 1
+            self.__state_vector = numpy.array(amp_list, dtype=complex)
 
         else:
             raise ValueError('Invalid input! The amplitudes list must be the same size as the ' +\
                 'number of possible states.')
 
-    def show(self):
-        """Method to show the state function of the register object.
+    def get_vector(self):
+        """Method to return the amplitudes of the register as a one dimensional numpy array. The 
+        array is a read-only view of the storage of the register, so nothing is copied.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> q1 = qvantum.Qubit(1, 0)
+            >>> q2 = qvantum.Qubit(0, 1)
+            >>>
+            >>> r = qvantum.Register([q1, q2])
+            >>> r.get_vector()
+            array([0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j])
+        """
+
+        vector = self.__state_vector.view()
+        vector.flags.writeable = False
+        return vector
+
+    @check_register.set_vector_check
+    def set_vector(self, vector):
+        """Method to set new amplitudes from a one dimensional numpy array. The length of the 
+        array must be equal to the number of possible states and the squared sum of the absolute 
+        values must be equal to 1. A writeable complex array is used as it is, without copying.
+        
+        Arguments:
+            vector {numpy.ndarray} -- Array of amplitudes
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import numpy
+            >>> import qvantum
+            >>>
+            >>> q1 = qvantum.Qubit(1, 0)
+            >>> q2 = qvantum.Qubit(0, 1)
+            >>>
+            >>> r = qvantum.Register([q1, q2])
+            >>> r.set_vector(numpy.array([0, 0, 1, 0]))
+            >>> r.show()
+            '|Ψ> = (0.0000+0.0000i)|00> + (0.0000+0.0000i)|01> + (1.0000+0.0000i)|10> + (0.0000+0.0000i)|11>'
+        """
+
+        if vector.dtype != complex or not vector.flags.writeable or not vector.flags.c_contiguous:
+            vector = numpy.array(vector, dtype=complex)
+
+        self.__state_vector = vector
+
+    @check_register.iter_amplitudes_check
+    def iter_amplitudes(self, top=None, threshold=None):
+        """Generator method to stream the states and their amplitudes as (state, amplitude) 
+        pairs. If top is given, only the top amplitudes with the largest absolute values are 
+        yielded in decreasing order (they are selected with argpartition, so the whole vector is 
+        not sorted). If threshold is given, only the amplitudes whose absolute value is larger 
+        than the threshold are yielded. Without arguments every state is yielded in order.
+        
+        Keyword Arguments:
+            top {int, None} -- Number of dominant amplitudes (default: {None})
+            threshold {int, float, None} -- Lower bound of absolute values (default: {None})
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> q1 = qvantum.Random_Qubit()
+            >>> q2 = qvantum.Random_Qubit()
+            >>>
+            >>> r = qvantum.Register([q1, q2])
+            >>> r.show()
+            '|Ψ> = (0.1096+0.0234i)|00> + (0.0122-0.3006i)|01> + (-0.3031-0.1320i)|10> + (-0.2118+0.8619i)|11>'
+            >>> list(r.iter_amplitudes(top=2))
+            [('11', (-0.2118+0.8619j)), ('10', (-0.3031-0.1320j))]
+        """
+
+        magnitudes = numpy.absolute(self.__state_vector)
+        if threshold is None:
+            indices = numpy.arange(len(magnitudes))
+
+        else:
+            indices = numpy.flatnonzero(magnitudes > threshold)
+
+        if top is not None:
+            if top < len(indices):
+                indices = numpy.sort(indices[numpy.argpartition(-magnitudes[indices], top - 1)[:top]])
+
+            indices = indices[numpy.argsort(-magnitudes[indices], kind='stable')]
+
+        pattern = '{0:0' + str(self.get_qubit_number()) + 'b}'
+        for index in indices:
+
+            yield pattern.format(index), complex(self.__state_vector[index])
+
+    @check_register.show_check
+    def show(self, top=None, threshold=None, max_chars=None):
+        """Method to show the state function of the register object. Without arguments every 
+        state is shown. The top and threshold arguments select the dominant amplitudes like in 
+        iter_amplitudes() and max_chars limits the length of the result, the omitted terms are 
+        replaced with '...'. It must be at least 9, the length of '|Ψ> = ...'. These make the 
+        method usable on large registers.
+        
+        Keyword Arguments:
+            top {int, None} -- Number of dominant amplitudes to show (default: {None})
+            threshold {int, float, None} -- Lower bound of absolute values (default: {None})
+            max_chars {int, None} -- Maximal length of the result (default: {None})
+        
+        Raises:
+            ValueError, TypeError
 
         Examples:
             >>> import qvantum
@@ -254,20 +360,35 @@ class Register(object):
             >>> r = qvantum.Register([q1, q2, q3])
             >>> r.show()
             '|Ψ> = (0.3299-0.0125i)|000> + (-0.2215-0.2264i)|001> + (-0.4390+0.3714i)|010> + (0.5469+0.0726i)|011> + (0.1145-0.0835i)|100> + (-0.1332-0.0276i)|101> + (-0.0674+0.2375i)|110> + (0.2123-0.1052i)|111>'
+            >>> r.show(top=2)
+            '|Ψ> = (-0.4390+0.3714i)|010> + (0.5469+0.0726i)|011>'
+            >>> r.show(threshold=0.3, max_chars=40)
+            '|Ψ> = (0.3299-0.0125i)|000> + ...'
         """
 
-        keys = list(self.__state_vector.keys())
-        values = list(self.__state_vector.values())
-        state_string = '|' + unicodedata.lookup('GREEK CAPITAL LETTER PSI') + '> ='
-        
-        for i in range(len(keys)):
+        head = '|' + unicodedata.lookup('GREEK CAPITAL LETTER PSI') + '> = '
+        terms = []
+        length = len(head) - 3
+        amplitudes = self.iter_amplitudes(top, threshold)
+        following = next(amplitudes, None)
+        while following is not None:
 
-            state_string = state_string + ' ' + '({0:.4f}{1}{2:.4f}i)'.format(values[i].real, \
-                '+-'[values[i].imag < 0], abs(values[i].imag)) + '|' + keys[i] + '> +'
-        
-        state_string = state_string[:-2]
+            state, amplitude = following
+            following = next(amplitudes, None)
+            term = '({0:.4f}{1}{2:.4f}i)|{3}>'.format(amplitude.real, \
+                '+-'[bool(amplitude.imag < 0)], abs(amplitude.imag), state)
+            length = length + len(term) + 3
+            if max_chars is not None \
+                and length + (0 if following is None else len(' + ...')) > max_chars:
+                terms.append('...')
+                break
+
+            terms.append(term)
 
-        return state_string
+        if not terms:
+            terms.append('...')
+
+        return head + ' + '.join(terms)
 
     def measure_register(self):
         """Method to perform a measurement on the whole register and return the final state of the 
@@ -290,17 +411,12 @@ class Register(object):
             '|Ψ> = (0.0000+0.0000i)|000> + (0.0000+0.0000i)|001> + (1.0000+0.0000i)|010> + (0.0000+0.0000i)|011> + (0.0000+0.0000i)|100> + (0.0000+0.0000i)|101> + (0.0000+0.0000i)|110> + (0.0000+0.0000i)|111>'
         """
 
-        result = numpy.random.choice(list(self.__state_vector.keys()), \
-            p=list(numpy.square(numpy.absolute(numpy.array(list(self.__state_vector.values()))))))
-        for key in self.__state_vector:
-
-            if key == result:
-                self.__state_vector[key] = 1
+        probs = numpy.square(numpy.absolute(self.__state_vector))
+        index = numpy.random.choice(len(probs), p=probs / numpy.sum(probs))
+        self.__state_vector = numpy.zeros(len(probs), dtype=complex)
+        self.__state_vector[index] = 1
 
-            else:
-                self.__state_vector[key] = 0
-
-        return result
+        return self.get_states(int(index))
     
     @check_register.measure_nth_qubit_check
     def measure_nth_qubit(self, nth):
@@ -331,26 +447,15 @@ class Register(object):
             '|Ψ> = (0.0000+0.0000i)|000> + (0.3921+0.5707i)|001> + (0.0000+0.0000i)|010> + (0.0153-0.0315i)|011> + (0.0000+0.0000i)|100> + (0.7196-0.0095i)|101> + (0.0000+0.0000i)|110> + (-0.0184-0.0314i)|111>'
         """
 
-        result0 = []
-        for key in self.__state_vector:
-
-            if key[nth] == '0':
-                result0.append(self.__state_vector[key])
-        
-        prob0 = numpy.sum(numpy.square(numpy.absolute(numpy.array(result0))))
+        tensor = self.__split(nth)
+        prob0 = numpy.vdot(tensor[:, 0, :], tensor[:, 0, :]).real
+        prob0 = min(max(prob0, 0), 1)
         result = numpy.random.choice([0, 1], p=[prob0, 1 - prob0])
         
-        for key in self.__state_vector:
-
-            if key[nth] != str(result):
-                self.__state_vector[key] = 0
-        
-        renorm = numpy.sum(numpy.square(numpy.absolute(numpy.array( \
-            list(self.__state_vector.values())))))
-    
-        for key in self.__state_vector:
-
-            self.__state_vector[key] = self.__state_vector[key] / numpy.sqrt(renorm)
+        projected = numpy.zeros_like(tensor)
+        projected[:, result, :] = tensor[:, result, :] / \
+            numpy.sqrt(prob0 if result == 0 else 1 - prob0)
+        self.__state_vector = projected.reshape(-1)
 
         return int(result)
     
@@ -373,7 +478,7 @@ class Register(object):
                    [0.51934712-0.23166933j]])
         """
 
-        ket = numpy.array(list(self.__state_vector.values()))
+        ket = numpy.array(self.__state_vector)
         ket.shape = (len(ket), 1)
         return ket
 
@@ -396,15 +501,60 @@ class Register(object):
         bra = self.ket().transpose()
         return bra
 
+    @check_register.expectation_check
+    def expectation(self, observable):
+        """Method to return the expectation value of an observable which is a Pauli string or a 
+        weighted sum of Pauli strings. The n-th character of a Pauli string (I, X, Y or Z) acts on 
+        the n-th qubit. The value is computed from the amplitudes with bit flips and phases, no 
+        matrix is built and the register is not changed.
+        
+        Arguments:
+            observable {str, dict} -- Pauli string or dictionary of Pauli strings and weights
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> q1 = qvantum.Qubit(1, 0)
+            >>> q2 = qvantum.Qubit(0, 1)
+            >>>
+            >>> r = qvantum.Register([q1, q2])
+            >>> r.expectation('ZZ')
+            -1.0
+            >>> r.expectation({'ZI': 0.5, 'IX': -1.2})
+            0.5
+        """
+
+        return pauli.pauli_expectation(self.__state_vector, observable)
+
+    def __split(self, nth):
+        """Returns the amplitudes as a (2^nth, 2, 2^(n-nth-1)) shaped view, where the middle axis
+        belongs to the n-th qubit. Modifying the view modifies the register.
+        """
+
+        return self.__state_vector.reshape(2 ** nth, 2, \
+            2 ** (self.get_qubit_number() - nth - 1))
+
     @check_register.delete_qubit_check
-    def delete_qubit(self, nth):
-        """Method to delete the n-th qubit from the regsiter. This method has some drawback which 
-        is discussed later. The input parameter must be an integer corresponding to the number of 
-        qubits in the register.
+    def delete_qubit(self, nth, value=None):
+        """Method to delete the n-th qubit from the regsiter. The qubit is projected onto the 
+        given value (0 or 1) and removed, the remaining amplitudes are renormalized. If the value 
+        is None, the qubit is projected onto its more probable value (0 if both are equally 
+        probable), so the result is deterministic; call measure_nth_qubit() first to sample the 
+        value (see partial_trace() for the exact reduced state). If the qubit is not entangled 
+        with the others, the remaining state doesn't depend on the value (apart from a global 
+        phase). The return value is the value which the qubit was projected onto. The cost is 
+        linear in the number of states and the arrays returned by get_vector() earlier are not 
+        changed.
         
         Arguments:
             nth {int} -- Number of n-th possible qubit
         
+        Keyword Arguments:
+            value {int, None} -- Value of the qubit to project onto: 0, 1 or None (default: {None})
+        
         Raises:
             ValueError, TypeError
         
@@ -413,43 +563,67 @@ class Register(object):
             >>>
             >>> q1 = qvantum.Random_Qubit()
             >>> q2 = qvantum.Random_Qubit()
-            >>> q3 = qvantum.Random_Qubit()
+            >>> q3 = qvantum.Qubit(0, 1)
             >>>
             >>> r = qvantum.Register([q1, q2, q3])
             >>> r.show()
-            '|Ψ> = (-0.0414-0.7876i)|000> + (-0.3986-0.4355i)|001> + (-0.0142+0.0084i)|010> + (-0.0042+0.0116i)|011> + (0.1003-0.0924i)|100> + (0.0140-0.1011i)|101> + (-0.0027-0.0010i)|110> + (-0.0020+0.0007i)|111>'
+            '|Ψ> = (0.0000+0.0000i)|000> + (0.1328-0.4137i)|001> + (0.0000+0.0000i)|010> + (-0.5398-0.0290i)|011> + (0.0000+0.0000i)|100> + (0.0993+0.2655i)|101> + (0.0000+0.0000i)|110> + (0.3181-0.5772i)|111>'
             >>> r.delete_qubit(2)
+            1
             >>> r.show()
-            '|Ψ> = (0.4927-0.6160i)|00> + (-0.0083-0.5904i)|01> + (0.1364-0.0024i)|10> + (0.0777-0.0663i)|11>'            
+            '|Ψ> = (0.1328-0.4137i)|00> + (-0.5398-0.0290i)|01> + (0.0993+0.2655i)|10> + (0.3181-0.5772i)|11>'
         """
 
         if nth >= 0 and nth <= self.get_qubit_number() - 1:
-            keys =[]
-            for key in self.__state_vector:
+            tensor = self.__split(nth)
+            prob0 = min(max(numpy.vdot(tensor[:, 0, :], tensor[:, 0, :]).real, 0), 1)
+            if value is None:
+                value = 0 if prob0 >= 0.5 else 1
+
+            prob = prob0 if value == 0 else 1 - prob0
+            if round(prob, 10) == 0:
+                raise ValueError('Invalid input! The probability of the n-th qubit being ' +\
+                    str(value) + ' is 0.')
 
-                list_key = list(key)
-                list_key.pop(nth)
-                keys.append(''.join(list_key))
-            
-            values = list(self.__state_vector.values())
-            
-            self.__state_vector = collections.OrderedDict()
-            for i in range(len(keys)):
+            self.__state_vector = tensor[:, value, :].reshape(-1) / numpy.sqrt(prob)
+            self.__coeff_list.pop(nth)
 
-                if keys[i] not in list(self.__state_vector.keys()):
-                    self.__state_vector[keys[i]] = values[i]
+            return value
 
-                else:
-                    self.__state_vector[keys[i]] = self.__state_vector[keys[i]] + values[i]
+        else:
+            raise ValueError('Invalid input! Argument must be greater or equal to 0 and ' +\
+                'less or equal to ' + str(self.get_qubit_number() - 1) + '.')
+
+    @check_register.partial_trace_check
+    def partial_trace(self, nth):
+        """Method to return the reduced density matrix of the register after tracing out the n-th 
+        qubit. The register itself is not changed. The result is a 2^(n-1) x 2^(n-1) sized 
+        numpy array.
+        
+        Arguments:
+            nth {int} -- Number of n-th possible qubit
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> q1 = qvantum.Qubit(1, 0)
+            >>> q2 = qvantum.Qubit(0, 1)
+            >>>
+            >>> r = qvantum.Register([q1, q2])
+            >>> r.partial_trace(0)
+            array([[0.+0.j, 0.+0.j],
+                   [0.+0.j, 1.+0.j]])
+        """
 
-            for key in self.__state_vector:
+        if nth >= 0 and nth <= self.get_qubit_number() - 1:
+            tensor = self.__split(nth)
+            rows = tensor.shape[0] * tensor.shape[2]
+            tensor = tensor.transpose(1, 0, 2).reshape(2, rows)
 
-                if self.__coeff_list[nth][0] == -1 * self.__coeff_list[nth][1]:
-                    self.__state_vector[key] = 1
-                # qubit.Qubit(-1 / numpy.sqrt(2), 1 / numpy.sqrt(2)) causes problem
-                else:
-                    self.__state_vector[key] = self.__state_vector[key] / \
-                        (self.__coeff_list[nth][0] + self.__coeff_list[nth][1])
+            return numpy.dot(tensor.transpose(), tensor.conjugate())
 
         else:
             raise ValueError('Invalid input! Argument must be greater or equal to 0 and ' +\
@@ -458,7 +632,9 @@ class Register(object):
     @check_register.insert_qubit_check
     def insert_qubit(self, q, nth):
         """Method to insert a given qubit into a register. The input parameter must be an integer 
-        corresponding to the number of qubits in the register.
+        corresponding to the number of qubits in the register. The new amplitudes are the tensor 
+        product of the old ones and the qubit along the new axis, written directly into one new 
+        array.
         
         Arguments:
             q {qubit} -- The qubit to be inserted
@@ -486,19 +662,104 @@ class Register(object):
         """
 
         if nth >= 0 and nth <= self.get_qubit_number():
-            qubit_keys = ['0', '1']
-            qubit_values = [q.get_alpha(), q.get_beta()]
-            keys = list(self.__state_vector.keys())
-            values = list(self.__state_vector.values())
-            state_dict = collections.OrderedDict()
-            for i in range(self.get_state_number()):
-                for j in range(2):
-
-                    state_dict[keys[i][:nth] + qubit_keys[j] + keys[i][nth:]] = \
-                        values[i] * qubit_values[j]
+            tensor = self.__state_vector.reshape(2 ** nth, 1, \
+                2 ** (self.get_qubit_number() - nth))
+            vector = numpy.empty(2 * self.get_state_number(), dtype=complex)
+            buffer = vector.reshape(tensor.shape[0], 2, tensor.shape[2])
+            numpy.multiply(tensor, q.get_alpha(), out=buffer[:, 0:1, :])
+            numpy.multiply(tensor, q.get_beta(), out=buffer[:, 1:2, :])
 
-            self.__state_vector = collections.OrderedDict(sorted(state_dict.items()))
+            self.__state_vector = vector
+            self.__coeff_list.insert(nth, [q.get_alpha(), q.get_beta()])
 
         else:
             raise ValueError('Invalid input! Argument must be greater or equal to 0 and ' +\
                 'less or equal to ' + str(self.get_qubit_number()) + '.')
+
+    @check_register.save_check
+    def save(self, path):
+        """Method to save a checkpoint of the register. The amplitudes are written into the file 
+        as a raw .npy array and the number of qubits and the coefficients of the qubits are 
+        written into a sidecar file (path + '.json'). Both files are written under temporary names 
+        and renamed afterwards. A random generation token is appended to the array and stored in 
+        the sidecar file as well, so load() detects a checkpoint whose files are from different 
+        saves, e.g. if a save is interrupted between the two renames.
+        
+        Arguments:
+            path {str} -- Path of the file
+        
+        Raises:
+            TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> r = qvantum.Register([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> r.save('register.npy')
+        """
+
+        metadata = {
+            'format': 'qvantum-register',
+            'version': 1,
+            'qubit_number': self.get_qubit_number(),
+            'coeff_list': [[[complex(c).real, complex(c).imag] for c in coeffs] \
+                for coeffs in self.__coeff_list],
+            'generation': uuid.uuid4().hex
+            }
+
+        with open(path + '.tmp', 'wb') as stream:
+            numpy.lib.format.write_array(stream, numpy.ascontiguousarray(self.__state_vector, \
+                dtype=complex))
+            stream.write(metadata['generation'].encode('ascii'))
+
+        with open(path + '.json.tmp', 'w') as stream:
+            json.dump(metadata, stream)
+
+        os.replace(path + '.tmp', path)
+        os.replace(path + '.json.tmp', path + '.json')
+
+    @staticmethod
+    @check_register.load_check
+    def load(path, mmap=True):
+        """Method to load a register from a checkpoint which is written by save(). If mmap is 
+        True, the file is memory mapped copy-on-write: the amplitudes are neither parsed nor 
+        copied, the pages are read when they are used and the changes of the register don't 
+        change the file.
+        
+        Arguments:
+            path {str} -- Path of the file
+        
+        Keyword Arguments:
+            mmap {bool} -- If True, the file is memory mapped (default: {True})
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> r = qvantum.Register.load('register.npy')
+            >>> r.show()
+            '|Ψ> = (0.0000+0.0000i)|00> + (1.0000+0.0000i)|01> + (0.0000+0.0000i)|10> + (0.0000+0.0000i)|11>'
+        """
+
+        with open(path + '.json') as stream:
+            metadata = json.load(stream)
+
+        vector = numpy.load(path, mmap_mode='c' if mmap else None, allow_pickle=False)
+        if metadata.get('format') != 'qvantum-register' or vector.dtype != complex \
+            or vector.shape != (2 ** metadata['qubit_number'],):
+            raise ValueError('Invalid input! The file is not a register checkpoint.')
+
+        generation = metadata.get('generation', '').encode('ascii')
+        with open(path, 'rb') as stream:
+            stream.seek(-len(generation), os.SEEK_END)
+            if not generation or stream.read() != generation:
+                raise ValueError('Invalid input! The files of the checkpoint are from ' + \
+                    'different saves.')
+
+        r = Register.__new__(Register)
+        r.__coeff_list = [[complex(*c) for c in coeffs] for coeffs in metadata['coeff_list']]
+        r.__state_vector = vector
+
+        return r
@@ -0,0 +1,402 @@
+'''Compact serialization of circuits, layers and gates
+
+The serialized form of a circuit, a layer or a gate is a byte string with the following parts:
+
+    magic bytes (4) | format version (2) | header length (4) | content hash (32) | header | blobs
+
+The header is a JSON document which describes the gates and the layers, the blobs are the raw
+bytes of the gate matrices. The standard gates (Hadamard, CNOT, Ising, RotationX, ...) are stored
+by their name and arguments only, parameters of parameterized gates by their names and bound
+values. Other gates are stored by their names and matrices, where identical matrices are stored
+only once. Identical gates are described only once as well, but every occurrence of a gate is
+loaded as a cheap copy of the gate which is built once, so changing a loaded gate (e.g. with
+power()) doesn't change the others. The content hash is the SHA-256 digest of the header and the
+blobs, equal circuits have equal hashes.
+
+Circuits are pickled in this format as well, so they are cheap to send to worker processes.
+Gates of custom subclasses of Gate are stored by their names and matrices, so they are loaded as
+plain Gate objects.
+
+The following functions are the serialization functions in the package:
+
+- dumps()        - serialize a circuit, a layer or a gate into bytes
+- loads()        - load a circuit, a layer or a gate from bytes
+- dump()         - serialize a circuit, a layer or a gate into a file
+- load()         - load a circuit, a layer or a gate from a file
+- content_hash() - content hash of a circuit, a layer or a gate
+'''
+
+# pylint: disable=E1101, W1401
+
+import binascii
+from . import check_serialize
+from . import circuit
+from . import gate
+import hashlib
+import json
+from . import layer
+import numpy
+from . import parameter
+import struct
+
+MAGIC = b'QVNT'
+FORMAT_VERSION = 1
+
+_PREAMBLE = struct.Struct('<4sHI32s')
+
+_FIXED_GATES = {
+    'Gate': [()],
+    'Hadamard': [()],
+    'SquareNot': [()],
+    'PauliX': [()],
+    'PauliY': [()],
+    'PauliZ': [()],
+    'Phase': [()],
+    'Pi8': [()],
+    'Swap': [()],
+    'SquareSwap': [()],
+    'CNOT': [(0, 1), (1, 0)],
+    'ControlledZ': [()],
+    'ControlledPhase': [()],
+    'Toffoli': [(0,), (1,), (2,)],
+    'Fredkin': [(0,), (1,), (2,)]
+    }
+
+_ANGLE_GATES = ('Ising', 'Rotation', 'RotationX', 'RotationY', 'RotationZ')
+
+_prototypes = {}
+
+def _prototype(name, args):
+    """Returns the cached instance of a standard gate with the given arguments.
+
+    Arguments:
+        name {str} -- Name of the class of the gate
+        args {tuple} -- Arguments of the initialization
+    """
+
+    if (name, args) not in _prototypes:
+        _prototypes[(name, args)] = getattr(gate, name)(*args)
+
+    return _prototypes[(name, args)]
+
+def _encode_angle(angle, value):
+    """Returns the JSON form of the angle of a parameterized gate.
+
+    Arguments:
+        angle {int, float, Parameter} -- The angle of the gate
+        value {int, float, None} -- The bound value of the angle
+    """
+
+    if isinstance(angle, parameter.Parameter):
+        return {'parameter': angle.get_name(), 'value': None if value is None else float(value)}
+
+    return float(angle)
+
+def _decode_angle(angle):
+    """Returns the angle of a parameterized gate and the values to bind from the JSON form.
+
+    Arguments:
+        angle {float, dict} -- JSON form of the angle
+    """
+
+    if isinstance(angle, dict):
+        values = {} if angle['value'] is None else {angle['parameter']: angle['value']}
+        return parameter.Parameter(angle['parameter']), values
+
+    return angle, {}
+
+def _angle_matrix(name, g, value):
+    """Returns the matrix of a parameterized gate for the given value of its angle.
+
+    Arguments:
+        name {str} -- Name of the class of the gate
+        g {gate} -- The parameterized gate
+        value {int, float} -- Value of the angle
+    """
+
+    if name == 'Ising':
+        return gate.Ising.ising_matrix(value)
+
+    return gate.Rotation.rotation_matrix(g.get_axis(), value)
+
+class _Writer(object):
+    """Collects the deduplicated gates and matrices of the serialized objects."""
+
+    def __init__(self):
+        self.gates = []
+        self.blobs = []
+        self.offset = 0
+        self.__gate_indices = {}
+        self.__descriptor_indices = {}
+        self.__blob_indices = {}
+
+    def __add_matrix(self, matrix):
+        """Returns the index of the blob of the matrix."""
+
+        matrix = numpy.ascontiguousarray(matrix)
+        key = gate._matrix_key(matrix)
+        if key not in self.__blob_indices:
+            self.__blob_indices[key] = len(self.blobs)
+            self.blobs.append((self.offset, matrix.shape[0], matrix.shape[1], matrix.dtype.str, \
+                matrix.tobytes()))
+            self.offset = self.offset + matrix.nbytes
+
+        return self.__blob_indices[key]
+
+    def __describe(self, g):
+        """Returns the JSON form of the gate."""
+
+        name = type(g).__name__
+        if name in _FIXED_GATES and type(g) is getattr(gate, name):
+            for args in _FIXED_GATES[name]:
+
+                prototype = _prototype(name, args)
+                if g.get_name() == prototype.get_name() \
+                    and numpy.array_equal(g.get_matrix(), prototype.get_matrix()):
+                    return {'gate': name, 'args': list(args)}
+
+        elif name in _ANGLE_GATES and type(g) is getattr(gate, name):
+            angle = g.get_phi() if name == 'Ising' else g.get_theta()
+            value = g.get_value()
+            if value is None or numpy.array_equal(g.get_matrix(), _angle_matrix(name, g, value)):
+                args = [_encode_angle(angle, value)]
+                if name == 'Rotation':
+                    args.insert(0, g.get_axis())
+
+                return {'gate': name, 'args': args}
+
+        elif name == 'Dagger' and type(g) is gate.Dagger:
+            return {'gate': name, 'args': [self.add_gate(g.get_gate())]}
+
+        return {'gate': 'Gate', 'name': g.get_name(), 'matrix': self.__add_matrix(g.get_matrix())}
+
+    def add_gate(self, g):
+        """Returns the index of the description of the gate."""
+
+        if id(g) not in self.__gate_indices:
+            descriptor = self.__describe(g)
+            key = json.dumps(descriptor, sort_keys=True)
+            if key not in self.__descriptor_indices:
+                self.__descriptor_indices[key] = len(self.gates)
+                self.gates.append(descriptor)
+
+            self.__gate_indices[id(g)] = (self.__descriptor_indices[key], g)
+
+        return self.__gate_indices[id(g)][0]
+
+def _build_gate(descriptor, gates, blobs):
+    """Returns the gate of a JSON description.
+
+    Arguments:
+        descriptor {dict} -- JSON form of the gate
+        gates {list} -- The gates which are already built
+        blobs {list} -- The matrices of the blobs
+    """
+
+    name = descriptor['gate']
+    if 'matrix' in descriptor:
+        g = gate.Gate()
+        g.set_name(descriptor['name'])
+        g._update_matrix(blobs[descriptor['matrix']])
+        return g
+
+    if name == 'Dagger':
+        return gate.Dagger(gates[descriptor['args'][0]])
+
+    if name in _ANGLE_GATES:
+        args = list(descriptor['args'])
+        args[-1], values = _decode_angle(args[-1])
+        g = getattr(gate, name)(*args)
+        if values:
+            g.bind(values)
+
+        return g
+
+    return getattr(gate, name)(*descriptor['args'])
+
+def _clone(g):
+    """Returns a copy of a built gate which shares no state with it, without running the checked
+    initialization of the gate again.
+
+    Arguments:
+        g {gate} -- The built gate
+    """
+
+    if type(g) is gate.Dagger:
+        return gate.Dagger(_clone(g.get_gate()))
+
+    clone = object.__new__(type(g))
+    clone.__dict__.update(g.__dict__)
+    clone._update_matrix(gate.Gate.get_matrix(g).copy())
+    return clone
+
+@check_serialize.dumps_check
+def dumps(obj):
+    """This function serializes a circuit, a layer or a gate into bytes.
+
+    Arguments:
+        obj {Circuit, Layer, Gate} -- The serialized object
+
+    Raises:
+        TypeError
+
+    Examples:
+        >>> import qvantum.serialize
+        >>>
+        >>> c = qvantum.Circuit([qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()]), \
+                qvantum.Layer([qvantum.CNOT(0, 1)])])
+        >>> data = qvantum.serialize.dumps(c)
+        >>> data[:4]
+        b'QVNT'
+    """
+
+    writer = _Writer()
+    if isinstance(obj, circuit.Circuit):
+        header = {'type': 'circuit', 'layers': [[writer.add_gate(g) for g in \
+            l.get_gate_list().values()] for l in obj.get_layer_list().values()]}
+
+    elif isinstance(obj, layer.Layer):
+        header = {'type': 'layer', 'layers': [[writer.add_gate(g) for g in \
+            obj.get_gate_list().values()]]}
+
+    else:
+        header = {'type': 'gate', 'root': writer.add_gate(obj)}
+
+    header['gates'] = writer.gates
+    header['blobs'] = [list(blob[:4]) for blob in writer.blobs]
+    body = json.dumps(header, sort_keys=True, separators=(',', ':')).encode('utf-8') + \
+        b''.join(blob[4] for blob in writer.blobs)
+    digest = hashlib.sha256(body).digest()
+
+    return _PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(body) - writer.offset, digest) + body
+
+@check_serialize.loads_check
+def loads(data, verify=True):
+    """This function loads a circuit, a layer or a gate from the bytes which are created by
+    dumps().
+
+    Arguments:
+        data {bytes} -- The serialized object
+
+    Keyword Arguments:
+        verify {bool} -- If True, the content hash is checked (default: {True})
+
+    Raises:
+        ValueError, TypeError
+
+    Examples:
+        >>> import qvantum.serialize
+        >>>
+        >>> c = qvantum.Circuit([qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()]), \
+                qvantum.Layer([qvantum.CNOT(0, 1)])])
+        >>> qvantum.serialize.loads(qvantum.serialize.dumps(c)).get_hash() == c.get_hash()
+        True
+    """
+
+    data = memoryview(data)
+    magic, version, length, digest = _PREAMBLE.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError('Invalid input! The data is not a serialized qvantum object.')
+
+    if version > FORMAT_VERSION:
+        raise ValueError('Invalid input! Format version ' + str(version) + ' is not supported.')
+
+    start = _PREAMBLE.size
+    if verify and hashlib.sha256(data[start:]).digest() != digest:
+        raise ValueError('Invalid input! Content hash of the data doesn\'t match.')
+
+    header = json.loads(bytes(data[start:start + length]).decode('utf-8'))
+    start = start + length
+    blobs = []
+    for offset, rows, cols, dtype in header['blobs']:
+
+        matrix = numpy.frombuffer(data, dtype=dtype, count=rows * cols, offset=start + offset)
+        blobs.append(numpy.matrix(matrix.reshape(rows, cols), copy=False))
+
+    gates = []
+    for descriptor in header['gates']:
+
+        gates.append(_build_gate(descriptor, gates, blobs))
+
+    if header['type'] == 'gate':
+        return _clone(gates[header['root']])
+
+    layers = [layer.Layer([_clone(gates[index]) for index in indices]) \
+        for indices in header['layers']]
+    if header['type'] == 'layer':
+        return layers[0]
+
+    return circuit.Circuit(layers)
+
+def _unpickle(data):
+    """Loads a pickled circuit. It's the undecorated loader which pickle can refer to.
+
+    Arguments:
+        data {bytes} -- The serialized circuit
+    """
+
+    return loads(data, False)
+
+@check_serialize.dump_check
+def dump(obj, path):
+    """This function serializes a circuit, a layer or a gate into a file.
+
+    Arguments:
+        obj {Circuit, Layer, Gate} -- The serialized object
+        path {str} -- Path of the file
+
+    Raises:
+        TypeError
+
+    Examples:
+        >>> import qvantum.serialize
+        >>>
+        >>> qvantum.serialize.dump(qvantum.Layer([qvantum.Hadamard()]), 'layer.qvnt')
+    """
+
+    with open(path, 'wb') as stream:
+        stream.write(dumps(obj))
+
+@check_serialize.load_check
+def load(path, verify=True):
+    """This function loads a circuit, a layer or a gate from a file which is created by dump().
+
+    Arguments:
+        path {str} -- Path of the file
+
+    Keyword Arguments:
+        verify {bool} -- If True, the content hash is checked (default: {True})
+
+    Raises:
+        ValueError, TypeError
+
+    Examples:
+        >>> import qvantum.serialize
+        >>>
+        >>> qvantum.serialize.load('layer.qvnt').get_nth_gate(0).get_name()
+        'Hadamard'
+    """
+
+    with open(path, 'rb') as stream:
+        return loads(stream.read(), verify)
+
+def content_hash(obj):
+    """This function returns the content hash of a circuit, a layer or a gate as a hexadecimal
+    string. Equal objects have equal hashes.
+
+    Arguments:
+        obj {Circuit, Layer, Gate} -- The hashed object
+
+    Raises:
+        TypeError
+
+    Examples:
+        >>> import qvantum.serialize
+        >>>
+        >>> h1 = qvantum.serialize.content_hash(qvantum.Layer([qvantum.Hadamard()]))
+        >>> h2 = qvantum.serialize.content_hash(qvantum.Layer([qvantum.Hadamard()]))
+        >>> h1 == h2
+        True
+    """
+
+    return binascii.hexlify(_PREAMBLE.unpack_from(dumps(obj))[3]).decode('ascii')
@@ -0,0 +1,445 @@
+'''Local simulation job server
+
+The job server simulates circuits for other processes on the same machine, so several services
+can share one warm process and one worker pool instead of importing and running the package
+independently. It's started by
+
+    python -m qvantum.serve --port 8765 --workers 4
+
+and it accepts circuits serialized by the serialize module over HTTP:
+
+    POST /run?state=01&observable=ZZ   - body: serialized circuit, returns the result as JSON
+    GET /statistics                     - returns the statistics of the server as JSON
+
+The state is the bit string of the input basis state (all zeros by default), the observable is
+an optional Pauli string. The result contains the output amplitudes (as [real, imaginary]
+pairs), the expectation value of the observable, the size of the batch which the job was run in,
+the time spent in the queue and the time of the run in seconds.
+
+Jobs of the same circuit (equal structural hashes, see Circuit.get_hash()) which arrive close to
+each other are coalesced: their input states are stacked and run through the circuit at once,
+so every gate is applied on the whole batch by one matrix product. The number of queued jobs is
+bounded; if the queue is full, the server answers with 503 and Retry-After, so the clients slow
+down instead of the server running out of memory.
+
+The following classes and functions are the job server related ones in the package:
+
+- JobQueue      - batching job queue on a worker pool
+- make_server() - HTTP server of a job queue
+- run_remote()  - run a circuit on a job server
+- main()        - command line entry point
+'''
+
+# pylint: disable=E1101, W1401
+
+import argparse
+from . import check_serve
+import collections
+from concurrent import futures
+from . import engine
+from http import server
+import json
+import numpy
+from . import pauli
+from . import serialize
+import threading
+import time
+from urllib import parse
+from urllib import request
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+_Job = collections.namedtuple('_Job', ['vector', 'future', 'submitted'])
+
+class JobQueue(object):
+    """job queue class
+
+    An instance of job queue class runs circuits on a worker pool. The jobs of the same circuit
+    are collected into batches: a batch is dispatched when it has max_batch jobs or its oldest
+    job has waited for wait seconds, then the stacked input states are run through the circuit
+    at once. At most max_jobs jobs can be queued or running, further jobs are rejected until
+    some of them are finished (backpressure).
+
+    The instances of job queue class have the following methods:
+
+    - __init__()         - initialize job queue
+    - get_statistics()   - getter of job, batch and rejection statistics
+    - submit()           - submit a job
+    - close()            - finish the queued jobs and stop the workers
+    """
+
+    @check_serve.job_queue_init_check
+    def __init__(self, workers=None, max_jobs=1024, max_batch=64, wait=0.002):
+        """Method to initialize a job queue.
+
+        Keyword Arguments:
+            workers {int, None} -- Number of worker threads, the default of ThreadPoolExecutor
+                if None (default: {None})
+            max_jobs {int} -- Maximal number of queued and running jobs (default: {1024})
+            max_batch {int} -- Maximal number of jobs in one batch (default: {64})
+            wait {int, float} -- Maximal time in seconds for a job to wait for other jobs of
+                the same circuit (default: {0.002})
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum.serve
+            >>>
+            >>> queue = qvantum.serve.JobQueue(workers=2)
+            >>> queue.get_statistics()
+            {'jobs': 0, 'batches': 0, 'rejected': 0, 'pending': 0}
+            >>> queue.close()
+        """
+
+        self.__max_jobs = max_jobs
+        self.__max_batch = max_batch
+        self.__wait = wait
+        self.__executor = futures.ThreadPoolExecutor(max_workers=workers)
+        self.__condition = threading.Condition()
+        self.__groups = collections.OrderedDict()
+        self.__pending = 0
+        self.__jobs = 0
+        self.__batches = 0
+        self.__rejected = 0
+        self.__closed = False
+        self.__dispatcher = threading.Thread(target=self.__dispatch)
+        self.__dispatcher.daemon = True
+        self.__dispatcher.start()
+
+    def get_statistics(self):
+        """Method to return the statistics of the queue: number of accepted jobs, number of run
+        batches, number of rejected jobs and number of queued and running jobs.
+
+        Examples:
+            >>> import qvantum.serve
+            >>>
+            >>> queue = qvantum.serve.JobQueue()
+            >>> queue.get_statistics()
+            {'jobs': 0, 'batches': 0, 'rejected': 0, 'pending': 0}
+        """
+
+        with self.__condition:
+            return {'jobs': self.__jobs, 'batches': self.__batches, \
+                'rejected': self.__rejected, 'pending': self.__pending}
+
+    @check_serve.submit_check
+    def submit(self, c, vector):
+        """Method to submit a job: the circuit and the input amplitudes. It returns a future
+        (concurrent.futures) whose result is a dictionary of the output amplitudes ('vector'),
+        the size of the batch ('batch_size'), the time spent in the queue ('queue_seconds') and
+        the time of the run ('run_seconds'). If the queue is full, RuntimeError is raised.
+
+        Arguments:
+            c {Circuit} -- The circuit
+            vector {numpy.ndarray} -- The input amplitudes
+
+        Raises:
+            ValueError, TypeError, RuntimeError
+
+        Examples:
+            >>> import numpy
+            >>> import qvantum
+            >>> import qvantum.serve
+            >>>
+            >>> queue = qvantum.serve.JobQueue()
+            >>> c = qvantum.Circuit([qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()])])
+            >>> future = queue.submit(c, numpy.array([1, 0, 0, 0], dtype=complex))
+            >>> future.result()['vector']
+            array([0.70710678+0.j, 0.        +0.j, 0.70710678+0.j, 0.        +0.j])
+        """
+
+        key = c.get_hash()
+        future = futures.Future()
+        with self.__condition:
+            if self.__closed:
+                raise RuntimeError('Job queue is closed!')
+
+            if self.__pending >= self.__max_jobs:
+                self.__rejected = self.__rejected + 1
+                raise RuntimeError('Job queue is full! Try again later.')
+
+            if key not in self.__groups:
+                self.__groups[key] = (c, [])
+
+            self.__groups[key][1].append(_Job(numpy.asarray(vector, dtype=complex), future, \
+                time.time()))
+            self.__pending = self.__pending + 1
+            self.__jobs = self.__jobs + 1
+            self.__condition.notify()
+
+        return future
+
+    def close(self):
+        """Method to run the queued jobs and stop the workers. No jobs can be submitted after
+        closing.
+
+        Examples:
+            >>> import qvantum.serve
+            >>>
+            >>> qvantum.serve.JobQueue().close()
+        """
+
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify()
+
+        self.__dispatcher.join()
+        self.__executor.shutdown(wait=True)
+
+    def __dispatch(self):
+        """Collects the jobs into batches and passes the batches to the workers, the oldest
+        circuit first."""
+
+        while True:
+
+            with self.__condition:
+                while not self.__groups and not self.__closed:
+
+                    self.__condition.wait()
+
+                if not self.__groups:
+                    return
+
+                key, (c, jobs) = next(iter(self.__groups.items()))
+                delay = jobs[0].submitted + self.__wait - time.time()
+                if len(jobs) < self.__max_batch and delay > 0 and not self.__closed:
+                    self.__condition.wait(delay)
+                    continue
+
+                batch = jobs[:self.__max_batch]
+                del jobs[:self.__max_batch]
+                if not jobs:
+                    del self.__groups[key]
+
+                self.__batches = self.__batches + 1
+
+            self.__executor.submit(self.__run, c, batch)
+
+    def __run(self, c, batch):
+        """Runs a batch of jobs of the circuit and sets the results of their futures."""
+
+        start = time.time()
+        try:
+            states = engine.run_operations(numpy.stack([job.vector for job in batch]), \
+                c.get_operations(), c.get_circuit_size())
+
+        except Exception as error: # pylint: disable=W0703
+            for job in batch:
+
+                job.future.set_exception(error)
+
+        else:
+            stop = time.time()
+            for job, vector in zip(batch, states):
+
+                job.future.set_result({'vector': vector, 'batch_size': len(batch), \
+                    'queue_seconds': start - job.submitted, 'run_seconds': stop - start})
+
+        finally:
+            with self.__condition:
+                self.__pending = self.__pending - len(batch)
+
+class _Handler(server.BaseHTTPRequestHandler):
+    """HTTP request handler of the job server, the job queue is the job_queue attribute of the
+    server."""
+
+    def do_GET(self): # pylint: disable=C0103
+        """Answers the statistics of the job queue."""
+
+        if parse.urlparse(self.path).path != '/statistics':
+            self.__answer(404, {'error': 'Unknown path.'})
+            return
+
+        self.__answer(200, self.server.job_queue.get_statistics())
+
+    def do_POST(self): # pylint: disable=C0103
+        """Runs a serialized circuit and answers the result."""
+
+        url = parse.urlparse(self.path)
+        if url.path != '/run':
+            self.__answer(404, {'error': 'Unknown path.'})
+            return
+
+        query = parse.parse_qs(url.query)
+        data = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        try:
+            c = serialize.loads(data)
+            n = c.get_circuit_size()
+            state = query.get('state', ['0' * n])[0]
+            observable = query.get('observable', [None])[0]
+            if len(state) != n or set(state) - set('01'):
+                raise ValueError('Invalid input! State must be a bit string of ' + str(n) + \
+                    ' bits.')
+
+            if observable is not None and (len(observable) != n or set(observable) - set('IXYZ')):
+                raise ValueError('Invalid input! Observable must be a Pauli string of ' + \
+                    str(n) + ' characters.')
+
+            vector = numpy.zeros(2 ** n, dtype=complex)
+            vector[int(state, 2)] = 1
+            future = self.server.job_queue.submit(c, vector)
+
+        except RuntimeError as error:
+            self.__answer(503, {'error': str(error)}, {'Retry-After': '1'})
+            return
+
+        except Exception as error: # pylint: disable=W0703
+            self.__answer(400, {'error': str(error)})
+            return
+
+        try:
+            result = future.result()
+
+        except Exception as error: # pylint: disable=W0703
+            self.__answer(500, {'error': str(error)})
+            return
+
+        answer = {'vector': [[amplitude.real, amplitude.imag] for amplitude in result['vector']], \
+            'batch_size': result['batch_size'], 'queue_seconds': result['queue_seconds'], \
+            'run_seconds': result['run_seconds']}
+        if observable is not None:
+            answer['expectation'] = float(pauli.pauli_expectation(result['vector'], observable))
+
+        self.__answer(200, answer)
+
+    def __answer(self, status, content, headers=None):
+        """Sends the content as a JSON answer."""
+
+        body = json.dumps(content).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+
+            self.send_header(name, value)
+
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args): # pylint: disable=W0622
+        """Requests are not logged."""
+
+        pass
+
+@check_serve.make_server_check
+def make_server(job_queue, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """This function returns an HTTP server (not started yet) which runs the jobs of the
+    requests on the job queue. Every request is handled in its own thread, so the requests of
+    the same circuit can be batched.
+
+    Arguments:
+        job_queue {JobQueue} -- The job queue
+
+    Keyword Arguments:
+        host {str} -- Host name of the server (default: {'127.0.0.1'})
+        port {int} -- Port of the server, a free port if 0 (default: {8765})
+
+    Raises:
+        TypeError
+
+    Examples:
+        >>> import threading
+        >>> import qvantum.serve
+        >>>
+        >>> httpd = qvantum.serve.make_server(qvantum.serve.JobQueue(), port=0)
+        >>> threading.Thread(target=httpd.serve_forever).start()
+    """
+
+    httpd = server.ThreadingHTTPServer((host, port), _Handler)
+    httpd.daemon_threads = True
+    httpd.job_queue = job_queue
+    return httpd
+
+@check_serve.run_remote_check
+def run_remote(c, state=None, observable=None, url='http://' + DEFAULT_HOST + ':' + \
+    str(DEFAULT_PORT), timeout=None):
+    """This function runs a circuit on a job server and returns the result: a dictionary of the
+    output amplitudes ('vector'), the expectation value of the observable ('expectation', if it's
+    given), the size of the batch ('batch_size'), the time spent in the queue ('queue_seconds')
+    and the time of the run ('run_seconds'). If the server is busy, RuntimeError is raised.
+
+    Arguments:
+        c {Circuit} -- The circuit
+
+    Keyword Arguments:
+        state {str, None} -- Bit string of the input basis state, all zeros if None
+            (default: {None})
+        observable {str, None} -- Pauli string of the observable (default: {None})
+        url {str} -- URL of the server (default: {'http://127.0.0.1:8765'})
+        timeout {int, float, None} -- Timeout of the request in seconds (default: {None})
+
+    Raises:
+        ValueError, TypeError, RuntimeError
+
+    Examples:
+        >>> import qvantum
+        >>> import qvantum.serve
+        >>>
+        >>> c = qvantum.Circuit([qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()]), \
+                qvantum.Layer([qvantum.CNOT(0, 1)])])
+        >>> qvantum.serve.run_remote(c, observable='ZZ')['expectation']
+        1.0
+    """
+
+    query = {}
+    if state is not None:
+        query['state'] = state
+
+    if observable is not None:
+        query['observable'] = observable
+
+    req = request.Request(url.rstrip('/') + '/run?' + parse.urlencode(query), \
+        data=serialize.dumps(c), headers={'Content-Type': 'application/octet-stream'})
+    try:
+        answer = json.loads(request.urlopen(req, timeout=timeout).read().decode('utf-8'))
+
+    except request.HTTPError as error:
+        message = json.loads(error.read().decode('utf-8'))['error']
+        if error.code == 503:
+            raise RuntimeError(message)
+
+        raise ValueError(message)
+
+    answer['vector'] = numpy.array([complex(real, imag) for real, imag in answer['vector']])
+    return answer
+
+def main(argv=None):
+    """This function is the command line entry point of the job server (python -m
+    qvantum.serve). It serves until it's interrupted.
+
+    Keyword Arguments:
+        argv {list, None} -- Command line arguments, sys.argv if None (default: {None})
+    """
+
+    parser = argparse.ArgumentParser(prog='python -m qvantum.serve', \
+        description='Local simulation job server of qvantum.')
+    parser.add_argument('--host', default=DEFAULT_HOST, help='host name (default: %(default)s)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, \
+        help='port (default: %(default)s)')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker threads')
+    parser.add_argument('--max-jobs', type=int, default=1024, \
+        help='maximal number of queued jobs (default: %(default)s)')
+    parser.add_argument('--max-batch', type=int, default=64, \
+        help='maximal number of jobs in one batch (default: %(default)s)')
+    parser.add_argument('--wait', type=float, default=0.002, \
+        help='maximal batching delay in seconds (default: %(default)s)')
+    arguments = parser.parse_args(argv)
+
+    job_queue = JobQueue(arguments.workers, arguments.max_jobs, arguments.max_batch, \
+        arguments.wait)
+    httpd = make_server(job_queue, arguments.host, arguments.port)
+    print('qvantum job server on http://' + arguments.host + ':' + str(httpd.server_port))
+    try:
+        httpd.serve_forever()
+
+    except KeyboardInterrupt:
+        pass
+
+    finally:
+        httpd.server_close()
+        job_queue.close()
+
+if __name__ == '__main__':
+    main()
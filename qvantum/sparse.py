@@ -0,0 +1,362 @@
+'''sparse register class'''
+
+# pylint: disable=E1101, W1401
+
+from . import check_sparse
+from . import engine
+import numpy
+from . import pauli
+import unicodedata
+
+class SparseRegister(object):
+    """sparse register class
+
+    An instance of sparse register class is a register which stores only its non-zero
+    amplitudes: a sorted array of basis state indices (the binary representation of the index
+    is the state, the 0th qubit is the most significant bit) and the array of the amplitudes
+    which belong to them. Amplitudes whose absolute value is not greater than the pruning
+    threshold are dropped. Circuits of reversible arithmetic, basis state oracles or
+    permutations keep only a few non-zero amplitudes, so they are run on registers which are
+    far too large to be stored densely.
+
+    A gate on k qubits is applied group by group: the support is grouped by the bits which the
+    gate doesn't touch, and the 2^k x 2^k matrix is applied on the amplitudes of every group at
+    once, so the cost is proportional to the size of the support. If the support grows above the
+    given fraction of all the states, the register switches to dense storage and the gates are
+    applied by the engine from then on.
+
+    The instances of sparse register class have the following methods:
+
+    - __init__()          - initialize sparse register
+    - get_qubit_number()  - getter of number of qubits in the register
+    - get_support_size()  - getter of number of stored amplitudes
+    - is_dense()          - check whether the register is stored densely
+    - iter_amplitudes()   - generator of states and non-zero amplitudes
+    - get_vector()        - getter of amplitudes as numpy array
+    - show()              - register representation
+    - apply_gate()        - apply a gate on some qubits
+    - apply_operations()  - apply a list of operations
+    - expectation()       - expectation value of a Pauli string or a sum of them
+    - measure_register()  - measure the whole register
+    - measure_nth_qubit() - measure the n-th qubit
+    """
+
+    @check_sparse.sparse_init_check
+    def __init__(self, qubit_list, threshold=1e-12, dense_fraction=0.25):
+        """Method to initialize a sparse register in the product state of the qubits.
+
+        Arguments:
+            qubit_list {list} -- List of objects from Qubit or Random_Qubit class
+
+        Keyword Arguments:
+            threshold {int, float} -- Amplitudes with smaller absolute value are dropped
+                (default: {1e-12})
+            dense_fraction {int, float} -- Fraction of non-zero amplitudes above which the
+                register is stored densely (default: {0.25})
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> s = qvantum.SparseRegister([qvantum.Qubit(1, 0) for i in range(40)])
+            >>> s.get_support_size()
+            1
+        """
+
+        self.__qubit_number = len(qubit_list)
+        self.__threshold = threshold
+        self.__dense_fraction = dense_fraction
+        self.__indices = numpy.zeros(1, dtype=numpy.int64)
+        self.__amplitudes = numpy.ones(1, dtype=complex)
+        self.__vector = None
+        for q in qubit_list:
+
+            amplitudes = numpy.array([q.get_alpha(), q.get_beta()], dtype=complex)
+            self.__indices = (self.__indices[:, None] * 2 + numpy.arange(2)).reshape(-1)
+            self.__amplitudes = (self.__amplitudes[:, None] * amplitudes).reshape(-1)
+            self.__prune()
+
+        self.__check_density()
+
+    def __prune(self):
+        """Drops the amplitudes which are not greater than the threshold."""
+
+        keep = numpy.absolute(self.__amplitudes) > self.__threshold
+        self.__indices = self.__indices[keep]
+        self.__amplitudes = self.__amplitudes[keep]
+
+    def __check_density(self):
+        """Switches to dense storage if the support is larger than the given fraction of the
+        states."""
+
+        if self.__vector is None \
+            and len(self.__indices) > self.__dense_fraction * 2 ** self.__qubit_number:
+            self.__vector = numpy.zeros(2 ** self.__qubit_number, dtype=complex)
+            self.__vector[self.__indices] = self.__amplitudes
+            self.__indices = None
+            self.__amplitudes = None
+
+    def __support(self):
+        """Returns the indices and the amplitudes of the non-zero amplitudes."""
+
+        if self.__vector is None:
+            return self.__indices, self.__amplitudes
+
+        indices = numpy.nonzero(numpy.absolute(self.__vector) > self.__threshold)[0]
+        return indices, self.__vector[indices]
+
+    def get_qubit_number(self):
+        """Method to return the number of qubits in the register.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.SparseRegister([qvantum.Qubit(1, 0) for i in range(40)]).get_qubit_number()
+            40
+        """
+
+        return self.__qubit_number
+
+    def get_support_size(self):
+        """Method to return the number of stored amplitudes, i.e. the number of non-zero
+        amplitudes or, if the register is stored densely, the number of all the states.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> s = qvantum.SparseRegister([qvantum.Qubit(1, 0) for i in range(40)])
+            >>> s.apply_gate(qvantum.Hadamard(), 3)
+            >>> s.get_support_size()
+            2
+        """
+
+        if self.__vector is None:
+            return len(self.__indices)
+
+        return len(self.__vector)
+
+    def is_dense(self):
+        """Method to check whether the register has switched to dense storage.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.SparseRegister([qvantum.Qubit(1, 0) for i in range(40)]).is_dense()
+            False
+        """
+
+        return self.__vector is not None
+
+    def iter_amplitudes(self):
+        """Generator of the (state, amplitude) pairs of the non-zero amplitudes in the order of
+        the states.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> s = qvantum.SparseRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> list(s.iter_amplitudes())
+            [('01', (1+0j))]
+        """
+
+        indices, amplitudes = self.__support()
+        pattern = '{0:0' + str(self.__qubit_number) + 'b}'
+        for index, amplitude in zip(indices, amplitudes):
+
+            yield pattern.format(index), complex(amplitude)
+
+    @check_sparse.get_vector_check
+    def get_vector(self):
+        """Method to return all the amplitudes as a numpy array (only for registers which can be
+        stored densely).
+
+        Raises:
+            ValueError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> s = qvantum.SparseRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> s.get_vector()
+            array([0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j])
+        """
+
+        if self.__vector is not None:
+            return self.__vector.copy()
+
+        vector = numpy.zeros(2 ** self.__qubit_number, dtype=complex)
+        vector[self.__indices] = self.__amplitudes
+        return vector
+
+    def show(self):
+        """Method to return the representation of the register with its non-zero amplitudes.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> s = qvantum.SparseRegister([qvantum.Qubit(1, 0) for i in range(3)])
+            >>> s.apply_gate(qvantum.Hadamard(), 2)
+            >>> s.show()
+            '|Ψ> = (0.7071+0.0000i)|000> + (0.7071+0.0000i)|001>'
+        """
+
+        head = '|' + unicodedata.lookup('GREEK CAPITAL LETTER PSI') + '> = '
+        terms = ['({0:.4f}{1}{2:.4f}i)|{3}>'.format(amplitude.real, \
+            '+-'[bool(amplitude.imag < 0)], abs(amplitude.imag), state) \
+            for state, amplitude in self.iter_amplitudes()]
+        return head + ' + '.join(terms)
+
+    def __apply_matrix(self, matrix, position):
+        """Applies a 2^k x 2^k matrix on the qubits position, ..., position + k - 1."""
+
+        if self.__vector is not None:
+            self.__vector = engine.apply_matrix(self.__vector, matrix, position, \
+                self.__qubit_number)
+            return
+
+        size = len(matrix)
+        shift = self.__qubit_number - position - (size.bit_length() - 1)
+        mask = numpy.int64(size - 1) << shift
+        bases, groups = numpy.unique(self.__indices & ~mask, return_inverse=True)
+        groups = groups.reshape(-1)
+        local = numpy.zeros((len(bases), size), dtype=complex)
+        local[groups, (self.__indices & mask) >> shift] = self.__amplitudes
+        local = numpy.dot(local, matrix.T)
+
+        indices = (bases[:, None] | (numpy.arange(size, dtype=numpy.int64) << shift)).reshape(-1)
+        order = numpy.argsort(indices, kind='stable')
+        self.__indices = indices[order]
+        self.__amplitudes = local.reshape(-1)[order]
+        self.__prune()
+        self.__check_density()
+
+    @check_sparse.apply_gate_check
+    def apply_gate(self, g, position):
+        """Method to apply a gate on the qubits position, ..., position + k - 1 of the register,
+        where k is the number of qubits of the gate.
+
+        Arguments:
+            g {gate} -- The applied gate
+            position {int} -- Index of the first qubit which the gate acts on
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> s = qvantum.SparseRegister([qvantum.Qubit(0, 1) for i in range(3)])
+            >>> s.apply_gate(qvantum.Toffoli(2), 0)
+            >>> s.show()
+            '|Ψ> = (1.0000+0.0000i)|110>'
+        """
+
+        self.__apply_matrix(numpy.asarray(g.get_matrix(), dtype=complex), position)
+
+    def apply_operations(self, operations):
+        """Method to apply a list of (position, gate) operations in order (see the engine
+        module). It's used when a circuit is run on the register. Identity gates are skipped.
+
+        Arguments:
+            operations {list} -- List of (position, gate) pairs
+        """
+
+        for position, g in operations:
+
+            if not engine.is_identity(g):
+                self.__apply_matrix(numpy.asarray(g.get_matrix(), dtype=complex), position)
+
+    @check_sparse.expectation_check
+    def expectation(self, observable):
+        """Method to return the expectation value of an observable which is a Pauli string or a
+        weighted sum of Pauli strings. Only the non-zero amplitudes are visited, the flipped
+        states are looked up in the sorted support.
+
+        Arguments:
+            observable {str, dict} -- Pauli string or dictionary of Pauli strings and weights
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> s = qvantum.SparseRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> s.expectation({'ZI': 0.5, 'IZ': 2})
+            -1.5
+        """
+
+        if isinstance(observable, str):
+            observable = {observable: 1}
+
+        indices, amplitudes = self.__support()
+        result = 0.0
+        for pauli_string, weight in observable.items():
+
+            x_mask, z_mask, phase = pauli.pauli_masks(pauli_string)
+            flipped = indices ^ x_mask
+            positions = numpy.minimum(numpy.searchsorted(indices, flipped), len(indices) - 1)
+            found = indices[positions] == flipped
+            signs = 1.0 - 2.0 * pauli._parity(indices[found], z_mask)
+            value = numpy.sum(amplitudes[positions[found]].conjugate() * phase * signs * \
+                amplitudes[found]).real
+            result = result + weight * value
+
+        return float(result)
+
+    def measure_register(self):
+        """Method to perform a measurement on the whole register and return the measured state.
+        The register collapses into the measured state.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> s = qvantum.SparseRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> s.measure_register()
+            '01'
+        """
+
+        indices, amplitudes = self.__support()
+        probs = numpy.square(numpy.absolute(amplitudes))
+        index = indices[numpy.random.choice(len(probs), p=probs / numpy.sum(probs))]
+        self.__vector = None
+        self.__indices = numpy.array([index], dtype=numpy.int64)
+        self.__amplitudes = numpy.ones(1, dtype=complex)
+
+        return '{0:0{1}b}'.format(int(index), self.__qubit_number)
+
+    @check_sparse.nth_check
+    def measure_nth_qubit(self, nth):
+        """Method to perform a measurement on the n-th qubit and return the result (0 or 1). The
+        amplitudes which don't match the result are dropped.
+
+        Arguments:
+            nth {int} -- Number of n-th qubit
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> s = qvantum.SparseRegister([qvantum.Qubit(1, 0), qvantum.Qubit(0, 1)])
+            >>> s.measure_nth_qubit(1)
+            1
+        """
+
+        indices, amplitudes = self.__support()
+        bits = (indices >> (self.__qubit_number - nth - 1)) & 1
+        probs = numpy.square(numpy.absolute(amplitudes))
+        prob0 = min(max(numpy.sum(probs[bits == 0]) / numpy.sum(probs), 0), 1)
+        result = int(numpy.random.choice([0, 1], p=[prob0, 1 - prob0]))
+
+        keep = bits == result
+        amplitudes = amplitudes[keep]
+        self.__vector = None
+        self.__indices = indices[keep]
+        self.__amplitudes = amplitudes / numpy.linalg.norm(amplitudes)
+        self.__check_density()
+
+        return result
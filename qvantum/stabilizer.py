@@ -0,0 +1,411 @@
+'''stabilizer register class'''
+
+# pylint: disable=E1101, W1401
+
+from . import check_stabilizer
+import numpy
+from . import pauli
+
+_SQRT2 = numpy.sqrt(0.5)
+
+_CLIFFORD_MATRICES = [
+    (numpy.identity(2), []),
+    (_SQRT2 * numpy.array([[1, 1], [1, -1]]), [('H', 0)]),
+    (numpy.array([[1, 0], [0, 1j]]), [('S', 0)]),
+    (numpy.array([[1, 0], [0, -1j]]), [('S', 0), ('S', 0), ('S', 0)]),
+    (numpy.array([[0, 1], [1, 0]]), [('X', 0)]),
+    (numpy.array([[0, -1j], [1j, 0]]), [('Y', 0)]),
+    (numpy.array([[1, 0], [0, -1]]), [('Z', 0)]),
+    (numpy.identity(4), []),
+    (numpy.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]]), [('CX', 0, 1)]),
+    (numpy.array([[1, 0, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0], [0, 1, 0, 0]]), [('CX', 1, 0)]),
+    (numpy.diag([1, 1, 1, -1]), [('CZ', 0, 1)]),
+    (numpy.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]]), [('SWAP', 0, 1)])
+    ]
+
+def clifford_decomposition(gate, position):
+    """This function returns the gate as a list of elementary Clifford operations (e.g.
+    ('H', 3) or ('CX', 3, 4)) on the qubits of the register, or None if the gate is not one of
+    the supported Clifford gates: identity, Hadamard, Phase and its inverse, PauliX, PauliY,
+    PauliZ, CNOT, ControlledZ and Swap. The gates are recognized by their matrices, so the
+    inverses and the powers of these gates are recognized too if they are among them.
+
+    Arguments:
+        gate {gate} -- The gate
+        position {int} -- Index of the first qubit which the gate acts on
+    """
+
+    if gate.get_parameters():
+        return None
+
+    matrix = numpy.asarray(gate.get_matrix())
+    if not numpy.count_nonzero(matrix - numpy.diag(numpy.diagonal(matrix))) \
+        and numpy.allclose(numpy.diagonal(matrix), 1):
+        return []
+
+    for clifford, operations in _CLIFFORD_MATRICES:
+
+        if clifford.shape == matrix.shape and numpy.allclose(clifford, matrix):
+            return [(operation[0],) + tuple(position + qubit for qubit in operation[1:]) \
+                for operation in operations]
+
+    return None
+
+def is_clifford(operations):
+    """This function returns True if all the operations are supported Clifford gates (see
+    clifford_decomposition()).
+
+    Arguments:
+        operations {list} -- List of (position, gate) pairs
+    """
+
+    return all(clifford_decomposition(gate, position) is not None \
+        for position, gate in operations)
+
+class StabilizerRegister(object):
+    """stabilizer register class
+
+    An instance of stabilizer register class is a register of n qubits in a stabilizer state,
+    i.e. in a state which is prepared from |00...0> by Clifford gates (Hadamard, Phase, Pauli
+    gates, CNOT, ControlledZ, Swap). Such a state is described by the 2n Pauli strings of its
+    tableau (n destabilizers and n stabilizers) instead of its 2^n amplitudes (the CHP
+    algorithm of Aaronson and Gottesman). A gate costs O(n) and a measurement O(n^2), so
+    circuits on hundreds of qubits can be run. The state vector is built only by to_vector().
+
+    The instances of stabilizer register class have the following methods:
+
+    - __init__()          - initialize stabilizer register
+    - get_qubit_number()  - getter of number of qubits in the register
+    - get_stabilizers()   - getter of stabilizers as Pauli strings
+    - apply_operations()  - apply a list of operations
+    - measure_nth_qubit() - measure the n-th qubit
+    - measure_register()  - measure the whole register
+    - sample()            - sample measurement results without changing the register
+    - expectation()       - expectation value of a Pauli string or a sum of them
+    - to_vector()         - state vector of the register
+    """
+
+    @check_stabilizer.stabilizer_init_check
+    def __init__(self, qubit_number):
+        """Method to initialize a stabilizer register in the state |00...0>.
+
+        Arguments:
+            qubit_number {int} -- Number of qubits
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> s = qvantum.StabilizerRegister(3)
+            >>> s.get_stabilizers()
+            ['+ZII', '+IZI', '+IIZ']
+        """
+
+        self.__qubit_number = qubit_number
+        self.__x = numpy.zeros((2 * qubit_number + 1, qubit_number), dtype=bool)
+        self.__z = numpy.zeros((2 * qubit_number + 1, qubit_number), dtype=bool)
+        self.__r = numpy.zeros(2 * qubit_number + 1, dtype=bool)
+        self.__x[numpy.arange(qubit_number), numpy.arange(qubit_number)] = True
+        self.__z[numpy.arange(qubit_number) + qubit_number, numpy.arange(qubit_number)] = True
+
+    def get_qubit_number(self):
+        """Method to return the number of qubits in the stabilizer register.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.StabilizerRegister(100).get_qubit_number()
+            100
+        """
+
+        return self.__qubit_number
+
+    def __row_string(self, row):
+        """Returns the row of the tableau as a signed Pauli string, e.g. '-XZI'."""
+
+        chars = numpy.array(['I', 'X', 'Z', 'Y'])[self.__x[row] + 2 * self.__z[row]]
+        return ('-' if self.__r[row] else '+') + ''.join(chars)
+
+    def get_stabilizers(self):
+        """Method to return the stabilizer generators of the state as signed Pauli strings.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> s = qvantum.StabilizerRegister(2)
+            >>> c = qvantum.Circuit([qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()]), \\
+            ...     qvantum.Layer([qvantum.CNOT(0, 1)])])
+            >>> c.run(s)
+            >>> s.get_stabilizers()
+            ['+XX', '+ZZ']
+        """
+
+        return [self.__row_string(row) \
+            for row in range(self.__qubit_number, 2 * self.__qubit_number)]
+
+    def __hadamard(self, a):
+        """Applies the Hadamard gate on the a-th qubit."""
+
+        self.__r ^= self.__x[:, a] & self.__z[:, a]
+        self.__x[:, a], self.__z[:, a] = self.__z[:, a].copy(), self.__x[:, a].copy()
+
+    def __phase(self, a):
+        """Applies the Phase gate on the a-th qubit."""
+
+        self.__r ^= self.__x[:, a] & self.__z[:, a]
+        self.__z[:, a] ^= self.__x[:, a]
+
+    def __cnot(self, a, b):
+        """Applies the CNOT gate with control a and target b."""
+
+        self.__r ^= self.__x[:, a] & self.__z[:, b] & ~(self.__x[:, b] ^ self.__z[:, a])
+        self.__x[:, b] ^= self.__x[:, a]
+        self.__z[:, a] ^= self.__z[:, b]
+
+    def __apply(self, operation):
+        """Applies an elementary Clifford operation, e.g. ('H', 3) or ('CX', 3, 4)."""
+
+        name = operation[0]
+        if name == 'H':
+            self.__hadamard(operation[1])
+
+        elif name == 'S':
+            self.__phase(operation[1])
+
+        elif name == 'X':
+            self.__r ^= self.__z[:, operation[1]]
+
+        elif name == 'Z':
+            self.__r ^= self.__x[:, operation[1]]
+
+        elif name == 'Y':
+            self.__r ^= self.__x[:, operation[1]] ^ self.__z[:, operation[1]]
+
+        elif name == 'CX':
+            self.__cnot(operation[1], operation[2])
+
+        elif name == 'CZ':
+            self.__hadamard(operation[2])
+            self.__cnot(operation[1], operation[2])
+            self.__hadamard(operation[2])
+
+        else:
+            a, b = operation[1], operation[2]
+            self.__x[:, [a, b]] = self.__x[:, [b, a]]
+            self.__z[:, [a, b]] = self.__z[:, [b, a]]
+
+    def apply_operations(self, operations):
+        """Method to apply a list of (position, gate) operations in order (see the engine
+        module). It's used when a circuit is run on the stabilizer register. If a gate is not a
+        supported Clifford gate, ValueError is raised before anything is applied.
+
+        Arguments:
+            operations {list} -- List of (position, gate) pairs
+
+        Raises:
+            ValueError
+        """
+
+        decompositions = [clifford_decomposition(gate, position) for position, gate in operations]
+        for (position, gate), decomposition in zip(operations, decompositions):
+
+            if decomposition is None:
+                raise ValueError('Invalid input! ' + gate.get_name() + ' is not a Clifford ' +\
+                    'gate, the circuit can\'t be run on a stabilizer register.')
+
+        for decomposition in decompositions:
+            for operation in decomposition:
+
+                self.__apply(operation)
+
+    def __rowsum(self, h, i):
+        """Multiplies the rows h (an index or an array of indices) by the row i, keeping track
+        of the phases.
+        """
+
+        x1, z1 = self.__x[i].astype(int), self.__z[i].astype(int)
+        x2, z2 = self.__x[h].astype(int), self.__z[h].astype(int)
+        g = numpy.where(x1 & z1, z2 - x2, 0) + numpy.where(x1 & (1 - z1), z2 * (2 * x2 - 1), 0) \
+            + numpy.where((1 - x1) & z1, x2 * (1 - 2 * z2), 0)
+        total = 2 * self.__r[h].astype(int) + 2 * int(self.__r[i]) + numpy.sum(g, axis=-1)
+        self.__r[h] = numpy.mod(total, 4) == 2
+        self.__x[h] ^= self.__x[i]
+        self.__z[h] ^= self.__z[i]
+
+    def __measure(self, a):
+        """Measures the a-th qubit and returns the result (0 or 1)."""
+
+        n = self.__qubit_number
+        stabilizers = numpy.nonzero(self.__x[n:2 * n, a])[0]
+        if len(stabilizers) > 0:
+            p = n + stabilizers[0]
+            rows = numpy.nonzero(self.__x[:2 * n, a])[0]
+            rows = rows[rows != p]
+            if len(rows) > 0:
+                self.__rowsum(rows, p)
+
+            self.__x[p - n], self.__z[p - n], self.__r[p - n] = \
+                self.__x[p], self.__z[p], self.__r[p]
+            self.__x[p] = False
+            self.__z[p] = False
+            self.__z[p, a] = True
+            self.__r[p] = numpy.random.randint(2)
+            return int(self.__r[p])
+
+        self.__x[2 * n] = False
+        self.__z[2 * n] = False
+        self.__r[2 * n] = False
+        for i in numpy.nonzero(self.__x[:n, a])[0]:
+
+            self.__rowsum(2 * n, i + n)
+
+        return int(self.__r[2 * n])
+
+    @check_stabilizer.nth_check
+    def measure_nth_qubit(self, nth):
+        """Method to perform a measurement on the n-th qubit and return the result (0 or 1). The
+        state collapses according to the result.
+
+        Arguments:
+            nth {int} -- Number of n-th qubit
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> s = qvantum.StabilizerRegister(2)
+            >>> s.measure_nth_qubit(1)
+            0
+        """
+
+        return self.__measure(nth)
+
+    def measure_register(self):
+        """Method to perform a measurement on the whole register and return the measured state.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> s = qvantum.StabilizerRegister(3)
+            >>> s.measure_register()
+            '000'
+        """
+
+        return ''.join(str(self.__measure(nth)) for nth in range(self.__qubit_number))
+
+    def __copy(self):
+        """Returns a copy of the stabilizer register."""
+
+        result = StabilizerRegister.__new__(StabilizerRegister)
+        result.__qubit_number = self.__qubit_number
+        result.__x = self.__x.copy()
+        result.__z = self.__z.copy()
+        result.__r = self.__r.copy()
+        return result
+
+    @check_stabilizer.sample_check
+    def sample(self, shots=1):
+        """Method to sample the measurement of the whole register the given times and return
+        the measured states as a list of strings. The register is not changed.
+
+        Keyword Arguments:
+            shots {int} -- Number of samples (default: {1})
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> s = qvantum.StabilizerRegister(2)
+            >>> c = qvantum.Circuit([qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()]), \\
+            ...     qvantum.Layer([qvantum.CNOT(0, 1)])])
+            >>> c.run(s)
+            >>> s.sample(4)
+            ['11', '00', '00', '11']
+        """
+
+        return [self.__copy().measure_register() for shot in range(shots)]
+
+    def __pauli_expectation(self, pauli_string):
+        """Returns the expectation value (-1, 0 or 1) of a Pauli string."""
+
+        n = self.__qubit_number
+        x = numpy.array([char in 'XY' for char in pauli_string])
+        z = numpy.array([char in 'YZ' for char in pauli_string])
+        anticommute = (numpy.sum(self.__x[:2 * n] & z, axis=-1) + \
+            numpy.sum(self.__z[:2 * n] & x, axis=-1)) % 2 == 1
+        if numpy.any(anticommute[n:]):
+            return 0
+
+        self.__x[2 * n] = False
+        self.__z[2 * n] = False
+        self.__r[2 * n] = False
+        for i in numpy.nonzero(anticommute[:n])[0]:
+
+            self.__rowsum(2 * n, i + n)
+
+        return -1 if self.__r[2 * n] else 1
+
+    @check_stabilizer.expectation_check
+    def expectation(self, observable):
+        """Method to return the expectation value of an observable which is a Pauli string or a
+        weighted sum of Pauli strings. The expectation value of a Pauli string in a stabilizer
+        state is -1, 0 or 1, it's read from the tableau in O(n^2) time. The register is not
+        changed.
+
+        Arguments:
+            observable {str, dict} -- Pauli string or dictionary of Pauli strings and weights
+
+        Raises:
+            ValueError, TypeError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> s = qvantum.StabilizerRegister(2)
+            >>> s.expectation({'ZZ': 0.5, 'XI': 2})
+            0.5
+        """
+
+        if isinstance(observable, str):
+            observable = {observable: 1}
+
+        return float(sum(weight * self.__pauli_expectation(pauli_string) \
+            for pauli_string, weight in observable.items()))
+
+    @check_stabilizer.to_vector_check
+    def to_vector(self):
+        """Method to return the state vector of the register (2^n amplitudes, the 0th qubit is
+        the most significant bit). It's the projection of a basis state which has non-zero
+        overlap with the state onto the common +1 eigenspace of the stabilizers, so it's only
+        defined up to a global phase.
+
+        Raises:
+            ValueError
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> s = qvantum.StabilizerRegister(2)
+            >>> c = qvantum.Circuit([qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()]), \\
+            ...     qvantum.Layer([qvantum.CNOT(0, 1)])])
+            >>> c.run(s)
+            >>> s.to_vector()
+            array([0.70710678+0.j, 0.        +0.j, 0.        +0.j, 0.70710678+0.j])
+        """
+
+        n = self.__qubit_number
+        index = int(self.__copy().measure_register(), 2)
+        vector = numpy.zeros(2 ** n, dtype=complex)
+        vector[index] = 1
+        for stabilizer in self.get_stabilizers():
+
+            sign = -1 if stabilizer[0] == '-' else 1
+            vector = (vector + sign * pauli.apply_pauli(vector, stabilizer[1:])) / 2
+
+        return vector / numpy.linalg.norm(vector)